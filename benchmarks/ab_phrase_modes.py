@@ -0,0 +1,101 @@
+"""
+A/B harness comparing the three-call phrase pipeline with the single-call
+structured-output mode of OdiaPhraseService.
+
+For each mode it generates several batches and reports latency, token usage
+(from completion.usage) and the yield of valid {english, odia, romanized_odia}
+entries per requested batch. Run from the repository root so the config files
+resolve; point OPENAI_BASE_URL at a stand-in server to run it offline.
+
+Usage: python benchmarks/ab_phrase_modes.py [--runs N]
+"""
+import os
+import sys
+import copy
+import time
+import argparse
+import statistics
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from openai import OpenAI
+from config.settings import Settings
+from services.odia_phrase_service import OdiaPhraseService
+
+
+class UsageRecordingClient:
+    """Wraps an OpenAI client and totals token usage across chat completions"""
+    def __init__(self, client):
+        self._client = client
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        completion = self._client.chat.completions.create(**kwargs)
+        usage = getattr(completion, 'usage', None)
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += getattr(usage, 'prompt_tokens', 0) or 0
+            self.completion_tokens += getattr(usage, 'completion_tokens', 0) or 0
+        return completion
+
+    def snapshot(self):
+        with self._lock:
+            return self.calls, self.prompt_tokens, self.completion_tokens
+
+
+def run_mode(mode, settings, client, runs):
+    config = copy.deepcopy(settings.config)
+    config.setdefault('phrases', {})['mode'] = mode
+    recorder = UsageRecordingClient(client)
+    service = OdiaPhraseService(recorder, config, settings.model_configs)
+
+    latencies, yields, failures = [], [], 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        try:
+            entries = service.process_phrases()
+            yields.append(len(entries) / service.batch_size)
+        except Exception as e:
+            failures += 1
+            yields.append(0.0)
+            print(f"  {mode} run failed: {e}")
+        latencies.append(time.perf_counter() - start)
+
+    calls, prompt_tokens, completion_tokens = recorder.snapshot()
+    return {
+        'mode': mode,
+        'p50_latency': statistics.median(latencies),
+        'mean_latency': statistics.mean(latencies),
+        'calls_per_batch': calls / runs,
+        'prompt_tokens_per_batch': prompt_tokens / runs,
+        'completion_tokens_per_batch': completion_tokens / runs,
+        'valid_yield': statistics.mean(yields),
+        'failures': failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5, help="batches to generate per mode")
+    args = parser.parse_args()
+
+    settings = Settings()
+    client = OpenAI()
+
+    results = [run_mode(mode, settings, client, args.runs) for mode in ('pipeline', 'structured')]
+
+    print(f"\n{'mode':<12}{'p50 s':>8}{'mean s':>8}{'calls':>7}{'prompt tok':>12}{'compl tok':>11}{'yield':>8}{'fails':>7}")
+    for r in results:
+        print(f"{r['mode']:<12}{r['p50_latency']:>8.2f}{r['mean_latency']:>8.2f}{r['calls_per_batch']:>7.1f}"
+              f"{r['prompt_tokens_per_batch']:>12.0f}{r['completion_tokens_per_batch']:>11.0f}"
+              f"{r['valid_yield']:>8.0%}{r['failures']:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark the shared salvage-capable JSON array parser against the per-service
+repair code it replaced, over a corpus of captured malformed model responses.
+
+Usage: python benchmarks/bench_json_parser.py [--iterations N]
+"""
+import os
+import sys
+import json
+import re
+import time
+import argparse
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from services.json_stream import parse_json_array, JsonArrayStreamParser
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'malformed_responses.jsonl')
+
+
+def legacy_sanitize(text):
+    text = text.encode('ascii', 'ignore').decode()
+    text = re.sub(r'(?<!\\)"(?!,|\]|$)', '', text)
+    return text.replace('?', '').replace('!', '').replace('.', '').strip()
+
+
+def legacy_words(response):
+    """Repair path from the old WordGenerationService.generate_words"""
+    response_text = response.strip()
+    if not (response_text.startswith('[') and response_text.endswith(']')):
+        raise ValueError("Response is not a valid JSON array")
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        items = response_text[1:-1].split('","')
+        cleaned_items = [f'"{legacy_sanitize(item)}"' for item in items if legacy_sanitize(item)]
+        return json.loads('[' + ','.join(cleaned_items) + ']')
+
+
+def legacy_phrases(response):
+    """Repair path from the old PhraseGenerationService.generate_phrases"""
+    response = response.strip()
+    try:
+        return json.loads(response)
+    except json.JSONDecodeError:
+        fixed_response = response.replace('\n', '').replace('\\', '')
+        if not fixed_response.startswith('['):
+            fixed_response = '[' + fixed_response
+        if not fixed_response.endswith(']'):
+            fixed_response = fixed_response + ']'
+        return json.loads(fixed_response)
+
+
+def legacy_translations(response):
+    """Repair path from the old PhraseTranslationService.translate_phrases"""
+    response = response.strip()
+    try:
+        return json.loads(response)
+    except json.JSONDecodeError:
+        fixed_response = response.replace('\n', '').replace('\\', '')
+        if not fixed_response.endswith(']'):
+            last_complete = fixed_response.rfind('}')
+            if last_complete != -1:
+                fixed_response = fixed_response[:last_complete+1] + ']'
+        return json.loads(fixed_response)
+
+
+def legacy_plain(response):
+    """The services without any repair code just called json.loads"""
+    return json.loads(response.strip())
+
+
+LEGACY = {
+    'words': legacy_words,
+    'phrases': legacy_phrases,
+    'translations': legacy_translations,
+    'romanized': legacy_plain,
+}
+
+
+def count_items(parse, response):
+    try:
+        items = parse(response)
+        return len(items) if isinstance(items, list) else 0
+    except Exception:
+        return 0
+
+
+def time_per_call(func, responses, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for response in responses:
+            try:
+                func(response)
+            except Exception:
+                pass
+    return (time.perf_counter() - start) / (iterations * len(responses)) * 1e6
+
+
+def streaming_parse(response, chunk_size=8):
+    parser = JsonArrayStreamParser()
+    items = []
+    for i in range(0, len(response), chunk_size):
+        items.extend(parser.feed(response[i:i + chunk_size]))
+    items.extend(parser.close())
+    return items
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--iterations', type=int, default=200)
+    args = arg_parser.parse_args()
+
+    with open(CORPUS, 'r', encoding='utf-8') as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+
+    print(f"{'kind':<13}{'case':<26}{'expected':>9}{'legacy':>8}{'shared':>8}{'stream':>8}")
+    totals = {'expected': 0, 'legacy': 0, 'shared': 0, 'stream': 0}
+    failed = {'legacy': 0, 'shared': 0}
+    for entry in corpus:
+        response = entry['response']
+        legacy = count_items(LEGACY[entry['kind']], response)
+        shared = len(parse_json_array(response).items)
+        stream = len(streaming_parse(response))
+        print(f"{entry['kind']:<13}{entry['case']:<26}{entry['expected_items']:>9}{legacy:>8}{shared:>8}{stream:>8}")
+
+        totals['expected'] += entry['expected_items']
+        totals['legacy'] += legacy
+        totals['shared'] += shared
+        totals['stream'] += stream
+        failed['legacy'] += legacy == 0
+        failed['shared'] += shared == 0
+
+    print()
+    print(f"Items recovered: legacy {totals['legacy']}/{totals['expected']}, "
+          f"shared {totals['shared']}/{totals['expected']}, streaming {totals['stream']}/{totals['expected']}")
+    print(f"Responses with nothing usable: legacy {failed['legacy']}/{len(corpus)}, shared {failed['shared']}/{len(corpus)}")
+
+    responses = [entry['response'] for entry in corpus]
+    legacy_us = time_per_call(lambda r: count_items(legacy_translations, r), responses, args.iterations)
+    shared_us = time_per_call(parse_json_array, responses, args.iterations)
+    stream_us = time_per_call(streaming_parse, responses, args.iterations)
+    print(f"Mean parse time per response: legacy {legacy_us:.1f} us, shared {shared_us:.1f} us, streaming {stream_us:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Throughput of the bulk vocabulary import (POST /import) against the local stand-ins.
+
+The app runs as in e2e_bench.py, with the fake chat-completions server behind it. Each
+size gets a fresh session and a list of unique English words; the job is polled until
+it finishes, and items per second, chunk requests and failures are reported.
+
+Usage: python benchmarks/bulk_import_bench.py [--sizes 1000,10000] [--llm-latency 0.3]
+       [--malformed-rate 0.0]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import urllib.request
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from e2e_bench import ROOT, prepare_workdir, start_server, wait_until_ready
+from providers.fake_llm import FakeChatCompletionsServer, ENGLISH_WORDS
+
+
+def vocabulary(size, run):
+    """Unique words, so neither the translation memory nor session dedup short-circuits them"""
+    return [f"{ENGLISH_WORDS[n % len(ENGLISH_WORDS)]}{run}x{n}" for n in range(size)]
+
+
+def start_import(base_url, items, session_id):
+    req = urllib.request.Request(
+        f"{base_url}/import",
+        data="\n".join(items).encode('utf-8'),
+        headers={'Content-Type': 'text/plain', 'X-Session-Id': session_id},
+        method='POST'
+    )
+    with urllib.request.urlopen(req, timeout=60) as response:
+        return json.load(response)['status_url']
+
+
+def wait_for_job(base_url, status_url, session_id, poll_seconds, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        req = urllib.request.Request(f"{base_url}{status_url}", headers={'X-Session-Id': session_id})
+        with urllib.request.urlopen(req, timeout=10) as response:
+            job = json.load(response)['job']
+        if job['status'] in ('completed', 'failed'):
+            return job
+        time.sleep(poll_seconds)
+    raise RuntimeError(f"Import did not finish within {timeout}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--server', choices=('threaded', 'asgi'), default='threaded')
+    parser.add_argument('--sizes', default='1000,10000', help="comma-separated item counts")
+    parser.add_argument('--llm-latency', type=float, default=0.3, help="stand-in model latency, seconds")
+    parser.add_argument('--llm-jitter', type=float, default=0.1)
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help="share of corrupted model responses")
+    parser.add_argument('--poll', type=float, default=0.25, help="progress polling interval, seconds")
+    parser.add_argument('--port', type=int, default=5056)
+    parser.add_argument('--timeout', type=float, default=900.0)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--keep-workdir', action='store_true', help="keep the scratch directory for inspection")
+    args = parser.parse_args()
+    # Only the import path is measured; these keep prepare_workdir's other settings quiet
+    args.tts_latency, args.prefetch, args.phrases_mode = 0.0, False, 'pipeline'
+
+    llm = FakeChatCompletionsServer(latency_seconds=args.llm_latency, jitter_seconds=args.llm_jitter,
+                                    malformed_rate=args.malformed_rate, seed=args.seed)
+    llm_base_url = llm.start()
+
+    workdir = prepare_workdir(args, llm_base_url)
+    os.chdir(workdir)
+    start_server(args.server, args.port)
+    base_url = f"http://127.0.0.1:{args.port}"
+    wait_until_ready(base_url)
+
+    print(f"\nserver={args.server} llm_latency={args.llm_latency}s malformed_rate={args.malformed_rate} "
+          f"workdir={workdir}")
+    print(f"{'items':>8}{'seconds':>10}{'items/s':>10}{'requests':>10}{'translated':>12}{'failed':>8}")
+    for run, size in enumerate(int(size) for size in args.sizes.split(',')):
+        session_id = f"benchimport{run:04d}"
+        requests_before = llm.requests
+        start = time.perf_counter()
+        status_url = start_import(base_url, vocabulary(size, run), session_id)
+        job = wait_for_job(base_url, status_url, session_id, args.poll, args.timeout)
+        elapsed = time.perf_counter() - start
+        print(f"{size:>8}{elapsed:>10.2f}{size / elapsed:>10.1f}{llm.requests - requests_before:>10}"
+              f"{job['translated']:>12}{job['failed']:>8}")
+
+    llm.stop()
+    if not args.keep_workdir:
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
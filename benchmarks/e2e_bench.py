@@ -0,0 +1,175 @@
+"""
+End-to-end benchmark of the app's own overhead, with every external service replaced
+by a local stand-in (see src/providers/): a fake chat-completions server with
+configurable latency and malformed-output rate, a fake TTS that emits WAV bytes, and a
+filesystem blob store.
+
+The app runs in a scratch directory with its config pointed at the stand-ins, served
+either by the threaded Flask server or by the ASGI path. /generate, /pronounce and
+/upload-session are then driven at each concurrency level, and throughput and
+p50/p95/p99 latency are reported per endpoint.
+
+Usage: python benchmarks/e2e_bench.py [--server threaded|asgi] [--concurrency 1,10,50]
+       [--requests 200] [--llm-latency 0.3] [--malformed-rate 0.05] [--tts-latency 0.2]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+import itertools
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, 'src'))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from load_test import percentile, send
+from providers.fake_llm import FakeChatCompletionsServer, ODIA_WORDS, pseudo_odia
+
+ENDPOINTS = ('generate', 'pronounce', 'upload-session')
+
+
+def prepare_workdir(args, llm_base_url):
+    """Copy the config into a scratch directory and point it at the stand-ins"""
+    workdir = tempfile.mkdtemp(prefix='odia-bench-')
+    config_dir = os.path.join(workdir, 'src', 'config')
+    os.makedirs(config_dir)
+    shutil.copy(os.path.join(ROOT, 'src', 'config', 'model_configs.json'), config_dir)
+
+    with open(os.path.join(ROOT, 'src', 'config', 'config.json'), 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config['providers'] = {
+        'llm': {'base_url': llm_base_url},
+        'tts': {'type': 'fake', 'fake_latency_seconds': args.tts_latency},
+        'storage': {'type': 'filesystem', 'filesystem_root': 'data/blobs'}
+    }
+    # Prefetching would hide generation latency behind the pool; measure the request path
+    config['prefetch']['enabled'] = args.prefetch
+    config['phrases']['mode'] = args.phrases_mode
+    with open(os.path.join(config_dir, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump(config, f, ensure_ascii=False, indent=4)
+    return workdir
+
+
+def start_server(server_type, port):
+    if server_type == 'asgi':
+        import uvicorn
+        import asgi
+        server = uvicorn.Server(uvicorn.Config(asgi.app, host='127.0.0.1', port=port, log_level='warning'))
+        threading.Thread(target=server.run, daemon=True).start()
+    else:
+        from werkzeug.serving import make_server
+        import app
+        server = make_server('127.0.0.1', port, app.app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+def wait_until_ready(base_url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/ready", timeout=2) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("App did not become ready")
+
+
+def request_factory(endpoint, args):
+    """Returns a function giving (body, session id) for the n-th request to an endpoint"""
+    if endpoint == 'generate':
+        # A new session per request, so the stand-in's vocabulary is never exhausted by dedup
+        return lambda n: ({'type': args.gen_type}, f"bench{n:010d}")
+
+    if endpoint == 'pronounce':
+        # A fixed set of texts, so the run mixes synthesis misses with cache hits
+        texts = [" ".join(words) for words in itertools.islice(itertools.permutations(ODIA_WORDS, 2), args.distinct_texts)]
+        return lambda n: ({'text': texts[n % len(texts)]}, "benchpronounce")
+
+    words = ["water", "book", "house", "river", "friend", "market", "rain", "school", "temple", "song"]
+    translations = [{'english': word, 'odia': pseudo_odia(word), 'romanized_odia': word} for word in words]
+    return lambda n: ({'translations': translations}, f"benchupload{n % 50:04d}")
+
+
+def run_level(base_url, endpoint, make_request, concurrency, total, timeout, offset):
+    url = f"{base_url}/{endpoint}"
+
+    def one(n):
+        body, session_id = make_request(offset + n)
+        return send(url, body, session_id, timeout)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        results = list(executor.map(one, range(total)))
+        elapsed = time.perf_counter() - start
+
+    latencies = [latency for ok, latency in results if ok]
+    return {
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'errors': len(results) - len(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--server', choices=('threaded', 'asgi'), default='threaded')
+    parser.add_argument('--endpoints', default=','.join(ENDPOINTS))
+    parser.add_argument('--concurrency', default='1,10,50', help="comma-separated client counts")
+    parser.add_argument('--requests', type=int, default=200, help="requests per endpoint and level")
+    parser.add_argument('--llm-latency', type=float, default=0.3, help="stand-in model latency, seconds")
+    parser.add_argument('--llm-jitter', type=float, default=0.1)
+    parser.add_argument('--malformed-rate', type=float, default=0.05, help="share of corrupted model responses")
+    parser.add_argument('--tts-latency', type=float, default=0.2, help="stand-in synthesis latency, seconds")
+    parser.add_argument('--gen-type', default='words', choices=('words', 'phrases'))
+    parser.add_argument('--phrases-mode', default='pipeline', choices=('pipeline', 'structured'))
+    parser.add_argument('--distinct-texts', type=int, default=50, help="distinct texts sent to /pronounce")
+    parser.add_argument('--prefetch', action='store_true', help="leave the prefetch pool on")
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--timeout', type=float, default=120.0)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--keep-workdir', action='store_true', help="keep the scratch directory for inspection")
+    args = parser.parse_args()
+
+    llm = FakeChatCompletionsServer(latency_seconds=args.llm_latency, jitter_seconds=args.llm_jitter,
+                                    malformed_rate=args.malformed_rate, seed=args.seed)
+    llm_base_url = llm.start()
+
+    workdir = prepare_workdir(args, llm_base_url)
+    os.chdir(workdir)
+    start_server(args.server, args.port)
+    base_url = f"http://127.0.0.1:{args.port}"
+    wait_until_ready(base_url)
+
+    levels = [int(level) for level in args.concurrency.split(',')]
+    print(f"\nserver={args.server} llm_latency={args.llm_latency}s malformed_rate={args.malformed_rate} "
+          f"tts_latency={args.tts_latency}s workdir={workdir}")
+    print(f"{'endpoint':<16}{'clients':>8}{'req/s':>9}{'p50 s':>8}{'p95 s':>8}{'p99 s':>8}{'errors':>8}")
+    offset = 0
+    for endpoint in args.endpoints.split(','):
+        make_request = request_factory(endpoint, args)
+        for level in levels:
+            total = max(args.requests, level)
+            r = run_level(base_url, endpoint, make_request, level, total, args.timeout, offset)
+            offset += total
+            print(f"{endpoint:<16}{level:>8}{r['throughput']:>9.1f}{r['p50']:>8.3f}"
+                  f"{r['p95']:>8.3f}{r['p99']:>8.3f}{r['errors']:>8}")
+
+    print(f"\nStand-in model requests: {llm.requests}")
+    llm.stop()
+    if not args.keep_workdir:
+        os.chdir(ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
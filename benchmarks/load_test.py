@@ -0,0 +1,102 @@
+"""
+Load test comparing the threaded Flask server with the ASGI serving path.
+
+Start both servers (on different ports) against the same backends, e.g.
+    PORT=5001 python src/app.py
+    PORT=5002 python src/asgi.py
+then drive them with the same request mix at increasing concurrency:
+    python benchmarks/load_test.py --target threaded=http://127.0.0.1:5001 \
+                                   --target asgi=http://127.0.0.1:5002
+Each concurrency level runs for a fixed number of requests and reports throughput,
+latency percentiles and errors. Point OPENAI_BASE_URL at a stand-in server to run
+it without spending tokens; the difference shows once upstream calls are slow.
+
+Usage: python benchmarks/load_test.py --target NAME=URL [--target NAME=URL ...]
+       [--path /generate] [--type words] [--concurrency 10,50,200] [--requests 400]
+"""
+import json
+import time
+import argparse
+import statistics
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def send(url, body, session_id, timeout):
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(body).encode('utf-8'),
+        headers={'Content-Type': 'application/json', 'X-Session-Id': session_id}
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            ok = response.status == 200
+    except (urllib.error.URLError, OSError):
+        ok = False
+    return ok, time.perf_counter() - start
+
+
+def run_level(base_url, path, body, concurrency, total, timeout):
+    url = base_url.rstrip('/') + path
+    # One learner session per simulated client, as in real use
+    sessions = [f"loadtest{i:06d}" for i in range(concurrency)]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        results = list(executor.map(
+            lambda i: send(url, body, sessions[i % concurrency], timeout), range(total)))
+        elapsed = time.perf_counter() - start
+
+    latencies = [latency for ok, latency in results if ok]
+    return {
+        'concurrency': concurrency,
+        'throughput': len(latencies) / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'mean': statistics.mean(latencies) if latencies else 0.0,
+        'errors': len(results) - len(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target', action='append', required=True, help="NAME=BASE_URL, repeatable")
+    parser.add_argument('--path', default='/generate')
+    parser.add_argument('--type', default='words', help="generation type sent to /generate")
+    parser.add_argument('--text', default='ନମସ୍କାର', help="text sent to /pronounce")
+    parser.add_argument('--concurrency', default='10,50,200', help="comma-separated client counts")
+    parser.add_argument('--requests', type=int, default=400, help="requests per concurrency level")
+    parser.add_argument('--timeout', type=float, default=120.0)
+    args = parser.parse_args()
+
+    targets = [target.split('=', 1) for target in args.target]
+    levels = [int(level) for level in args.concurrency.split(',')]
+    if args.path == '/pronounce-batch':
+        body = {'texts': [args.text]}
+    elif args.path == '/pronounce':
+        body = {'text': args.text}
+    else:
+        body = {'type': args.type}
+
+    print(f"{'target':<12}{'clients':>8}{'req/s':>9}{'p50 s':>8}{'p95 s':>8}{'p99 s':>8}{'errors':>8}")
+    for level in levels:
+        for name, base_url in targets:
+            r = run_level(base_url, args.path, body, level, max(args.requests, level), args.timeout)
+            print(f"{name:<12}{r['concurrency']:>8}{r['throughput']:>9.1f}{r['p50']:>8.2f}"
+                  f"{r['p95']:>8.2f}{r['p99']:>8.2f}{r['errors']:>8}")
+
+
+if __name__ == '__main__':
+    main()
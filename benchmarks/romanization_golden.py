@@ -0,0 +1,103 @@
+"""
+Check the local Odia romanization engine against a golden set of
+(odia, romanized) pairs and time it on a whole batch.
+
+The golden set lives in benchmarks/data/romanization_golden.jsonl. It is seeded
+from the examples in the prompts; --harvest adds the pairs found in saved
+session files (saved_*.json / session.json), which hold the model's own
+romanizations.
+
+Model romanizations are not fully consistent (long vowels, "chh" vs "ch"), so
+besides exact matches a loose match is reported that folds those differences.
+
+Usage: python benchmarks/romanization_golden.py [--harvest data/words] [--min-loose 0.9]
+"""
+import os
+import sys
+import re
+import glob
+import json
+import time
+import argparse
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from services.romanization import OdiaTransliterator
+
+GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'romanization_golden.jsonl')
+
+
+def loose(text):
+    """Fold spelling differences that do not change the reading"""
+    text = re.sub(r"[^a-z ]", "", text.lower())
+    text = text.replace("chh", "ch")
+    text = re.sub(r"([aeiou])\1+", r"\1", text)
+    return " ".join(text.split())
+
+
+def load_golden():
+    if not os.path.exists(GOLDEN):
+        return []
+    with open(GOLDEN, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def harvest(directory):
+    """Append (odia, romanized) pairs from saved sessions to the golden set"""
+    golden = load_golden()
+    known = {entry['odia'] for entry in golden}
+    added = 0
+    paths = glob.glob(os.path.join(directory, 'saved_*.json')) + glob.glob(os.path.join(directory, 'session.json'))
+    with open(GOLDEN, 'a', encoding='utf-8') as f:
+        for path in sorted(paths):
+            with open(path, 'r', encoding='utf-8') as session:
+                translations = json.load(session).get('translations', [])
+            for t in translations:
+                odia, romanized = t.get('odia'), t.get('romanized_odia')
+                if odia and romanized and odia not in known:
+                    known.add(odia)
+                    f.write(json.dumps({"odia": odia, "romanized": romanized, "source": os.path.basename(path)},
+                                       ensure_ascii=False) + '\n')
+                    added += 1
+    print(f"Added {added} pairs from {len(paths)} session files")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--harvest', metavar='DIR', help="add pairs from saved sessions in DIR first")
+    parser.add_argument('--min-loose', type=float, default=0.0, help="exit non-zero below this loose accuracy")
+    parser.add_argument('--show', type=int, default=10, help="mismatches to print")
+    args = parser.parse_args()
+
+    if args.harvest:
+        harvest(args.harvest)
+
+    golden = load_golden()
+    if not golden:
+        print("Golden set is empty")
+        return
+
+    transliterator = OdiaTransliterator()
+    odia = [entry['odia'] for entry in golden]
+
+    start = time.perf_counter()
+    output = transliterator.romanize_batch(odia)
+    elapsed = time.perf_counter() - start
+
+    exact = sum(out == entry['romanized'] for out, entry in zip(output, golden))
+    loose_matches = sum(loose(out) == loose(entry['romanized']) for out, entry in zip(output, golden))
+
+    mismatches = [(entry, out) for out, entry in zip(output, golden) if loose(out) != loose(entry['romanized'])]
+    for entry, out in mismatches[:args.show]:
+        print(f"  {entry['odia']}: expected {entry['romanized']!r}, got {out!r}")
+
+    loose_accuracy = loose_matches / len(golden)
+    print(f"Exact: {exact}/{len(golden)}  Loose: {loose_matches}/{len(golden)} ({loose_accuracy:.0%})")
+    print(f"Romanized {len(golden)} phrases in {elapsed * 1e6:.0f} us")
+
+    if loose_accuracy < args.min_loose:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,31 +1,59 @@
-from flask import Flask, render_template, jsonify, request, send_file
+import time
+STARTUP_STARTED = time.perf_counter()
+
+from flask import Flask, render_template, jsonify, request, send_file, Response, stream_with_context, g
 from flask_cors import CORS
 import os
 import sys
-import tempfile
+import json
+import gzip
+import math
+import hashlib
+import shutil
 import logging
+import threading
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from openai import OpenAI
 from config.settings import Settings
 from services.word_generation import WordGenerationService
 from services.odia_phrase_service import OdiaPhraseService
 from services.translation_words import WordTranslationService
+from services.translation_memory import TranslationMemory
 from services.speech import SpeechService
-from services.blob_storage import BlobStorageService
-from services.data_storage import DataStorageService
+from services.session_manager import SessionManager
+from services.dedup import DedupIndex
+from services.audio_index import AudioIndex
+from services.pronunciation import PronunciationService
+from services.session_sync import SessionSyncWorker
+from services.prefetch import PrefetchPool
+from services.readiness import ReadinessTracker
+from services.bulk_import import BulkImportService
+from services.metrics import REGISTRY, HTTP_SECONDS, InstrumentedClient
+from providers import create_llm_clients, create_blob_storage, create_tts_provider
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+readiness = ReadinessTracker(started_at=STARTUP_STARTED)
+readiness.record('imports', time.perf_counter() - STARTUP_STARTED)
+
 def cleanup_session():
-    """Clean up session file on app startup"""
+    """Clean up session files on app startup"""
     try:
-        session_path = os.path.join('data', 'words', 'session.json')
-        if os.path.exists(session_path):
-            os.remove(session_path)
-            logger.info("Previous session file cleaned up")
+        for filename in ('session.json', 'session.jsonl'):
+            session_path = os.path.join('data', 'words', filename)
+            if os.path.exists(session_path):
+                os.remove(session_path)
+                logger.info(f"Previous session file cleaned up: {filename}")
+        sessions_dir = os.path.join('data', 'sessions')
+        if os.path.exists(sessions_dir):
+            # Sessions with an unfinished bulk import are kept so the import can resume into them
+            keep = BulkImportService.active_session_ids()
+            for session_id in os.listdir(sessions_dir):
+                if session_id not in keep:
+                    shutil.rmtree(os.path.join(sessions_dir, session_id))
+            logger.info(f"Previous learner sessions cleaned up ({len(keep)} kept for resuming imports)")
     except Exception as e:
         logger.error(f"Error cleaning up session file: {e}")
 
@@ -35,29 +63,248 @@ logger.info(f"Template directory set to: {template_dir}")
 app = Flask(__name__, template_folder=template_dir)
 CORS(app)
 
+# Under the Werkzeug reloader this module also runs in the watcher process, which never
+# serves requests; one-off startup work (resuming imports, migrations) is left to the server
+SERVING_PROCESS = __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
+
 # Initialize settings and services
+# Heavy clients (blob container, Speech SDK) connect lazily; warm_up() runs in the background below
 try:
     # Clean up previous session file
-    cleanup_session()
+    with readiness.phase('cleanup'):
+        cleanup_session()
     
     # Initialize services
-    settings = Settings()
-    client = OpenAI()
-    blob_storage = BlobStorageService(settings.config)
-    data_storage = DataStorageService(blob_storage)
-    word_service = WordGenerationService(client, settings.config, settings.model_configs)
-    odia_phrase_service = OdiaPhraseService(client, settings.config, settings.model_configs)
-    word_translation_service = WordTranslationService(client, settings.config, settings.model_configs)
-    speech_service = SpeechService(blob_storage)
+    with readiness.phase('settings'):
+        settings = Settings()
+        readiness.retry_seconds = settings.config['startup']['warmup_retry_seconds']
+    with readiness.phase('clients'):
+        # The async client is only used by the ASGI serving path (asgi.py)
+        client, async_client = create_llm_clients(settings.config)
+        blob_storage = create_blob_storage(settings.config)
+    with readiness.phase('storage'):
+        audio_index = AudioIndex(
+            blob_storage,
+            os.path.join('data', 'words', 'audio_map.json'),
+            settings.config['storage']['sas_refresh_margin_minutes'],
+            settings.config['storage']['audio_index_flush_seconds']
+        )
+        session_sync = SessionSyncWorker(
+            blob_storage,
+            settings.config['storage']['session_sync_debounce_seconds'],
+            settings.config['storage']['session_sync_retry_seconds']
+        )
+        session_manager = SessionManager(
+            blob_storage,
+            audio_index,
+            sync_worker=session_sync,
+            max_hot_sessions=settings.config['sessions']['max_hot_sessions'],
+            max_dedup_hints=settings.config['generation']['max_hint_items'],
+            snapshot_chunk_items=settings.config['sessions']['snapshot_chunk_items']
+        )
+        translation_memory = TranslationMemory(
+            settings.config['translation_memory']['db_path'],
+            settings.config['translation_memory']['lru_size']
+        )
+    with readiness.phase('services'):
+        # Each service gets its own instrumented view of the clients so model calls are attributed to it
+        word_service = WordGenerationService(
+            InstrumentedClient(client, 'word_generation'), settings.config, settings.model_configs,
+            InstrumentedClient(async_client, 'word_generation', is_async=True))
+        odia_phrase_service = OdiaPhraseService(
+            InstrumentedClient(client, 'odia_phrases'), settings.config, settings.model_configs,
+            InstrumentedClient(async_client, 'odia_phrases', is_async=True))
+        word_translation_service = WordTranslationService(
+            InstrumentedClient(client, 'word_translation'), settings.config, settings.model_configs,
+            translation_memory, InstrumentedClient(async_client, 'word_translation', is_async=True))
+        # A batch of new cards should take about one synthesis round trip, so never run
+        # fewer synthesizers than a generated batch has cards
+        speech_config = settings.config['speech']
+        batch_size = settings.config['generation']['batch_size']
+        speech_service = SpeechService(
+            blob_storage,
+            in_memory=speech_config['in_memory_synthesis'],
+            pool_config=dict(speech_config, pool_size=max(speech_config['pool_size'], batch_size)),
+            tts_provider=create_tts_provider(settings.config)
+        )
+        pronunciation_service = PronunciationService(
+            speech_service,
+            audio_index,
+            max(speech_config['batch_workers'], batch_size)
+        )
+        bulk_import_config = settings.config['bulk_import']
+        bulk_import_service = BulkImportService(
+            word_translation_service,
+            session_manager,
+            workers=bulk_import_config['workers'],
+            append_batch_size=bulk_import_config['append_batch_size'],
+            max_items=bulk_import_config['max_items'],
+            max_concurrent_jobs=bulk_import_config['max_concurrent_jobs']
+        )
+    if SERVING_PROCESS:
+        with readiness.phase('resume_imports'):
+            bulk_import_service.resume()
+        with readiness.phase('legacy_saves'):
+            session_manager.import_legacy_saves()
+        # Sweeping reads every snapshot manifest, so it runs in the background
+        threading.Thread(target=session_manager.sweep_snapshots, daemon=True, name="snapshot-sweep").start()
     logger.info("Services initialized successfully")
 except Exception as e:
     logger.error(f"Error initializing services: {e}")
     raise
 
+# The reloader's watcher process never serves, so it opens no speech or blob connections
+if settings.config['startup']['background_warmup'] and SERVING_PROCESS:
+    readiness.warm_up('blob_storage', blob_storage.warm_up)
+    readiness.warm_up('speech', speech_service.warm_up)
+
+SESSION_COOKIE = settings.config['sessions']['cookie_name']
+TRANSLATIONS_API = settings.config['translations_api']
+
+@app.before_request
+def resolve_session():
+    """Pick up the learner's session id from the header or cookie, or start a new session"""
+    session_id = request.headers.get('X-Session-Id') or request.cookies.get(SESSION_COOKIE)
+    g.new_session = not SessionManager.is_valid_session_id(session_id)
+    g.session_id = SessionManager.new_session_id() if g.new_session else session_id
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def set_session_cookie(response):
+    if getattr(g, 'new_session', False):
+        response.set_cookie(SESSION_COOKIE, g.session_id, httponly=True, samesite='Lax')
+    response.headers['X-Session-Id'] = g.session_id
+    return response
+
+@app.after_request
+def observe_request(response):
+    """Record request latency per route; streamed responses count until their headers are sent"""
+    if request.url_rule is not None and request.url_rule.rule != '/metrics':
+        HTTP_SECONDS.observe(
+            time.perf_counter() - g.request_started,
+            endpoint=request.url_rule.rule, method=request.method, status=response.status_code)
+    return response
+
+def build_batch(gen_type, storage=None):
+    """
+    Generate and translate one batch, filtering repeats against the session locally
+    Prefetched batches are seeded with the session that last popped one (none for the
+    startup fill) and filtered again against the session that pops them
+    """
+    if gen_type == 'words':
+        dedup = storage.english_index if storage is not None else DedupIndex()
+        items = word_service.generate_words(dedup=dedup)
+        return word_translation_service.translate_words(items)
+    # Generate phrases starting with Odia
+    dedup = storage.odia_index if storage is not None else DedupIndex()
+    return odia_phrase_service.process_phrases(dedup=dedup)
+
+prefetch_config = settings.config['prefetch']
+prefetch_pool = PrefetchPool(
+    build_batch,
+    depth=prefetch_config['depth'],
+    refill_concurrency=prefetch_config['refill_concurrency'],
+    max_age_seconds=prefetch_config['max_age_seconds'],
+    # Serve a prefetched batch only if enough of it is new to this session
+    min_batch_items=math.ceil(prefetch_config['min_batch_ratio'] * settings.config['generation']['batch_size']),
+    max_discards=prefetch_config['max_discards']
+) if prefetch_config['enabled'] else None
+if prefetch_pool is not None and SERVING_PROCESS:
+    prefetch_pool.fill()
+
+readiness.startup_complete()
+
+def dedup_key(gen_type):
+    """Field a session's items are deduplicated on: words by English, phrases by Odia"""
+    return 'english' if gen_type == 'words' else 'odia'
+
+def pronounce_batch_texts(texts):
+    """The texts of a /pronounce-batch request; raises ValueError unless they are a short list of non-empty strings"""
+    if not texts or not isinstance(texts, list):
+        raise ValueError("No texts provided")
+    if len(texts) > settings.config['speech']['max_batch_texts']:
+        raise ValueError(f"Too many texts: {len(texts)} (limit {settings.config['speech']['max_batch_texts']})")
+    if not all(isinstance(text, str) and text.strip() for text in texts):
+        raise ValueError("Every text must be a non-empty string")
+    return texts
+
+def pop_prefetched(gen_type, storage):
+    """Take a ready batch from the prefetch pool, or None"""
+    if prefetch_pool is None:
+        return None
+    if gen_type == 'words':
+        return prefetch_pool.pop(gen_type, storage.english_index, key='english', context=storage)
+    return prefetch_pool.pop(gen_type, storage.odia_index, key='odia', context=storage)
+
+def conditional_json(payload):
+    """
+    JSON response with a weak ETag: 304 when it matches If-None-Match,
+    gzip-compressed for large bodies when the client accepts it
+    """
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    etag = hashlib.sha1(body).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+        if len(body) >= TRANSLATIONS_API['gzip_min_bytes'] and request.accept_encodings.quality('gzip') > 0:
+            response.set_data(gzip.compress(body, compresslevel=6))
+            response.headers['Content-Encoding'] = 'gzip'
+    # Weak, so the identity and gzip forms of the same page share one tag
+    response.set_etag(etag, weak=True)
+    response.vary.add('Accept-Encoding')
+    return response
+
+def sse_event(event, data):
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
 @app.route('/health')
 def health_check():
     return jsonify({"status": "healthy"}), 200
 
+@app.route('/ready')
+def ready_check():
+    """Readiness, unlike /health, waits for the external dependencies to be reachable"""
+    status = readiness.get_status()
+    return jsonify(status), 200 if status['ready'] else 503
+
+@app.route('/stats')
+def stats():
+    return jsonify({
+        "translation_memory": translation_memory.get_stats(),
+        "prompt_tokens": {
+            "words": word_service.get_prompt_token_stats(),
+            "phrases": odia_phrase_service.get_prompt_token_stats()
+        },
+        "prefetch": prefetch_pool.get_stats() if prefetch_pool is not None else None,
+        "sessions": session_manager.get_stats(),
+        "bulk_imports": bulk_import_service.get_stats(),
+        "speech_pool": speech_service.pool.get_stats() if speech_service.pool is not None else None,
+        "coalescing": {
+            "pronounce": pronunciation_service.flight.get_stats(),
+            "word_translation": word_translation_service.flight.get_stats()
+        }
+    }), 200
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/blobs/<path:blob_name>')
+def serve_blob(blob_name):
+    """Serve stored blobs when the filesystem storage provider is in use"""
+    if not hasattr(blob_storage, 'blob_path'):
+        return jsonify({'success': False, 'error': 'Not found'}), 404
+    try:
+        path = blob_storage.blob_path(blob_name)
+    except ValueError:
+        return jsonify({'success': False, 'error': 'Not found'}), 404
+    if not os.path.exists(path):
+        return jsonify({'success': False, 'error': 'Not found'}), 404
+    return send_file(path, mimetype='audio/wav' if blob_name.endswith('.wav') else None)
+
 @app.route('/')
 def index():
     template_path = os.path.join(template_dir, 'index.html')
@@ -78,34 +325,38 @@ def index():
 @app.route('/generate', methods=['POST'])
 def generate():
     try:
-        # Get existing words from session
-        existing_words = data_storage.get_existing_words()
-        
         # Get generation type from request
         gen_type = request.json.get('type', 'words')
-        
-        # Generate new words
-        if gen_type == 'words':
-            items = word_service.generate_words(existing_words)
-            new_translations = word_translation_service.translate_words(items)
-        else:
-            # Generate phrases starting with Odia
-            new_translations = odia_phrase_service.process_phrases(existing_words)
-            
-            if len(new_translations) < 10:
+
+        with session_manager.session(g.session_id) as data_storage:
+            # Use a prefetched batch if one is ready, otherwise generate now
+            new_translations = pop_prefetched(gen_type, data_storage)
+            prefetched = new_translations is not None
+            if not prefetched:
+                new_translations = build_batch(gen_type, data_storage)
+
+            if gen_type != 'words' and len(new_translations) < 10:
                 logger.warning(f"Generated fewer translations than expected: {len(new_translations)}")
+
+            # Save session data; anything a concurrent request on this session already added is dropped
+            new_translations, storage_info = data_storage.save_new_translations(
+                new_translations, dedup_key(gen_type))
         
-        # Save session data (this will now append to existing translations)
-        storage_info = data_storage.save_session_data(new_translations)
-        
-        # Get all translations after saving
-        all_translations = data_storage.get_all_translations()
-        
-        return jsonify({
+        response = {
             'success': True,
             'translations': new_translations,  # Only send new translations to append
-            'storage_info': storage_info
-        })
+            'storage_info': storage_info,
+            'prefetched': prefetched
+        }
+
+        # Optionally resolve pronunciations for the whole batch up front
+        if request.json.get('pronounce'):
+            audio_urls, audio_errors = pronunciation_service.pronounce_batch(
+                [t['odia'] for t in new_translations])
+            response['audio_urls'] = audio_urls
+            response['audio_errors'] = audio_errors
+
+        return jsonify(response)
     
     except Exception as e:
         return jsonify({
@@ -113,10 +364,101 @@ def generate():
             'error': str(e)
         }), 500
 
+@app.route('/generate-stream', methods=['POST'])
+def generate_stream():
+    gen_type = request.json.get('type', 'words')
+    session_id = g.session_id
+
+    def events():
+        cards = []
+        storage_info = None
+        # Hold the session for the whole stream, not just the request that opened it
+        with session_manager.session(session_id) as data_storage:
+            try:
+                batch = pop_prefetched(gen_type, data_storage)
+                if batch is not None:
+                    source = batch
+                elif gen_type == 'words':
+                    # Word lists are short; the translation call is what gets streamed
+                    items = word_service.generate_words(dedup=data_storage.english_index)
+                    source = word_translation_service.translate_words_stream(items)
+                else:
+                    source = odia_phrase_service.process_phrases(dedup=data_storage.odia_index)
+
+                for card in source:
+                    if not all(card.get(key) for key in ('english', 'odia', 'romanized_odia')):
+                        continue
+                    # Save each card before sending it, so a card a concurrent request already added is skipped
+                    saved, info = data_storage.save_new_translations([card], dedup_key(gen_type))
+                    if not saved:
+                        continue
+                    storage_info = info
+                    cards.append(card)
+                    yield sse_event('card', card)
+
+                yield sse_event('done', {
+                    'count': len(cards),
+                    'storage_info': storage_info,
+                    'prefetched': batch is not None
+                })
+
+            except Exception as e:
+                logger.error(f"Error in streaming generate: {e}")
+                # Cards that reached the browser were saved as they went out
+                yield sse_event('error', {'error': str(e)})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/translations', methods=['GET'])
+def list_translations():
+    """
+    The session's translations a page at a time, oldest first
+    ?cursor= takes the next_cursor of the previous page (?offset= works the same way), so a client
+    polling with its last cursor only receives items added since; an unchanged page answers 304
+    """
+    try:
+        name = 'cursor' if 'cursor' in request.args else 'offset'
+        try:
+            offset = int(request.args.get(name, '0'))
+        except ValueError:
+            raise ValueError(f"{name} must be an integer") from None
+        if offset < 0:
+            raise ValueError(f"{name} must not be negative")
+        limit = request.args.get('limit', TRANSLATIONS_API['page_size'], type=int)
+        limit = min(max(limit, 1), TRANSLATIONS_API['max_page_size'])
+
+        with session_manager.session(g.session_id) as data_storage:
+            translations, total = data_storage.get_translations_page(offset, limit)
+
+        next_cursor = offset + len(translations)
+        return conditional_json({
+            'success': True,
+            'translations': translations,
+            'offset': offset,
+            'total': total,
+            'next_cursor': next_cursor,
+            'has_more': next_cursor < total
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/save-session', methods=['POST'])
 def save_session():
     try:
-        storage_info = data_storage.save_permanent_copy()
+        with session_manager.session(g.session_id) as data_storage:
+            storage_info = data_storage.save_permanent_copy()
         return jsonify({
             'success': True,
             'storage_info': storage_info
@@ -134,11 +476,43 @@ def save_session():
 
 @app.route('/sessions', methods=['GET'])
 def list_sessions():
+    """Saved snapshots, newest first; pass next_cursor back as ?cursor= for the next page"""
     try:
-        sessions = data_storage.list_saved_files()
+        page_size = settings.config['sessions']['page_size']
+        limit = min(max(request.args.get('limit', page_size, type=int), 1), settings.config['sessions']['max_page_size'])
+        cursor = request.args.get('cursor')
+        with session_manager.session(g.session_id) as data_storage:
+            sessions, next_cursor = data_storage.list_saved_files(limit, cursor)
         return jsonify({
             'success': True,
-            'sessions': sessions
+            'sessions': sessions,
+            'next_cursor': next_cursor
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/sessions/<snapshot_id>', methods=['GET'])
+def get_saved_session(snapshot_id):
+    """Materialize one saved snapshot with all of its translations"""
+    try:
+        with session_manager.session(g.session_id) as data_storage:
+            snapshot = data_storage.get_saved_session(snapshot_id)
+        if snapshot is None:
+            return jsonify({
+                'success': False,
+                'error': 'Saved session not found'
+            }), 404
+        return jsonify({
+            'success': True,
+            'session': snapshot
         })
     except Exception as e:
         return jsonify({
@@ -153,25 +527,13 @@ def pronounce():
         if not text:
             raise ValueError("No text provided")
         
-        # Check if we have a cached audio URL
-        cached_url = data_storage.get_audio_url(text)
-        if cached_url:
-            return jsonify({
-                'success': True,
-                'audio_url': cached_url,
-                'cached': True
-            })
-            
-        # Generate new audio if not cached
-        audio_url = speech_service.speak_odia(text)
-        
-        # Save the URL for future use
-        data_storage.save_audio_url(text, audio_url)
+        # Use the cached audio URL or generate new audio
+        audio_url, cached = pronunciation_service.pronounce(text)
         
         return jsonify({
             'success': True,
             'audio_url': audio_url,
-            'cached': False
+            'cached': cached
         })
     except Exception as e:
         return jsonify({
@@ -179,6 +541,29 @@ def pronounce():
             'error': str(e)
         }), 500
 
+@app.route('/pronounce-batch', methods=['POST'])
+def pronounce_batch():
+    try:
+        texts = pronounce_batch_texts(request.json.get('texts'))
+
+        audio_urls, errors = pronunciation_service.pronounce_batch(texts)
+
+        return jsonify({
+            'success': True,
+            'audio_urls': audio_urls,
+            'errors': errors
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/upload-session', methods=['POST'])
 def upload_session():
     try:
@@ -194,7 +579,8 @@ def upload_session():
             raise ValueError("No translations found in session file")
             
         # Save the uploaded session
-        storage_info = data_storage.save_session_data(translations)
+        with session_manager.session(g.session_id) as data_storage:
+            storage_info = data_storage.save_session_data(translations)
         
         return jsonify({
             'success': True,
@@ -208,6 +594,60 @@ def upload_session():
             'error': str(e)
         }), 500
 
+@app.route('/import', methods=['POST'])
+def bulk_import():
+    """
+    Start a background import of raw English words or phrases into the session
+    Accepts a plain-text or CSV body, a multipart "file" upload, or JSON {"items": [...]}
+    """
+    try:
+        if request.is_json:
+            items = request.json.get('items')
+            if not isinstance(items, list):
+                raise ValueError("Expected a list of items")
+            items = BulkImportService.parse_items("\n".join(str(item) for item in items))
+        else:
+            upload = request.files.get('file')
+            if upload is not None:
+                text = upload.read().decode('utf-8')
+                is_csv = upload.filename.lower().endswith('.csv') or upload.mimetype == 'text/csv'
+            else:
+                text = request.get_data(as_text=True)
+                is_csv = request.mimetype == 'text/csv'
+            items = BulkImportService.parse_items(text, is_csv=is_csv)
+
+        progress = bulk_import_service.create_job(g.session_id, items)
+        return jsonify({
+            'success': True,
+            'job': progress,
+            'status_url': f"/import/{progress['job_id']}"
+        }), 202
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except Exception as e:
+        logger.error(f"Error starting bulk import: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/import/<job_id>', methods=['GET'])
+def bulk_import_status(job_id):
+    progress = bulk_import_service.get_progress(job_id)
+    # Jobs are only visible to the session they import into
+    if progress is None or progress['session_id'] != g.session_id:
+        return jsonify({
+            'success': False,
+            'error': "Import job not found"
+        }), 404
+    return jsonify({
+        'success': True,
+        'job': progress
+    })
+
 if __name__ == '__main__':
     try:
         port = int(os.environ.get('PORT', 5001))
@@ -0,0 +1,217 @@
+"""
+Async (ASGI) serving path.
+
+The hot, I/O-bound routes (/generate, /generate-stream, /pronounce, /pronounce-batch)
+are served by async handlers on the AsyncOpenAI client, so a waiting model or speech
+call no longer pins an OS thread. Every other route falls through to the Flask app,
+which builds and owns the shared services.
+
+Run with: python src/asgi.py   (or: cd src && uvicorn asgi:app --port 5001)
+"""
+import os
+import time
+import sys
+import logging
+from contextlib import asynccontextmanager
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route, Mount
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import app as flask_module
+from app import (
+    SESSION_COOKIE, session_manager, word_service, word_translation_service,
+    odia_phrase_service, pronunciation_service, pop_prefetched, dedup_key, sse_event,
+    pronounce_batch_texts
+)
+from services.session_manager import SessionManager
+from services.metrics import HTTP_SECONDS
+
+logger = logging.getLogger(__name__)
+
+def with_session(handler):
+    """Resolve the learner's session like the Flask app does and set the cookie on new sessions"""
+    async def wrapper(request):
+        session_id = request.headers.get('X-Session-Id') or request.cookies.get(SESSION_COOKIE)
+        new_session = not SessionManager.is_valid_session_id(session_id)
+        if new_session:
+            session_id = SessionManager.new_session_id()
+
+        started = time.perf_counter()
+        response = await handler(request, session_id)
+        HTTP_SECONDS.observe(time.perf_counter() - started,
+                             endpoint=request.url.path, method=request.method, status=response.status_code)
+        if new_session:
+            response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite='lax')
+        response.headers['X-Session-Id'] = session_id
+        return response
+    return wrapper
+
+async def abuild_batch(gen_type, storage):
+    """Async counterpart of app.build_batch"""
+    if gen_type == 'words':
+        items = await word_service.agenerate_words(dedup=storage.english_index)
+        return await word_translation_service.atranslate_words(items)
+    return await odia_phrase_service.aprocess_phrases(dedup=storage.odia_index)
+
+@with_session
+async def generate(request, session_id):
+    try:
+        body = await request.json()
+        gen_type = body.get('type', 'words')
+
+        # Loading a cold session reads its log from disk, so it stays off the event loop
+        data_storage = await run_in_threadpool(session_manager.acquire, session_id)
+        try:
+            # Use a prefetched batch if one is ready, otherwise generate now
+            new_translations = await run_in_threadpool(pop_prefetched, gen_type, data_storage)
+            prefetched = new_translations is not None
+            if not prefetched:
+                new_translations = await abuild_batch(gen_type, data_storage)
+
+            if gen_type != 'words' and len(new_translations) < 10:
+                logger.warning(f"Generated fewer translations than expected: {len(new_translations)}")
+
+            new_translations, storage_info = await run_in_threadpool(
+                data_storage.save_new_translations, new_translations, dedup_key(gen_type))
+        finally:
+            session_manager.release(session_id)
+
+        response = {
+            'success': True,
+            'translations': new_translations,
+            'storage_info': storage_info,
+            'prefetched': prefetched
+        }
+
+        if body.get('pronounce'):
+            audio_urls, audio_errors = await pronunciation_service.apronounce_batch(
+                [t['odia'] for t in new_translations])
+            response['audio_urls'] = audio_urls
+            response['audio_errors'] = audio_errors
+
+        return JSONResponse(response)
+
+    except Exception as e:
+        return JSONResponse({'success': False, 'error': str(e)}, status_code=500)
+
+async def _iterate(source):
+    """Iterate a list or an async generator the same way"""
+    if hasattr(source, '__aiter__'):
+        async for item in source:
+            yield item
+    else:
+        for item in source:
+            yield item
+
+@with_session
+async def generate_stream(request, session_id):
+    body = await request.json()
+    gen_type = body.get('type', 'words')
+
+    async def events():
+        cards = []
+        storage_info = None
+        data_storage = await run_in_threadpool(session_manager.acquire, session_id)
+        try:
+            try:
+                batch = await run_in_threadpool(pop_prefetched, gen_type, data_storage)
+                if batch is not None:
+                    source = batch
+                elif gen_type == 'words':
+                    items = await word_service.agenerate_words(dedup=data_storage.english_index)
+                    source = word_translation_service.atranslate_words_stream(items)
+                else:
+                    source = await odia_phrase_service.aprocess_phrases(dedup=data_storage.odia_index)
+
+                async for card in _iterate(source):
+                    if not all(card.get(key) for key in ('english', 'odia', 'romanized_odia')):
+                        continue
+                    saved, info = await run_in_threadpool(
+                        data_storage.save_new_translations, [card], dedup_key(gen_type))
+                    if not saved:
+                        continue
+                    storage_info = info
+                    cards.append(card)
+                    yield sse_event('card', card)
+
+                yield sse_event('done', {
+                    'count': len(cards),
+                    'storage_info': storage_info,
+                    'prefetched': batch is not None
+                })
+
+            except Exception as e:
+                logger.error(f"Error in streaming generate: {e}")
+                yield sse_event('error', {'error': str(e)})
+        finally:
+            session_manager.release(session_id)
+
+    return StreamingResponse(
+        events(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@with_session
+async def pronounce(request, session_id):
+    try:
+        text = (await request.json()).get('text')
+        if not text:
+            raise ValueError("No text provided")
+
+        audio_url, cached = await pronunciation_service.apronounce(text)
+
+        return JSONResponse({
+            'success': True,
+            'audio_url': audio_url,
+            'cached': cached
+        })
+    except Exception as e:
+        return JSONResponse({'success': False, 'error': str(e)}, status_code=500)
+
+@with_session
+async def pronounce_batch(request, session_id):
+    try:
+        texts = pronounce_batch_texts((await request.json()).get('texts'))
+
+        audio_urls, errors = await pronunciation_service.apronounce_batch(texts)
+
+        return JSONResponse({
+            'success': True,
+            'audio_urls': audio_urls,
+            'errors': errors
+        })
+    except ValueError as e:
+        return JSONResponse({'success': False, 'error': str(e)}, status_code=400)
+    except Exception as e:
+        return JSONResponse({'success': False, 'error': str(e)}, status_code=500)
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await flask_module.async_client.close()
+
+app = Starlette(
+    routes=[
+        Route('/generate', generate, methods=['POST']),
+        Route('/generate-stream', generate_stream, methods=['POST']),
+        Route('/pronounce', pronounce, methods=['POST']),
+        Route('/pronounce-batch', pronounce_batch, methods=['POST']),
+        # Everything else is served by the Flask app
+        Mount('/', app=WSGIMiddleware(flask_module.app)),
+    ],
+    lifespan=lifespan
+)
+
+if __name__ == '__main__':
+    import uvicorn
+
+    port = int(os.environ.get('PORT', 5001))
+    logger.info(f"Starting ASGI app on port {port}")
+    # No reloader: it would build every service (and the prefetch pool) twice
+    uvicorn.run(app, host='0.0.0.0', port=port, reload=False)
@@ -1,8 +1,8 @@
 class WordGeneration:
     @staticmethod
-    def get_system_prompt(gen_type='words'):
+    def get_system_prompt(gen_type='words', count=10):
         content = """You are a language learning assistant specializing in generating {type}.
-        You must respond with ONLY a JSON array of 10 {type}.
+        You must respond with ONLY a JSON array of {count} {type}.
         VERY IMPORTANT: Your response must be EXACTLY in this format with NO OTHER CHARACTERS:
         {example}
         - No punctuation marks in the content
@@ -19,15 +19,15 @@ class WordGeneration:
 
         return {
             "role": "system",
-            "content": content.format(type=type_desc, example=example)
+            "content": content.format(type=type_desc, example=example, count=count)
         }
 
     @staticmethod
-    def get_generation_prompt(existing_words=None, gen_type='words'):
+    def get_generation_prompt(existing_words=None, gen_type='words', count=10):
         """Create prompt for word/phrase generation"""
         type_desc = "words" if gen_type == 'words' else "phrases or short sentences"
         
-        base_content = """Return EXACTLY a JSON array of 10 simple English {type}.
+        base_content = """Return EXACTLY a JSON array of {count} simple English {type}.
         Format must be EXACTLY like this: ["item1","item2","item3"]
         - No punctuation marks
         - No special characters
@@ -36,10 +36,10 @@ class WordGeneration:
         
         if existing_words:
             content = f"""These are the existing items: {', '.join(existing_words)}
-            {base_content.format(type=type_desc)}
+            {base_content.format(type=type_desc, count=count)}
             Do not repeat any existing items."""
         else:
-            content = base_content.format(type=type_desc)
+            content = base_content.format(type=type_desc, count=count)
 
         return {
             "role": "user",
@@ -47,10 +47,10 @@ class WordGeneration:
         }
 
     @staticmethod
-    def get_messages(existing_words=None, gen_type='words'):
+    def get_messages(existing_words=None, gen_type='words', count=10):
         """Returns a list of messages for generation"""
-        messages = [WordGeneration.get_system_prompt(gen_type)]
-        messages.append(WordGeneration.get_generation_prompt(existing_words, gen_type))
+        messages = [WordGeneration.get_system_prompt(gen_type, count)]
+        messages.append(WordGeneration.get_generation_prompt(existing_words, gen_type, count))
         return messages
 
 
@@ -165,11 +165,11 @@ class PhraseGeneration:
 
 class OdiaPhraseGeneration:
     @staticmethod
-    def get_system_prompt():
+    def get_system_prompt(count=10):
         return {
             "role": "system",
-            "content": """You are an Odia language expert who generates common Odia phrases.
-            Return ONLY a JSON array of 10 Odia phrases.
+            "content": f"""You are an Odia language expert who generates common Odia phrases.
+            Return ONLY a JSON array of {count} Odia phrases.
             Example format: ["ତୁମେ କେମିତି ଅଛ","ମୁଁ ଭଲ ଅଛି","ଆପଣଙ୍କୁ ଦେଖି ଖୁସି ଲାଗିଲା"]
             Rules:
             - Generate natural, everyday phrases
@@ -179,13 +179,13 @@ class OdiaPhraseGeneration:
         }
 
     @staticmethod
-    def get_generation_prompt(existing_phrases=None):
+    def get_generation_prompt(existing_phrases=None, count=10):
         if existing_phrases:
             content = f"""Existing Odia phrases: {', '.join(existing_phrases)}
-            Generate 10 NEW common Odia phrases (different from existing ones).
+            Generate {count} NEW common Odia phrases (different from existing ones).
             Return as simple JSON array: ["ଓଡ଼ିଆ ବାକ୍ୟ","ଆଉ ଏକ ବାକ୍ୟ"]"""
         else:
-            content = """Generate 10 common Odia phrases used in daily life.
+            content = f"""Generate {count} common Odia phrases used in daily life.
             Return as simple JSON array: ["ଓଡ଼ିଆ ବାକ୍ୟ","ଆଉ ଏକ ବାକ୍ୟ"]"""
 
         return {
@@ -194,9 +194,9 @@ class OdiaPhraseGeneration:
         }
 
     @staticmethod
-    def get_messages(existing_phrases=None):
-        messages = [OdiaPhraseGeneration.get_system_prompt()]
-        messages.append(OdiaPhraseGeneration.get_generation_prompt(existing_phrases))
+    def get_messages(existing_phrases=None, count=10):
+        messages = [OdiaPhraseGeneration.get_system_prompt(count)]
+        messages.append(OdiaPhraseGeneration.get_generation_prompt(existing_phrases, count))
         return messages
 
 
@@ -262,4 +262,64 @@ class RomanizedGeneration:
     def get_messages(phrases):
         messages = [RomanizedGeneration.get_system_prompt()]
         messages.append(RomanizedGeneration.get_romanization_prompt(phrases))
-        return messages 
\ No newline at end of file
+        return messages 
+
+class StructuredPhraseGeneration:
+    @staticmethod
+    def get_system_prompt(count=10):
+        return {
+            "role": "system",
+            "content": f"""You are an Odia language expert who creates phrase cards for English speakers learning Odia.
+            Generate {count} common, everyday Odia phrases.
+            For each phrase give the Odia text in proper Odia script, its natural English translation,
+            and its romanized form using standard romanization rules for Odia.
+            Example card: {{"english":"how are you","odia":"ତୁମେ କେମିତି ଅଛ","romanized_odia":"tume kemiti acha"}}"""
+        }
+
+    @staticmethod
+    def get_generation_prompt(existing_phrases=None, count=10):
+        if existing_phrases:
+            content = f"""Existing Odia phrases: {', '.join(existing_phrases)}
+            Generate {count} NEW phrase cards (different from existing ones)."""
+        else:
+            content = f"""Generate {count} phrase cards used in daily life."""
+
+        return {
+            "role": "user",
+            "content": content
+        }
+
+    @staticmethod
+    def get_response_format():
+        """JSON schema that constrains the response to complete phrase cards"""
+        card = {
+            "type": "object",
+            "properties": {
+                "english": {"type": "string"},
+                "odia": {"type": "string"},
+                "romanized_odia": {"type": "string"}
+            },
+            "required": ["english", "odia", "romanized_odia"],
+            "additionalProperties": False
+        }
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "phrase_cards",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "phrases": {"type": "array", "items": card}
+                    },
+                    "required": ["phrases"],
+                    "additionalProperties": False
+                }
+            }
+        }
+
+    @staticmethod
+    def get_messages(existing_phrases=None, count=10):
+        messages = [StructuredPhraseGeneration.get_system_prompt(count)]
+        messages.append(StructuredPhraseGeneration.get_generation_prompt(existing_phrases, count))
+        return messages
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Provider layer: builds the LLM clients, text-to-speech backend and object store
+named in config.json's "providers" section, so local stand-ins can replace the
+hosted services for benchmarks and offline runs.
+"""
+import os
+from openai import OpenAI, AsyncOpenAI
+
+def create_llm_clients(config):
+    """
+    Sync and async OpenAI clients; base_url points them at any OpenAI-compatible
+    server, such as providers/fake_llm.py
+    """
+    llm_config = config.get('providers', {}).get('llm', {})
+    base_url = llm_config.get('base_url')
+    if not base_url:
+        return OpenAI(), AsyncOpenAI()
+
+    # Stand-ins do not check the key, but the client insists on having one
+    api_key = os.getenv('OPENAI_API_KEY') or 'stand-in'
+    return OpenAI(base_url=base_url, api_key=api_key), AsyncOpenAI(base_url=base_url, api_key=api_key)
+
+def create_blob_storage(config):
+    """Azure Blob Storage, or a local directory served from /blobs/"""
+    storage_type = config.get('providers', {}).get('storage', {}).get('type', 'azure')
+    if storage_type == 'filesystem':
+        from providers.filesystem_storage import FilesystemBlobStorage
+        return FilesystemBlobStorage(config)
+    if storage_type != 'azure':
+        raise ValueError(f"Unknown storage provider: {storage_type}")
+
+    from services.blob_storage import BlobStorageService
+    return BlobStorageService(config)
+
+def create_tts_provider(config):
+    """None means the Azure Speech SDK path inside SpeechService"""
+    tts_config = config.get('providers', {}).get('tts', {})
+    tts_type = tts_config.get('type', 'azure')
+    if tts_type == 'fake':
+        from providers.fake_tts import FakeSpeechSynthesizer
+        return FakeSpeechSynthesizer(latency_seconds=tts_config.get('fake_latency_seconds', 0.2))
+    if tts_type != 'azure':
+        raise ValueError(f"Unknown TTS provider: {tts_type}")
+    return None
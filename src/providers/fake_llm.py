@@ -0,0 +1,263 @@
+"""
+OpenAI-compatible chat-completions stand-in for offline benchmarks and regression runs.
+
+It recognizes the app's prompts and answers with plausible canned content (word lists,
+translations, Odia phrases, romanizations, structured phrase cards), after a configurable
+latency. A configurable share of responses is corrupted the ways real model output goes
+wrong, so the salvage paths get exercised too. Streaming requests are answered as SSE.
+
+Run standalone: python src/providers/fake_llm.py --port 8089 --latency 0.5
+then point the app at it with providers.llm.base_url = "http://127.0.0.1:8089/v1".
+"""
+import os
+import re
+import sys
+import json
+import time
+import random
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.romanization import OdiaTransliterator
+
+ENGLISH_WORDS = [
+    "water", "book", "house", "walk", "run", "sleep", "read", "write", "speak", "eat",
+    "tree", "river", "school", "friend", "mother", "father", "village", "market", "road", "rain",
+    "sun", "moon", "star", "flower", "fruit", "rice", "fish", "milk", "door", "window",
+    "teacher", "child", "city", "temple", "song", "dance", "money", "work", "play", "morning",
+    "evening", "night", "cloud", "wind", "fire", "stone", "bird", "cow", "dog", "cat",
+]
+
+ODIA_WORDS = [
+    "ମୁଁ", "ତୁମେ", "ଆମେ", "ଘର", "ପାଣି", "ବହି", "ଭଲ", "ଅଛି", "ଯାଉଛି", "ଆସ",
+    "ଖାଇବା", "ଆଜି", "କାଲି", "ବଜାର", "ଗାଁ", "ସ୍କୁଲ", "ବନ୍ଧୁ", "ମାଆ", "ବାପା", "ବର୍ଷା",
+]
+
+# English letters mapped onto Odia consonants to fake a translation deterministically
+_PSEUDO_ODIA = dict(zip("abcdefghijklmnopqrstuvwxyz", "ଅବଚଦଏଫଗହଇଜକଲମନଓପକରସତଉଭୱକୟଜ"))
+
+_transliterator = OdiaTransliterator()
+
+
+def pseudo_odia(english):
+    return "".join(_PSEUDO_ODIA.get(char, "") for char in english.lower()) or "ଶବ୍ଦ"
+
+
+def _requested_count(text, default=10):
+    match = re.search(r"\b(\d+)\b", text)
+    return int(match.group(1)) if match else default
+
+
+def _quoted_items(text):
+    return re.findall(r'"([^"]+)"', text)
+
+
+def _listed_words(text):
+    match = re.search(r"Odia: (.+)", text)
+    return [word.strip() for word in match.group(1).split(",")] if match else []
+
+
+def _card(odia, english=None):
+    return {
+        "english": english or f"phrase {abs(hash(odia)) % 1000}",
+        "odia": odia,
+        "romanized_odia": _transliterator.romanize(odia),
+    }
+
+
+def _odia_phrase(rng):
+    return " ".join(rng.sample(ODIA_WORDS, rng.randint(2, 4)))
+
+
+def canned_response(messages, rng=random):
+    """Build the answer a well-behaved model would give to one of the app's prompts"""
+    system = messages[0]["content"] if messages else ""
+    user = messages[-1]["content"] if messages else ""
+
+    if "specializing in generating" in system:
+        count = _requested_count(system)
+        items = rng.sample(ENGLISH_WORDS, min(count, len(ENGLISH_WORDS)))
+        return json.dumps(items)
+
+    if "English to Odia translator" in system:
+        texts = _quoted_items(user.split("Return")[0]) or _listed_words(user)
+        return json.dumps([
+            {"english": text, "odia": pseudo_odia(text), "romanized_odia": _transliterator.romanize(pseudo_odia(text))}
+            for text in texts
+        ], ensure_ascii=False)
+
+    if "phrase cards" in system:
+        count = _requested_count(system)
+        cards = [_card(_odia_phrase(rng)) for _ in range(count)]
+        return json.dumps({"phrases": cards}, ensure_ascii=False)
+
+    if "generates common Odia phrases" in system:
+        count = _requested_count(system)
+        return json.dumps([_odia_phrase(rng) for _ in range(count)], ensure_ascii=False)
+
+    if "Odia to English translator" in system:
+        phrases = _quoted_items(user.split("Return")[0])
+        return json.dumps([{"odia": phrase, "english": _card(phrase)["english"]} for phrase in phrases],
+                          ensure_ascii=False)
+
+    if "romanizing Odia" in system:
+        phrases = _quoted_items(user.split("Return")[0])
+        return json.dumps([{"odia": phrase, "romanized": _transliterator.romanize(phrase)} for phrase in phrases],
+                          ensure_ascii=False)
+
+    return "[]"
+
+
+def corrupt(content, rng=random):
+    """Damage a response the ways model output usually goes wrong"""
+    damage = rng.choice(["truncate", "trailing_comma", "code_fence", "preamble"])
+    if damage == "truncate":
+        return content[:max(1, int(len(content) * rng.uniform(0.5, 0.95)))]
+    if damage == "trailing_comma" and content.endswith("]"):
+        return content[:-1] + ",]"
+    if damage == "code_fence":
+        return f"```json\n{content}\n```"
+    return f"Here is the list you asked for:\n{content}"
+
+
+class FakeChatCompletionsServer:
+    """Threaded HTTP server answering POST .../chat/completions"""
+    def __init__(self, host="127.0.0.1", port=0, latency_seconds=0.5, jitter_seconds=0.0,
+                 malformed_rate=0.0, stream_chunk_chars=8, seed=None):
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self.malformed_rate = malformed_rate
+        self.stream_chunk_chars = stream_chunk_chars
+        self.rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.requests = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self.send_error(404)
+                    return
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                content = server.respond(body)
+
+                if body.get("stream"):
+                    self._stream(body, content)
+                else:
+                    self._send_json(server.completion(body, content))
+
+            def _send_json(self, payload):
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self, body, content):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                step = server.stream_chunk_chars
+                for i in range(0, len(content), step):
+                    chunk = server.chunk(body, content[i:i + step])
+                    self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                self.close_connection = True
+
+        return Handler
+
+    def respond(self, body):
+        """Wait out the simulated latency and produce the (possibly corrupted) content"""
+        with self._rng_lock:
+            self.requests += 1
+            delay = self.latency_seconds + self.rng.uniform(0, self.jitter_seconds)
+            content = canned_response(body.get("messages", []), self.rng)
+            if self.malformed_rate and self.rng.random() < self.malformed_rate:
+                content = corrupt(content, self.rng)
+        time.sleep(delay)
+        return content
+
+    @staticmethod
+    def completion(body, content):
+        prompt_tokens = sum(len(message.get("content", "")) for message in body.get("messages", [])) // 4
+        completion_tokens = len(content) // 4
+        return {
+            "id": f"chatcmpl-fake-{int(time.time() * 1000)}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        }
+
+    @staticmethod
+    def chunk(body, delta):
+        return {
+            "id": "chatcmpl-fake-stream",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{"index": 0, "delta": {"content": delta}, "finish_reason": None}]
+        }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name="fake-llm")
+        self._thread.start()
+        return self.base_url
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds before each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, in seconds")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="share of responses to corrupt")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeChatCompletionsServer(args.host, args.port, args.latency, args.jitter, args.malformed_rate, seed=args.seed)
+    print(f"Fake chat completions listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
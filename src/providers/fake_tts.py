@@ -0,0 +1,37 @@
+import io
+import math
+import time
+import wave
+import struct
+
+class FakeSpeechSynthesizer:
+    """
+    Stand-in for Azure text-to-speech: after a configurable delay it returns a short
+    16 kHz mono 16-bit WAV tone whose length grows with the text, like real speech.
+    """
+    sample_rate = 16000
+
+    def __init__(self, latency_seconds=0.2, seconds_per_char=0.06, max_seconds=4.0):
+        self.latency_seconds = latency_seconds
+        self.seconds_per_char = seconds_per_char
+        self.max_seconds = max_seconds
+
+    def synthesize(self, text: str) -> bytes:
+        time.sleep(self.latency_seconds)
+
+        duration = min(self.max_seconds, 0.2 + self.seconds_per_char * len(text))
+        frames = int(self.sample_rate * duration)
+        # Pitch derived from the text so different texts sound different
+        frequency = 220 + sum(map(ord, text)) % 440
+        samples = struct.pack(
+            f"<{frames}h",
+            *(int(8000 * math.sin(2 * math.pi * frequency * i / self.sample_rate)) for i in range(frames))
+        )
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(samples)
+        return buffer.getvalue()
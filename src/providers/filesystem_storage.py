@@ -0,0 +1,88 @@
+import os
+import shutil
+import logging
+from datetime import datetime, timedelta
+from urllib.parse import quote
+from services.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+SAS_EXPIRY_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+class FilesystemBlobStorage:
+    """
+    Drop-in stand-in for BlobStorageService that keeps blobs in a local directory.
+    URLs point at the app's /blobs/ route and carry an `se` expiry like a SAS URL,
+    so the audio index and session sync behave exactly as they do against Azure.
+    """
+    url_prefix = "/blobs"
+
+    def __init__(self, config):
+        self.root = config['providers']['storage']['filesystem_root']
+        self.container_name = config['storage']['container_name']
+        self.expiry_hours = config['storage']['expiry_hours']
+        os.makedirs(self.root, exist_ok=True)
+
+    def warm_up(self):
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, blob_name: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, blob_name))
+        if not path.startswith(os.path.abspath(self.root) + os.sep):
+            raise ValueError(f"Invalid blob name: {blob_name}")
+        return path
+
+    def _write(self, blob_name: str, write):
+        path = self._path(blob_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        write(tmp_path)
+        os.replace(tmp_path, path)
+
+    @timed("blob_upload")
+    def upload_file(self, file_path: str, blob_name: str = None) -> str:
+        """Copy a file into the store and return its URL"""
+        if blob_name is None:
+            blob_name = os.path.basename(file_path)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        self._write(blob_name, lambda tmp_path: shutil.copyfile(file_path, tmp_path))
+        return self.generate_sas_url(blob_name)
+
+    @timed("blob_upload")
+    def upload_bytes(self, data, blob_name: str, content_type: str = None) -> str:
+        """Store an in-memory buffer (bytes or a readable stream) and return its URL"""
+        if hasattr(data, "read"):
+            if hasattr(data, "seek"):
+                data.seek(0)
+            data = data.read()
+
+        def write(tmp_path):
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+
+        self._write(blob_name, write)
+        return self.generate_sas_url(blob_name)
+
+    @timed("blob_exists")
+    def blob_exists(self, blob_name: str) -> bool:
+        return os.path.exists(self._path(blob_name))
+
+    def blob_path(self, blob_name: str) -> str:
+        """Local path of a stored blob, for serving it"""
+        return self._path(blob_name)
+
+    @timed("sas_generation")
+    def generate_sas_url(self, blob_name: str) -> str:
+        expiry = datetime.utcnow() + timedelta(hours=self.expiry_hours)
+        return f"{self.url_prefix}/{quote(blob_name)}?se={quote(expiry.strftime(SAS_EXPIRY_FORMAT))}"
+
+    def cleanup_expired_blobs(self):
+        expiry_time = datetime.utcnow() - timedelta(hours=self.expiry_hours)
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                if datetime.utcfromtimestamp(os.path.getmtime(path)) < expiry_time:
+                    os.remove(path)
+                    logger.info(f"Deleted expired blob: {os.path.relpath(path, self.root)}")
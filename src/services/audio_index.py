@@ -0,0 +1,141 @@
+import os
+import json
+import atexit
+import threading
+import logging
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, parse_qs, unquote
+from services.metrics import timed, record_cache
+
+logger = logging.getLogger(__name__)
+
+SAS_EXPIRY_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+class AudioIndex:
+    """
+    In-memory index of Odia text -> audio blob, loaded once from audio_map.json.
+    Records keep the blob name and SAS expiry so stale URLs are re-signed instead of served,
+    and changes are written back to disk in batches by a background thread.
+    """
+    def __init__(self, blob_storage_service, map_file, refresh_margin_minutes=60, flush_interval_seconds=5):
+        self.blob_storage = blob_storage_service
+        self.map_file = map_file
+        os.makedirs(os.path.dirname(map_file) or ".", exist_ok=True)
+        self.refresh_margin = timedelta(minutes=refresh_margin_minutes)
+        self.flush_interval = flush_interval_seconds
+        self._records = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._dirty = False
+        self._stop = threading.Event()
+
+        self._load()
+        self._flusher = threading.Thread(target=self._flush_loop, name="audio-index-flush", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def parse_sas_url(url: str):
+        """Extract the blob name and expiry time from a SAS URL"""
+        parsed = urlparse(url)
+        parts = parsed.path.lstrip('/').split('/', 1)
+        blob_name = unquote(parts[1]) if len(parts) == 2 else None
+
+        expires_at = None
+        expiry_values = parse_qs(parsed.query).get('se')
+        if expiry_values:
+            try:
+                expires_at = datetime.strptime(expiry_values[0], SAS_EXPIRY_FORMAT)
+            except ValueError:
+                logger.warning(f"Unrecognized SAS expiry: {expiry_values[0]}")
+
+        return blob_name, expires_at
+
+    def _make_record(self, url: str):
+        blob_name, expires_at = self.parse_sas_url(url)
+        return {
+            "blob_name": blob_name,
+            "url": url,
+            "expires_at": expires_at.strftime(SAS_EXPIRY_FORMAT) if expires_at else None
+        }
+
+    def _load(self):
+        """Load audio_map.json once, upgrading plain URL entries to records"""
+        try:
+            if not os.path.exists(self.map_file):
+                return
+            with open(self.map_file, 'r', encoding='utf-8') as f:
+                audio_map = json.load(f)
+            for text, value in audio_map.items():
+                self._records[text] = self._make_record(value) if isinstance(value, str) else value
+            logger.info(f"Loaded {len(self._records)} audio records")
+        except Exception as e:
+            logger.error(f"Error loading audio index: {e}")
+
+    def _is_fresh(self, record):
+        if not record.get("expires_at"):
+            return False
+        expires_at = datetime.strptime(record["expires_at"], SAS_EXPIRY_FORMAT)
+        return expires_at - datetime.utcnow() > self.refresh_margin
+
+    def get(self, odia_text: str):
+        """Return a servable audio URL for the text, re-signing it if it is close to expiry"""
+        with self._lock:
+            record = self._records.get(odia_text)
+        if record is None:
+            record_cache("audio_index", misses=1)
+            return None
+        if self._is_fresh(record):
+            record_cache("audio_index", hits=1)
+            return record["url"]
+
+        if not record.get("blob_name"):
+            # Nothing to re-sign, so treat it as a miss and let it be regenerated
+            with self._lock:
+                self._records.pop(odia_text, None)
+                self._dirty = True
+            record_cache("audio_index", misses=1)
+            return None
+
+        record_cache("audio_index", hits=1)
+        url = self.blob_storage.generate_sas_url(record["blob_name"])
+        self.put(odia_text, url)
+        logger.info(f"Refreshed SAS URL for: {odia_text}")
+        return url
+
+    def put(self, odia_text: str, audio_url: str):
+        """Record a new audio URL; it is persisted by the next background flush"""
+        record = self._make_record(audio_url)
+        with self._lock:
+            self._records[odia_text] = record
+            self._dirty = True
+
+    @timed("audio_index_flush")
+    def flush(self):
+        """Write the index to disk if it changed since the last flush"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = dict(self._records)
+                self._dirty = False
+
+            try:
+                tmp_file = f"{self.map_file}.tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_file, self.map_file)
+                logger.info(f"Audio index flushed ({len(snapshot)} records)")
+            except Exception as e:
+                with self._lock:
+                    self._dirty = True
+                logger.error(f"Error flushing audio index: {e}")
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Stop the background flusher and persist pending changes"""
+        self._stop.set()
+        self.flush()
@@ -1,8 +1,10 @@
 import os
 from datetime import datetime, timedelta
-from azure.storage.blob import BlobServiceClient, generate_blob_sas, BlobSasPermissions
+from azure.storage.blob import BlobServiceClient, generate_blob_sas, BlobSasPermissions, ContentSettings
 import logging
+import threading
 import time
+from services.metrics import timed
 
 logger = logging.getLogger(__name__)
 
@@ -13,20 +15,42 @@ class BlobStorageService:
         self.account_key = os.getenv('AZURE_STORAGE_ACCOUNT_KEY')
         self.container_name = config['storage']['container_name']
         self.expiry_hours = config['storage']['expiry_hours']
-        
-        try:
-            self.blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
-            self.container_client = self.blob_service_client.get_container_client(self.container_name)
-            
-            # Create container if it doesn't exist
-            if not self.container_client.exists():
-                self.container_client.create_container()
-                logger.info(f"Created container: {self.container_name}")
-        
-        except Exception as e:
-            logger.error(f"Error initializing blob storage: {e}")
-            raise
+        # The client and container check are deferred to first use (or warm_up)
+        self._container_client = None
+        self._init_lock = threading.Lock()
+
+    @property
+    def container_client(self):
+        if self._container_client is None:
+            self.warm_up()
+        return self._container_client
+
+    @timed("blob_connect")
+    def warm_up(self):
+        """
+        Connect to the storage account and make sure the container exists
+        Safe to call repeatedly; a failed attempt is retried on the next call
+        """
+        with self._init_lock:
+            if self._container_client is not None:
+                return
+            try:
+                blob_service_client = BlobServiceClient.from_connection_string(self.connection_string)
+                container_client = blob_service_client.get_container_client(self.container_name)
 
+                # Create container if it doesn't exist
+                if not container_client.exists():
+                    container_client.create_container()
+                    logger.info(f"Created container: {self.container_name}")
+
+                self.blob_service_client = blob_service_client
+                self._container_client = container_client
+
+            except Exception as e:
+                logger.error(f"Error initializing blob storage: {e}")
+                raise
+
+    @timed("blob_upload")
     def upload_file(self, file_path: str, blob_name: str = None) -> str:
         """
         Upload a file to blob storage and return a SAS URL
@@ -39,21 +63,12 @@ class BlobStorageService:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
 
-            max_retries = 3
-            retry_delay = 1  # seconds
-            
-            for attempt in range(max_retries):
-                try:
-                    # Upload the file
-                    with open(file_path, "rb") as data:
-                        blob_client = self.container_client.get_blob_client(blob_name)
-                        blob_client.upload_blob(data, overwrite=True)
-                    break  # If successful, break the retry loop
-                except Exception as e:
-                    if attempt == max_retries - 1:  # Last attempt
-                        raise  # Re-raise the last exception
-                    logger.warning(f"Upload attempt {attempt + 1} failed: {e}. Retrying...")
-                    time.sleep(retry_delay)
+            def upload():
+                with open(file_path, "rb") as data:
+                    blob_client = self.container_client.get_blob_client(blob_name)
+                    blob_client.upload_blob(data, overwrite=True)
+
+            self._upload_with_retries(upload)
 
             # Generate SAS URL
             sas_url = self.generate_sas_url(blob_name)
@@ -63,6 +78,55 @@ class BlobStorageService:
             logger.error(f"Error uploading file to blob storage: {e}")
             raise
 
+    @timed("blob_upload")
+    def upload_bytes(self, data, blob_name: str, content_type: str = None) -> str:
+        """
+        Upload an in-memory buffer (bytes or a readable stream) and return a SAS URL
+        """
+        try:
+            content_settings = ContentSettings(content_type=content_type) if content_type else None
+
+            def upload():
+                if hasattr(data, "seek"):
+                    data.seek(0)
+                blob_client = self.container_client.get_blob_client(blob_name)
+                blob_client.upload_blob(data, overwrite=True, content_settings=content_settings)
+
+            self._upload_with_retries(upload)
+
+            return self.generate_sas_url(blob_name)
+
+        except Exception as e:
+            logger.error(f"Error uploading data to blob storage: {e}")
+            raise
+
+    def _upload_with_retries(self, upload):
+        """Run an upload callable, retrying transient failures"""
+        max_retries = 3
+        retry_delay = 1  # seconds
+
+        for attempt in range(max_retries):
+            try:
+                upload()
+                return
+            except Exception as e:
+                if attempt == max_retries - 1:  # Last attempt
+                    raise  # Re-raise the last exception
+                logger.warning(f"Upload attempt {attempt + 1} failed: {e}. Retrying...")
+                time.sleep(retry_delay)
+
+    @timed("blob_exists")
+    def blob_exists(self, blob_name: str) -> bool:
+        """
+        Check whether a blob is already stored in the container
+        """
+        try:
+            return self.container_client.get_blob_client(blob_name).exists()
+        except Exception as e:
+            logger.error(f"Error checking blob existence: {e}")
+            raise
+
+    @timed("sas_generation")
     def generate_sas_url(self, blob_name: str) -> str:
         """
         Generate a SAS URL for the blob that expires after the configured hours
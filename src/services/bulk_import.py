@@ -0,0 +1,299 @@
+import os
+import csv
+import io
+import json
+import time
+import uuid
+import threading
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("completed", "failed")
+CSV_HEADERS = {"english", "word", "words", "phrase", "phrases", "text"}
+
+class BulkImportService:
+    """
+    Translates large vocabulary lists into a learner session as background jobs.
+
+    Each job lives in its own directory under jobs_dir: job.json holds the input,
+    already split into translation chunks, and checkpoint.json records how many
+    chunks have been written to the session. Chunks are translated in parallel
+    but appended to the session in input order, so after a crash the job resumes
+    from the checkpoint and redoes at most the chunks that were not yet appended.
+    A job only runs while its process holds the job's lock file, so two processes
+    sharing jobs_dir never run the same job.
+    """
+    def __init__(self, translation_service, session_manager, jobs_dir=os.path.join("data", "imports"),
+                 workers=8, append_batch_size=200, max_items=20000, max_concurrent_jobs=2):
+        self.translation_service = translation_service
+        self.session_manager = session_manager
+        self.jobs_dir = jobs_dir
+        self.workers = workers
+        self.append_batch_size = append_batch_size
+        self.max_items = max_items
+        self._jobs = {}  # job id -> progress
+        self._lock = threading.Lock()
+        # Jobs run one per worker thread, each with its own pool of chunk translators
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_jobs, thread_name_prefix="bulk-import")
+        os.makedirs(jobs_dir, exist_ok=True)
+
+    @staticmethod
+    def parse_items(text: str, is_csv=False):
+        """
+        Items from a plain-text list (one per line) or a CSV (first column)
+        Blank lines, # comments, a CSV header row and repeats are skipped
+        """
+        if is_csv:
+            rows = (row[0] if row else "" for row in csv.reader(io.StringIO(text)))
+        else:
+            rows = text.splitlines()
+
+        items = []
+        for i, row in enumerate(rows):
+            item = row.strip().lstrip("\ufeff").strip()
+            if not item or item.startswith("#"):
+                continue
+            if is_csv and i == 0 and item.casefold() in CSV_HEADERS:
+                continue
+            items.append(item)
+        return list(dict.fromkeys(items))
+
+    @staticmethod
+    def active_session_ids(jobs_dir=os.path.join("data", "imports")):
+        """Sessions with an unfinished import, whose local data must survive a restart"""
+        session_ids = set()
+        if not os.path.isdir(jobs_dir):
+            return session_ids
+        for job_id in os.listdir(jobs_dir):
+            try:
+                with open(os.path.join(jobs_dir, job_id, "job.json"), "r", encoding="utf-8") as f:
+                    job = json.load(f)
+                checkpoint = BulkImportService._read_checkpoint(os.path.join(jobs_dir, job_id))
+            except (OSError, ValueError):
+                continue
+            if checkpoint["status"] not in FINISHED_STATUSES:
+                session_ids.add(job["session_id"])
+        return session_ids
+
+    def _job_dir(self, job_id):
+        return os.path.join(self.jobs_dir, job_id)
+
+    @staticmethod
+    def _read_checkpoint(job_dir):
+        path = os.path.join(job_dir, "checkpoint.json")
+        if not os.path.exists(path):
+            return {"status": "queued", "next_chunk": 0, "translated": 0, "skipped": 0, "failed": 0, "errors": []}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json(path, data):
+        # Write to a temp file first so a crash never leaves a half-written file;
+        # the name is unique per writer so concurrent writers never share one
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _lock_job(self, job_id):
+        """
+        Take the job's lock file without blocking
+        Returns the open lock file, to be closed when the job stops, or None if another process holds it
+        """
+        lock_file = open(os.path.join(self._job_dir(job_id), "job.lock"), "a+")
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return None
+        return lock_file
+
+    def create_job(self, session_id, items: list):
+        """Store a new job and start it in the background; returns its progress"""
+        if not items:
+            raise ValueError("No items to import")
+        if len(items) > self.max_items:
+            raise ValueError(f"Too many items: {len(items)} (limit {self.max_items})")
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "job_id": job_id,
+            "session_id": session_id,
+            "created_at": time.time(),
+            "total": len(items),
+            "chunks": self.translation_service.chunker.split(items)
+        }
+        job_dir = self._job_dir(job_id)
+        os.makedirs(job_dir)
+        self._write_json(os.path.join(job_dir, "job.json"), job)
+
+        self._start(job, self._read_checkpoint(job_dir), self._lock_job(job_id))
+        logger.info(f"Created import job {job_id}: {len(items)} items in {len(job['chunks'])} chunks")
+        return self.get_progress(job_id)
+
+    def resume(self):
+        """Restart every job that had not finished when the app last stopped"""
+        resumed = 0
+        for job_id in sorted(os.listdir(self.jobs_dir)):
+            job_dir = self._job_dir(job_id)
+            lock_file = None
+            try:
+                with open(os.path.join(job_dir, "job.json"), "r", encoding="utf-8") as f:
+                    job = json.load(f)
+                lock_file = self._lock_job(job_id)
+                # Read under the lock, so a job another process just ran starts from its latest checkpoint
+                checkpoint = self._read_checkpoint(job_dir)
+            except (OSError, ValueError) as e:
+                if lock_file is not None:
+                    lock_file.close()
+                logger.warning(f"Skipping unreadable import job {job_id}: {e}")
+                continue
+
+            finished = checkpoint["status"] in FINISHED_STATUSES
+            if lock_file is None or finished:
+                if lock_file is not None:
+                    lock_file.close()
+                elif not finished:
+                    logger.info(f"Import job {job_id} is running in another process; not resuming it here")
+                with self._lock:
+                    self._jobs[job_id] = self._progress(job, checkpoint)
+                continue
+            self._start(job, checkpoint, lock_file)
+            resumed += 1
+            logger.info(f"Resuming import job {job_id} at chunk {checkpoint['next_chunk']} of {len(job['chunks'])}")
+        return resumed
+
+    def _progress(self, job, checkpoint):
+        chunks = job["chunks"]
+        processed = sum(len(chunk) for chunk in chunks[:checkpoint["next_chunk"]])
+        return {
+            "job_id": job["job_id"],
+            "session_id": job["session_id"],
+            "status": checkpoint["status"],
+            "total": job["total"],
+            "processed": processed,
+            "translated": checkpoint["translated"],
+            "skipped": checkpoint["skipped"],
+            "failed": checkpoint["failed"],
+            "errors": checkpoint["errors"],
+            "finished_at": checkpoint.get("finished_at")
+        }
+
+    def _start(self, job, checkpoint, lock_file):
+        progress = self._progress(job, checkpoint)
+        progress.update(started_at=None, processed_at_start=progress["processed"])
+        with self._lock:
+            self._jobs[job["job_id"]] = progress
+        self._executor.submit(self._run, job, checkpoint, lock_file)
+
+    def _update(self, job_id, fields):
+        with self._lock:
+            self._jobs[job_id].update(fields)
+
+    def _translate_chunk(self, chunk):
+        try:
+            return self.translation_service.translate_words(chunk), None
+        except Exception as e:
+            return [], e
+
+    def _run(self, job, checkpoint, lock_file):
+        try:
+            self._run_locked(job, checkpoint)
+        finally:
+            lock_file.close()
+
+    def _run_locked(self, job, checkpoint):
+        job_id = job["job_id"]
+        job_dir = self._job_dir(job_id)
+        chunks = job["chunks"]
+        checkpoint["status"] = "running"
+        self._update(job_id, {"status": "running", "started_at": time.time()})
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix=f"import-{job_id[:8]}") as pool:
+                # Keep a bounded window of chunks in flight and consume them in order
+                pending = deque()
+                next_submit = checkpoint["next_chunk"]
+                buffered, buffered_chunks = [], 0
+
+                while pending or next_submit < len(chunks):
+                    while next_submit < len(chunks) and len(pending) < self.workers * 2:
+                        pending.append((chunks[next_submit], pool.submit(self._translate_chunk, chunks[next_submit])))
+                        next_submit += 1
+
+                    chunk, future = pending.popleft()
+                    translations, error = future.result()
+                    if error is not None:
+                        checkpoint["failed"] += len(chunk)
+                        checkpoint["errors"] = (checkpoint["errors"] + [str(error)])[-10:]
+                        logger.error(f"Import job {job_id}: chunk of {len(chunk)} items failed: {error}")
+                    else:
+                        # Words the model left out of its answer count as failed
+                        checkpoint["failed"] += max(len(chunk) - len(translations), 0)
+                    buffered.extend(translations)
+                    buffered_chunks += 1
+
+                    if len(buffered) >= self.append_batch_size or not pending and next_submit >= len(chunks):
+                        self._append(job, checkpoint, buffered, buffered_chunks)
+                        self._write_json(os.path.join(job_dir, "checkpoint.json"), checkpoint)
+                        self._update(job_id, self._progress(job, checkpoint))
+                        buffered, buffered_chunks = [], 0
+
+            checkpoint["status"] = "completed"
+        except Exception as e:
+            logger.error(f"Import job {job_id} failed: {e}")
+            checkpoint["status"] = "failed"
+            checkpoint["errors"] = (checkpoint["errors"] + [str(e)])[-10:]
+
+        checkpoint["finished_at"] = time.time()
+        self._write_json(os.path.join(job_dir, "checkpoint.json"), checkpoint)
+        self._update(job_id, self._progress(job, checkpoint))
+        logger.info(f"Import job {job_id} {checkpoint['status']}: {checkpoint['translated']} translated, "
+                    f"{checkpoint['skipped']} already in session, {checkpoint['failed']} failed")
+
+    def _append(self, job, checkpoint, translations, chunk_count):
+        """Append a batch to the session, skipping words it already has, and advance the checkpoint"""
+        with self.session_manager.session(job["session_id"]) as storage:
+            # A resumed job may redo chunks whose results reached the session before the crash
+            new_translations, _ = storage.save_new_translations(
+                [t for t in translations if isinstance(t, dict)], "english")
+        checkpoint["translated"] += len(new_translations)
+        checkpoint["skipped"] += len(translations) - len(new_translations)
+        checkpoint["next_chunk"] += chunk_count
+
+    def get_progress(self, job_id):
+        """Progress of a job, or None if it does not exist"""
+        with self._lock:
+            progress = self._jobs.get(job_id)
+            progress = dict(progress) if progress is not None else None
+        if progress is None:
+            return None
+
+        started_at = progress.pop("started_at", None)
+        processed_at_start = progress.pop("processed_at_start", 0)
+        if progress["status"] == "running" and started_at and progress["processed"] > processed_at_start:
+            # Rate since this run started, so a resumed job is not credited with earlier work
+            elapsed = time.time() - started_at
+            rate = (progress["processed"] - processed_at_start) / elapsed if elapsed else 0.0
+            progress["items_per_second"] = round(rate, 1)
+            progress["eta_seconds"] = round((progress["total"] - progress["processed"]) / rate, 1) if rate else None
+        progress["percent"] = round(100.0 * progress["processed"] / progress["total"], 1) if progress["total"] else 100.0
+        return progress
+
+    def get_stats(self):
+        with self._lock:
+            statuses = [progress["status"] for progress in self._jobs.values()]
+        return {status: statuses.count(status) for status in ("queued", "running", "completed", "failed")}
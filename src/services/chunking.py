@@ -0,0 +1,86 @@
+import asyncio
+import math
+import logging
+
+logger = logging.getLogger(__name__)
+
+class TranslationChunker:
+    """
+    Splits a translation batch into chunks whose expected output fits the model's
+    max_tokens, so large batches are not silently truncated mid-array.
+
+    Output size is estimated per item: the English text echoed back, its Odia
+    rendering (the OpenAI tokenizers split Odia script into several tokens per
+    character) and the romanization, plus the JSON keys and punctuation.
+    """
+    def __init__(self, max_tokens, config: dict):
+        self.max_tokens = max_tokens
+        self.item_overhead_tokens = config.get("item_overhead_tokens", 16)
+        self.odia_tokens_per_char = config.get("odia_tokens_per_char", 2.5)
+        # Leave headroom for estimates that come in low
+        self.budget = int(max_tokens * config.get("budget_ratio", 0.8)) if max_tokens else None
+
+    def estimate_tokens(self, text: str) -> int:
+        chars = len(text)
+        # Odia and romanized renderings run to about as many characters as the English
+        return math.ceil(self.item_overhead_tokens + chars / 4 + chars * self.odia_tokens_per_char + chars / 3)
+
+    def split(self, items: list):
+        """Consecutive chunks in input order; an item too large for the budget gets a chunk of its own"""
+        if self.budget is None:
+            return [items] if items else []
+
+        chunks, current, used = [], [], 0
+        for item in items:
+            cost = self.estimate_tokens(item)
+            if current and used + cost > self.budget:
+                chunks.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+def _collect(chunks, results):
+    """Concatenate chunk results in input order, skipping failed chunks unless all failed"""
+    items, errors = [], []
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Translation chunk of {len(chunk)} items failed: {result}")
+            errors.append(result)
+        else:
+            items.extend(result)
+    if errors and len(errors) == len(chunks):
+        raise errors[0]
+    return items
+
+def run_chunks(executor, request, chunks):
+    """Call request(chunk) for every chunk on the executor and reassemble the results in order"""
+    if len(chunks) == 1:
+        return request(chunks[0])
+
+    logger.info(f"Translating {sum(len(chunk) for chunk in chunks)} items in {len(chunks)} parallel chunks")
+    futures = [executor.submit(request, chunk) for chunk in chunks]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return _collect(chunks, results)
+
+async def arun_chunks(arequest, chunks, max_concurrency):
+    """Async counterpart of run_chunks, with at most max_concurrency requests in flight"""
+    if len(chunks) == 1:
+        return await arequest(chunks[0])
+
+    logger.info(f"Translating {sum(len(chunk) for chunk in chunks)} items in {len(chunks)} parallel chunks")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(chunk):
+        async with semaphore:
+            return await arequest(chunk)
+
+    results = await asyncio.gather(*(bounded(chunk) for chunk in chunks), return_exceptions=True)
+    return _collect(chunks, results)
@@ -3,75 +3,176 @@ import json
 import time
 from datetime import datetime
 import logging
-import shutil
+import threading
+from services.audio_index import AudioIndex
+from services.dedup import DedupIndex
+from services.snapshot_store import SnapshotStore
+from services.metrics import timed
 
 logger = logging.getLogger(__name__)
 
+LEGACY_CURSOR_PREFIX = "legacy:"
+
 class DataStorageService:
-    def __init__(self, blob_storage_service, base_dir="data"):
+    def __init__(self, blob_storage_service, base_dir="data", audio_index=None, sync_worker=None, max_dedup_hints=30,
+                 blob_prefix="words", snapshot_chunk_items=256, snapshots_dir=None, legacy_snapshots=None):
         self.blob_storage = blob_storage_service
+        self.sync_worker = sync_worker
         self.base_dir = base_dir
         self.words_dir = os.path.join(base_dir, "words")
         self.session_file = os.path.join(self.words_dir, "session.json")
+        self.session_log = os.path.join(self.words_dir, "session.jsonl")
+        self.blob_prefix = blob_prefix
+        self.session_blob_name = f"{blob_prefix}/session.json"
+        self._lock = threading.Lock()
+        self._translations = []
+        self._updated_at = None
+        self.english_index = DedupIndex(max_dedup_hints)
+        self.odia_index = DedupIndex(max_dedup_hints)
+        self.snapshots = SnapshotStore(
+            snapshots_dir or os.path.join(self.words_dir, "snapshots"), blob_storage_service, blob_prefix,
+            snapshot_chunk_items)
+        # Saves imported from before sessions existed, shown to every session after its own
+        self.legacy_snapshots = legacy_snapshots
         self._ensure_directories()
+        self._load_session_log()
+        self.audio_index = audio_index or AudioIndex(
+            blob_storage_service, os.path.join(self.words_dir, 'audio_map.json'))
 
     def _ensure_directories(self):
         """Ensure necessary directories exist"""
         os.makedirs(self.words_dir, exist_ok=True)
 
+    @timed("session_load")
+    def _load_session_log(self):
+        """Rebuild the in-memory session index from the append-only log"""
+        try:
+            if not os.path.exists(self.session_log):
+                # Migrate a session written in the old single-file format
+                if os.path.exists(self.session_file):
+                    with open(self.session_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    self._append_to_log(data.get('translations', []))
+                return
+
+            self._truncate_partial_line()
+            with open(self.session_log, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self._translations.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping unreadable session log line {line_number}")
+
+            self._index_translations(self._translations)
+
+            self._updated_at = datetime.utcfromtimestamp(os.path.getmtime(self.session_log))
+            logger.info(f"Loaded {len(self._translations)} translations from session log")
+        except Exception as e:
+            logger.error(f"Error loading session log: {e}")
+
+    def _truncate_partial_line(self):
+        """Drop a partially written last line so new appends start on a clean line"""
+        with open(self.session_log, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                logger.warning("Dropping partially written line at the end of the session log")
+                f.truncate(data.rfind(b'\n') + 1)
+
+    def _index_translations(self, translations):
+        """Feed translations into the dedup indexes"""
+        self.english_index.add(t.get('english') for t in translations if isinstance(t, dict))
+        self.odia_index.add(t.get('odia') for t in translations if isinstance(t, dict))
+
+    @timed("session_append")
+    def _append_to_log(self, translations, dedup_key=None):
+        """
+        Append a batch to the session log and the in-memory index
+        With dedup_key ('english' or 'odia'), items the session already has are dropped first,
+        under the same lock as the append, so concurrent requests cannot both add the same item
+        Returns the translations that were appended
+        """
+        with self._lock:
+            if dedup_key is not None:
+                index = self.english_index if dedup_key == 'english' else self.odia_index
+                translations = index.filter_new(
+                    translations, key=lambda t: t.get(dedup_key) if isinstance(t, dict) else None)
+            if translations:
+                lines = ''.join(json.dumps(t, ensure_ascii=False) + '\n' for t in translations)
+                with open(self.session_log, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+                self._translations.extend(translations)
+                self._updated_at = datetime.utcnow()
+                self._index_translations(translations)
+        return translations
+
     def get_existing_words(self):
         """
         Get existing English words from the current session
         """
-        try:
-            if os.path.exists(self.session_file):
-                with open(self.session_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return [t['english'] for t in data.get('translations', [])]
-            return []
-        except Exception as e:
-            logger.error(f"Error reading existing words: {e}")
-            return []
+        with self._lock:
+            return [t['english'] for t in self._translations]
+
+    @timed("session_export")
+    def export_session(self):
+        """
+        Compact the session log into session.json
+        Returns the path of the exported file
+        """
+        with self._lock:
+            session_data = {
+                "timestamp": (self._updated_at or datetime.utcnow()).isoformat(),
+                "translations": list(self._translations)
+            }
+
+        # Write to a temp file first so concurrent exports never see a half-written file
+        tmp_file = f"{self.session_file}.{threading.get_ident()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(session_data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, self.session_file)
+
+        return self.session_file
 
     def save_session_data(self, translations, save_to_blob=True):
         """
-        Append new translations to session.json
+        Append new translations to the session log
         Returns the paths/urls where the data was saved
         """
-        try:
-            # Load existing translations if any
-            existing_translations = []
-            if os.path.exists(self.session_file):
-                with open(self.session_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    existing_translations = data.get('translations', [])
+        return self._save(translations, save_to_blob)[1]
 
-            # Combine existing and new translations
-            all_translations = existing_translations + translations
-
-            # Create session data with timestamp
-            session_data = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "translations": all_translations
-            }
+    def save_new_translations(self, translations, dedup_key, save_to_blob=True):
+        """
+        Append only the translations whose dedup_key field ('english' or 'odia') is new to the session
+        Returns (saved translations, storage info)
+        """
+        return self._save(translations, save_to_blob, dedup_key)
 
-            # Save updated session file
-            with open(self.session_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, ensure_ascii=False, indent=2)
-            
-            logger.info(f"Session data saved to: {self.session_file}")
+    def _save(self, translations, save_to_blob=True, dedup_key=None):
+        try:
+            requested = len(translations)
+            translations = self._append_to_log(translations, dedup_key)
+            logger.info(f"Appended {len(translations)} translations to: {self.session_log}")
+            if len(translations) < requested:
+                logger.info(f"Dropped {requested - len(translations)} translations already in the session")
             
-            blob_url = None
-            if save_to_blob:
-                # Save to blob storage
-                blob_name = "words/session.json"
-                blob_url = self.blob_storage.upload_file(self.session_file, blob_name)
-                logger.info(f"Session data saved to blob storage: {blob_url}")
-
-            return {
-                "local_path": self.session_file,
-                "blob_url": blob_url
+            storage_info = {
+                "local_path": self.session_log,
+                "blob_url": None
             }
+            if save_to_blob and translations:
+                if self.sync_worker is not None:
+                    # Upload happens in the background; report where it stands
+                    sync_status = self.sync_worker.mark_dirty(self)
+                    storage_info["blob_url"] = sync_status["blob_url"]
+                    storage_info["blob_sync"] = sync_status
+                else:
+                    blob_url = self.blob_storage.upload_file(self.export_session(), self.session_blob_name)
+                    storage_info["blob_url"] = blob_url
+                    logger.info(f"Session data saved to blob storage: {blob_url}")
+
+            return translations, storage_info
 
         except Exception as e:
             logger.error(f"Error saving session data: {e}")
@@ -79,91 +180,99 @@ class DataStorageService:
 
     def save_permanent_copy(self):
         """
-        Save a permanent copy of the current session file with timestamp
+        Save a snapshot of the current session
+        Only chunks of the log not already stored by an earlier save are written
         """
         try:
-            if not os.path.exists(self.session_file):
+            with self._lock:
+                translations = list(self._translations)
+            if not translations:
                 raise FileNotFoundError("No active session file found")
 
-            # Generate filename with datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_filename = f"saved_{timestamp}.json"
-            save_path = os.path.join(self.words_dir, save_filename)
+            snapshot = self.snapshots.save(translations)
+            logger.info(f"Session saved permanently as snapshot {snapshot['id']}")
 
-            # Copy session file to saved file
-            shutil.copy2(self.session_file, save_path)
-            
-            # Upload to blob if session was in blob
-            blob_url = None
-            try:
-                blob_name = f"words/{save_filename}"
-                blob_url = self.blob_storage.upload_file(save_path, blob_name)
-                logger.info(f"Saved session data to blob storage: {blob_url}")
-            except Exception as e:
-                logger.warning(f"Failed to save to blob storage: {e}")
-
-            logger.info(f"Session saved permanently to: {save_path}")
-            
             return {
-                "local_path": save_path,
-                "blob_url": blob_url
+                "local_path": snapshot.pop("local_path"),
+                "blob_url": snapshot.pop("blob_url"),
+                "snapshot": snapshot
             }
 
         except Exception as e:
             logger.error(f"Error saving permanent copy: {e}")
             raise
 
-    def list_saved_files(self):
+    @staticmethod
+    def _parse_cursor(cursor):
+        """(session cursor, legacy cursor) for a /sessions cursor; at most one of them is set"""
+        if not cursor:
+            return None, None
+        if cursor.startswith(LEGACY_CURSOR_PREFIX):
+            legacy_cursor = int(cursor[len(LEGACY_CURSOR_PREFIX):])
+            if legacy_cursor < 0:
+                raise ValueError(cursor)
+            return None, legacy_cursor
+        session_cursor = int(cursor)
+        if session_cursor < 0:
+            raise ValueError(cursor)
+        return session_cursor, None
+
+    def list_saved_files(self, limit=20, cursor=None):
         """
-        List all saved session files (excluding current session.json)
+        One page of saved snapshots, newest first, from the snapshot catalogs:
+        the session's own snapshots, then the imported legacy saves
+        Returns (snapshots, next_cursor); next_cursor is an opaque string, None on the last page
+        Raises ValueError for a cursor that did not come from an earlier page
         """
         try:
-            files = []
-            for filename in os.listdir(self.words_dir):
-                if filename.startswith('saved_') and filename.endswith('.json'):
-                    file_path = os.path.join(self.words_dir, filename)
-                    files.append({
-                        "filename": filename,
-                        "path": file_path,
-                        "timestamp": os.path.getmtime(file_path)
-                    })
-            return sorted(files, key=lambda x: x["timestamp"], reverse=True)
+            session_cursor, legacy_cursor = self._parse_cursor(cursor)
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor}") from None
+
+        try:
+            if legacy_cursor is not None:
+                snapshots = []
+            else:
+                snapshots, next_cursor = self.snapshots.list_page(limit, session_cursor)
+                if next_cursor is not None:
+                    return snapshots, str(next_cursor)
+
+            if self.legacy_snapshots is None or not self.legacy_snapshots.count():
+                return snapshots, None
+            if len(snapshots) == limit:
+                return snapshots, f"{LEGACY_CURSOR_PREFIX}{self.legacy_snapshots.count()}"
+            legacy, next_cursor = self.legacy_snapshots.list_page(limit - len(snapshots), legacy_cursor)
+            snapshots.extend(dict(entry, legacy=True) for entry in legacy)
+            return snapshots, (f"{LEGACY_CURSOR_PREFIX}{next_cursor}" if next_cursor is not None else None)
         except Exception as e:
             logger.error(f"Error listing saved files: {e}")
-            raise 
+            raise
+
+    def get_saved_session(self, snapshot_id: str):
+        """A saved snapshot with all of its translations, or None"""
+        snapshot = self.snapshots.materialize(snapshot_id)
+        if snapshot is None and self.legacy_snapshots is not None:
+            snapshot = self.legacy_snapshots.materialize(snapshot_id)
+        return snapshot
+
+    def get_translations_page(self, offset=0, limit=500):
+        """
+        One page of the session's translations in the order they were added
+        Returns (translations, total); the log only grows, so an offset always points at the same item
+        """
+        with self._lock:
+            return self._translations[offset:offset + limit], len(self._translations)
 
     def get_all_translations(self):
         """Get all translations from the current session"""
-        try:
-            if os.path.exists(self.session_file):
-                with open(self.session_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('translations', [])
-            return []
-        except Exception as e:
-            logger.error(f"Error reading translations: {e}")
-            return [] 
+        with self._lock:
+            return list(self._translations)
 
     def save_audio_url(self, odia_text: str, audio_url: str):
         """Save audio URL mapping for an Odia word"""
         try:
-            audio_map = {}
-            audio_map_file = os.path.join(self.words_dir, 'audio_map.json')
-            
-            # Load existing mappings if any
-            if os.path.exists(audio_map_file):
-                with open(audio_map_file, 'r', encoding='utf-8') as f:
-                    audio_map = json.load(f)
-            
-            # Add new mapping
-            audio_map[odia_text] = audio_url
-            
-            # Save updated mappings
-            with open(audio_map_file, 'w', encoding='utf-8') as f:
-                json.dump(audio_map, f, ensure_ascii=False, indent=2)
-                
+            self.audio_index.put(odia_text, audio_url)
             logger.info(f"Audio URL saved for: {odia_text}")
-            
         except Exception as e:
             logger.error(f"Error saving audio URL: {e}")
             raise
@@ -171,12 +280,7 @@ class DataStorageService:
     def get_audio_url(self, odia_text: str) -> str:
         """Get cached audio URL for an Odia word if it exists"""
         try:
-            audio_map_file = os.path.join(self.words_dir, 'audio_map.json')
-            if os.path.exists(audio_map_file):
-                with open(audio_map_file, 'r', encoding='utf-8') as f:
-                    audio_map = json.load(f)
-                    return audio_map.get(odia_text)
-            return None
+            return self.audio_index.get(odia_text)
         except Exception as e:
             logger.error(f"Error getting audio URL: {e}")
-            return None 
\ No newline at end of file
+            return None
\ No newline at end of file
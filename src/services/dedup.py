@@ -0,0 +1,64 @@
+import threading
+import unicodedata
+from collections import deque
+
+class DedupIndex:
+    """
+    Local index of items already in a session.
+    Holds an exact set plus a normalized-form set so repeats can be filtered after
+    generation, and keeps a short list of recent items to hint the model with.
+    """
+    def __init__(self, max_hints=30):
+        self.max_hints = max_hints
+        self._exact = set()
+        self._normalized = set()
+        self._recent = deque(maxlen=max_hints)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Case-fold, drop punctuation and collapse whitespace"""
+        text = unicodedata.normalize("NFC", text).casefold()
+        text = "".join(ch for ch in text if not unicodedata.category(ch).startswith("P"))
+        return " ".join(text.split())
+
+    def add(self, items):
+        """Add items to the index"""
+        with self._lock:
+            for item in items:
+                if not isinstance(item, str) or not item.strip():
+                    continue
+                normalized = self.normalize(item)
+                if item not in self._exact and normalized not in self._normalized:
+                    self._recent.append(item)
+                self._exact.add(item)
+                self._normalized.add(normalized)
+
+    def contains(self, item: str) -> bool:
+        """Whether the item, or an equivalent form of it, is already indexed"""
+        with self._lock:
+            return item in self._exact or self.normalize(item) in self._normalized
+
+    def filter_new(self, items, key=None):
+        """Drop items already in the index and repeats within the batch itself"""
+        seen = set()
+        new_items = []
+        for item in items:
+            value = key(item) if key else item
+            if not isinstance(value, str):
+                continue
+            normalized = self.normalize(value)
+            if normalized in seen or self.contains(value):
+                continue
+            seen.add(normalized)
+            new_items.append(item)
+        return new_items
+
+    def hints(self):
+        """The most recent items, bounded by max_hints"""
+        with self._lock:
+            return list(self._recent)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._normalized)
@@ -0,0 +1,169 @@
+import json
+import re
+import logging
+from collections import namedtuple
+from services.metrics import timed, JSON_SALVAGE
+
+logger = logging.getLogger(__name__)
+
+ArrayParseResult = namedtuple("ArrayParseResult", ["items", "salvaged", "repaired", "dropped", "complete"])
+
+# A backslash that does not start a valid JSON escape sequence
+_INVALID_ESCAPE = re.compile(r'\\(?!["\\/bfnrtu])')
+# A trailing comma right before a closing brace or bracket
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+
+def _repair_element(text):
+    """Try progressively looser fixes for one malformed array element"""
+    candidates = [
+        _INVALID_ESCAPE.sub('', text),
+        _TRAILING_COMMA.sub(r'\1', text),
+    ]
+
+    if text.startswith("'") and text.endswith("'") and len(text) >= 2:
+        candidates.append(json.dumps(text[1:-1]))
+    if text.startswith('"') and text.endswith('"') and len(text) >= 2:
+        # Stray quotes or backslashes inside a string item
+        candidates.append(json.dumps(text[1:-1].replace('"', '').replace('\\', '')))
+    if text[0] not in '"{[\'' and '"' not in text:
+        # A bare, unquoted word
+        candidates.append(json.dumps(text))
+
+    for candidate in candidates:
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+    raise ValueError(f"Unrecoverable array element: {text!r}")
+
+class JsonArrayStreamParser:
+    """
+    Incremental, tolerant parser for a top-level JSON array arriving in chunks.
+    feed() returns every array element completed by the new text, so callers can
+    act on items while the rest of the response is still streaming in. Malformed
+    elements are repaired where possible and skipped otherwise, and a truncated
+    response still yields every element that was complete.
+    """
+    def __init__(self):
+        self._buffer = []
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.items_parsed = 0
+        self.repaired = 0
+        self.dropped = 0
+
+    @property
+    def finished(self):
+        return self._finished
+
+    def _complete_element(self, elements):
+        text = "".join(self._buffer).strip()
+        self._buffer = []
+        if not text:
+            return
+        try:
+            elements.append(json.loads(text))
+        except json.JSONDecodeError:
+            try:
+                elements.append(_repair_element(text))
+                self.repaired += 1
+            except ValueError as e:
+                self.dropped += 1
+                logger.warning(f"Skipping array element: {e}")
+                return
+        self.items_parsed += 1
+
+    def feed(self, chunk: str):
+        """Consume more text and return the array elements it completed"""
+        elements = []
+        for ch in chunk:
+            if self._finished:
+                break
+
+            if not self._started:
+                # Ignore anything before the opening bracket
+                if ch == '[':
+                    self._started = True
+                continue
+
+            if self._in_string:
+                self._buffer.append(ch)
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in '[{':
+                self._depth += 1
+            elif ch in ']}':
+                if self._depth == 0 and ch == ']':
+                    self._complete_element(elements)
+                    self._finished = True
+                    continue
+                self._depth -= 1
+            elif ch == ',' and self._depth == 0:
+                self._complete_element(elements)
+                continue
+            elif ch == '\n' and self._depth == 0:
+                continue
+
+            self._buffer.append(ch)
+
+        return elements
+
+    def close(self):
+        """
+        Signal the end of input and return any final element a truncated response left behind
+        An element cut off mid-way is dropped rather than guessed at
+        """
+        elements = []
+        if self._started and not self._finished:
+            if self._in_string or self._depth:
+                if "".join(self._buffer).strip():
+                    self.dropped += 1
+                self._buffer = []
+            else:
+                self._complete_element(elements)
+            self._finished = True
+        return elements
+
+@timed("json_parse")
+def parse_json_array(text: str):
+    """
+    Parse a model response that should be a JSON array, salvaging what it can
+    Returns an ArrayParseResult; salvaged counts items recovered from output that was not valid JSON
+    """
+    text = text.strip()
+    try:
+        items = json.loads(text)
+        if isinstance(items, list):
+            return ArrayParseResult(items, 0, 0, 0, True)
+    except json.JSONDecodeError:
+        pass
+
+    if '[' not in text and text.startswith(('"', '{')):
+        # Items without the surrounding brackets
+        text = '[' + text
+
+    parser = JsonArrayStreamParser()
+    items = parser.feed(text)
+    complete = parser.finished
+    items.extend(parser.close())
+
+    JSON_SALVAGE.inc(len(items), result="salvaged")
+    JSON_SALVAGE.inc(parser.repaired, result="repaired")
+    JSON_SALVAGE.inc(parser.dropped, result="dropped")
+    if items:
+        logger.info(
+            f"Salvaged {len(items)} items from malformed JSON array "
+            f"({parser.repaired} repaired, {parser.dropped} dropped, {'complete' if complete else 'truncated'})"
+        )
+    return ArrayParseResult(items, len(items), parser.repaired, parser.dropped, complete)
@@ -0,0 +1,242 @@
+import time
+import types
+import threading
+import functools
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Seconds; spans run from sub-millisecond file appends to multi-second model calls
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        return [f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(values.items())]
+
+class Gauge(_Metric):
+    """Gauge whose values are computed when scraped"""
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), collect=None):
+        super().__init__(name, documentation, labelnames)
+        self.collect = collect
+
+    def samples(self):
+        values = self.collect() if self.collect else {}
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(values.items())]
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][i] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+
+    def samples(self):
+        with self._lock:
+            values = {key: {"counts": list(state["counts"]), "sum": state["sum"], "count": state["count"]}
+                      for key, state in self._values.items()}
+        lines = []
+        for key, state in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, state["counts"]):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [("le", _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state['sum'])}")
+            lines.append(f"{self.name}_count{labels} {state['count']}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                logger.error(f"Error collecting metric {metric.name}: {e}")
+                continue
+            lines.extend(metric.header())
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "odia_stage_duration_seconds", "Time spent in each stage of request handling", ["stage"]))
+HTTP_SECONDS = REGISTRY.register(Histogram(
+    "odia_http_request_duration_seconds", "HTTP request latency by endpoint", ["endpoint", "method", "status"]))
+LLM_SECONDS = REGISTRY.register(Histogram(
+    "odia_llm_request_duration_seconds", "Chat completion latency by service and model", ["service", "model"]))
+LLM_REQUESTS = REGISTRY.register(Counter(
+    "odia_llm_requests", "Chat completion requests by service, model and outcome", ["service", "model", "outcome"]))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "odia_llm_tokens", "Tokens reported in completion.usage", ["service", "model", "kind"]))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "odia_cache_requests", "Cache lookups by cache and result", ["cache", "result"]))
+SINGLE_FLIGHT = REGISTRY.register(Counter(
+    "odia_single_flight_calls", "Calls that did the work (leader) or shared an identical in-flight call (coalesced)",
+    ["flight", "role"]))
+JSON_SALVAGE = REGISTRY.register(Counter(
+    "odia_json_salvage_items", "Items recovered from, or dropped out of, malformed model JSON", ["result"]))
+
+def _cache_hit_ratios():
+    with CACHE_REQUESTS._lock:
+        values = dict(CACHE_REQUESTS._values)
+    totals = {}
+    for (cache, result), count in values.items():
+        hits, lookups = totals.get(cache, (0, 0))
+        totals[cache] = (hits + (count if result == "hit" else 0), lookups + count)
+    return {(cache,): hits / lookups for cache, (hits, lookups) in totals.items() if lookups}
+
+REGISTRY.register(Gauge(
+    "odia_cache_hit_ratio", "Share of cache lookups that were hits since startup", ["cache"], _cache_hit_ratios))
+
+@contextmanager
+def span(stage):
+    """Time a block of work as one stage"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage=stage)
+
+def timed(stage):
+    """Decorator form of span()"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_cache(cache, hits=0, misses=0):
+    if hits:
+        CACHE_REQUESTS.inc(hits, cache=cache, result="hit")
+    if misses:
+        CACHE_REQUESTS.inc(misses, cache=cache, result="miss")
+
+def record_usage(service, model, completion):
+    usage = getattr(completion, "usage", None)
+    if usage is None:
+        return
+    LLM_TOKENS.inc(getattr(usage, "prompt_tokens", 0) or 0, service=service, model=model, kind="prompt")
+    LLM_TOKENS.inc(getattr(usage, "completion_tokens", 0) or 0, service=service, model=model, kind="completion")
+
+class _InstrumentedCompletions:
+    def __init__(self, completions, service, is_async):
+        self._completions = completions
+        self._service = service
+        self._is_async = is_async
+
+    def _observe(self, model, start, outcome, completion=None):
+        LLM_SECONDS.observe(time.perf_counter() - start, service=self._service, model=model)
+        LLM_REQUESTS.inc(service=self._service, model=model, outcome=outcome)
+        if completion is not None:
+            record_usage(self._service, model, completion)
+
+    def create(self, **kwargs):
+        if self._is_async:
+            return self._acreate(**kwargs)
+        model = kwargs.get("model", "unknown")
+        start = time.perf_counter()
+        try:
+            completion = self._completions.create(**kwargs)
+        except Exception:
+            self._observe(model, start, "error")
+            raise
+        # A stream returns right away; its duration here is time to the response headers
+        self._observe(model, start, "ok", None if kwargs.get("stream") else completion)
+        return completion
+
+    async def _acreate(self, **kwargs):
+        model = kwargs.get("model", "unknown")
+        start = time.perf_counter()
+        try:
+            completion = await self._completions.create(**kwargs)
+        except Exception:
+            self._observe(model, start, "error")
+            raise
+        self._observe(model, start, "ok", None if kwargs.get("stream") else completion)
+        return completion
+
+class InstrumentedClient:
+    """
+    Wraps an OpenAI (or AsyncOpenAI) client so every chat completion is timed and its
+    token usage counted under the given service name
+    """
+    def __init__(self, client, service, is_async=False):
+        self._client = client
+        self.chat = types.SimpleNamespace(completions=_InstrumentedCompletions(client.chat.completions, service, is_async))
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
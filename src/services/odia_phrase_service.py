@@ -1,137 +1,405 @@
-from openai import OpenAI
-import json
+from openai import OpenAI, AsyncOpenAI
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
+import time
+from services.json_stream import parse_json_array
+from services.romanization import OdiaTransliterator
+from services.dedup import DedupIndex
 
 logger = logging.getLogger(__name__)
 
 class OdiaPhraseService:
-    def __init__(self, client: OpenAI, config: dict, model_configs: dict):
+    def __init__(self, client: OpenAI, config: dict, model_configs: dict, async_client: AsyncOpenAI = None):
         self.client = client
+        self.async_client = async_client
         self.config = config
         self.model_configs = model_configs
         self.model = config["models"]["word_generation"]  # using same model config
+        phrase_config = config.get("phrases", {})
+        self.mode = phrase_config.get("mode", "pipeline")
+        self.structured_model = config["models"].get("phrase_structured", self.model)
+        self.concurrent_pipeline = phrase_config.get("concurrent_pipeline", False)
+        romanization_config = config.get("romanization", {})
+        self.romanization_engine = romanization_config.get("engine", "llm")
+        self.romanization_llm_fallback = romanization_config.get("llm_fallback", True)
+        self.transliterator = OdiaTransliterator()
+        # Only the romanize stage goes to the pool; translation runs in the calling thread
+        self._executor = ThreadPoolExecutor(
+            max_workers=phrase_config.get("stage_workers", 8), thread_name_prefix="phrase-stage"
+        ) if self.concurrent_pipeline else None
+        generation_config = config.get("generation", {})
+        self.batch_size = generation_config.get("batch_size", 10)
+        self.overgenerate = generation_config.get("overgenerate", 0)
+        self._usage_lock = threading.Lock()
+        self.generate_calls = 0
+        self.prompt_tokens = 0
 
     def get_model_config(self):
         return self.model_configs.get(self.model, {})
 
+    def _record_usage(self, completion):
+        """Track prompt tokens spent per generate call"""
+        usage = getattr(completion, "usage", None)
+        with self._usage_lock:
+            self.generate_calls += 1
+            self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+
+    def get_prompt_token_stats(self):
+        with self._usage_lock:
+            return {
+                "generate_calls": self.generate_calls,
+                "prompt_tokens": self.prompt_tokens,
+                "prompt_tokens_per_generate": round(self.prompt_tokens / self.generate_calls, 1) if self.generate_calls else 0
+            }
+
     def validate_odia_text(self, text):
         """Check if text contains Odia characters"""
         # Odia Unicode range: 0B00-0B7F
         return any('\u0B00' <= char <= '\u0B7F' for char in text)
 
-    def generate_odia_phrases(self, existing_phrases=None):
-        """Generate Odia phrases"""
+    def _phrase_request(self, existing_phrases, dedup):
         from prompts.prompts_class import OdiaPhraseGeneration
+
+        count = self.batch_size
+        if dedup is not None:
+            existing_phrases = dedup.hints()
+            count += self.overgenerate
+
+        return dict(
+            messages=OdiaPhraseGeneration.get_messages(existing_phrases, count),
+            model=self.model,
+            **self.get_model_config()
+        )
+
+    def _parse_phrases(self, completion, dedup):
+        self._record_usage(completion)
+
+        odia_phrases = parse_json_array(completion.choices[0].message.content).items
+        if not odia_phrases:
+            raise ValueError("Expected a JSON array of Odia phrases")
         
+        valid_phrases = [phrase for phrase in odia_phrases if self.validate_odia_text(phrase)]
+        if dedup is not None:
+            valid_phrases = dedup.filter_new(valid_phrases)[:self.batch_size]
+        if not valid_phrases:
+            raise ValueError("No valid Odia phrases generated")
+        
+        return valid_phrases
+
+    def generate_odia_phrases(self, existing_phrases=None, dedup=None):
+        """Generate Odia phrases"""
         try:
-            completion = self.client.chat.completions.create(
-                messages=OdiaPhraseGeneration.get_messages(existing_phrases),
-                model=self.model,
-                **self.get_model_config()
-            )
+            completion = self.client.chat.completions.create(**self._phrase_request(existing_phrases, dedup))
+            return self._parse_phrases(completion, dedup)
+
+        except Exception as e:
+            logger.error(f"Error generating Odia phrases: {str(e)}")
+            raise
 
-            odia_phrases = json.loads(completion.choices[0].message.content.strip())
-            if not isinstance(odia_phrases, list):
-                raise ValueError("Expected a JSON array of Odia phrases")
-            
-            valid_phrases = [phrase for phrase in odia_phrases if self.validate_odia_text(phrase)]
-            if not valid_phrases:
-                raise ValueError("No valid Odia phrases generated")
-            
-            return valid_phrases
+    async def agenerate_odia_phrases(self, existing_phrases=None, dedup=None):
+        try:
+            completion = await self.async_client.chat.completions.create(**self._phrase_request(existing_phrases, dedup))
+            return self._parse_phrases(completion, dedup)
 
         except Exception as e:
             logger.error(f"Error generating Odia phrases: {str(e)}")
             raise
 
-    def translate_to_english(self, odia_phrases):
-        """Translate Odia phrases to English"""
+    def _translation_request(self, odia_phrases):
         from prompts.prompts_class import EnglishTranslation
         
         valid_phrases = [phrase for phrase in odia_phrases if self.validate_odia_text(phrase)]
         if not valid_phrases:
             raise ValueError("No valid Odia phrases to translate")
-            
+
+        return dict(
+            messages=EnglishTranslation.get_messages(valid_phrases),
+            model=self.model,
+            **self.get_model_config()
+        )
+
+    @staticmethod
+    def _parse_translations(completion):
+        translations = parse_json_array(completion.choices[0].message.content).items
+        if not translations:
+            raise ValueError("Expected a JSON array of translations")
+        
+        return translations
+
+    def translate_to_english(self, odia_phrases):
+        """Translate Odia phrases to English"""
+        request = self._translation_request(odia_phrases)
         try:
-            completion = self.client.chat.completions.create(
-                messages=EnglishTranslation.get_messages(valid_phrases),
-                model=self.model,
-                **self.get_model_config()
-            )
+            return self._parse_translations(self.client.chat.completions.create(**request))
 
-            translations = json.loads(completion.choices[0].message.content.strip())
-            if not isinstance(translations, list):
-                raise ValueError("Expected a JSON array of translations")
-            
-            return translations
+        except Exception as e:
+            logger.error(f"Error translating to English: {str(e)}")
+            raise
+
+    async def atranslate_to_english(self, odia_phrases):
+        request = self._translation_request(odia_phrases)
+        try:
+            return self._parse_translations(await self.async_client.chat.completions.create(**request))
 
         except Exception as e:
             logger.error(f"Error translating to English: {str(e)}")
             raise
 
+    def _romanize_locally(self, odia_phrases):
+        """
+        Romanize with the local tables
+        Returns the entries and the phrases the tables could not fully map
+        """
+        valid_odia = [phrase for phrase in odia_phrases if self.validate_odia_text(phrase)]
+        if not valid_odia:
+            raise ValueError("No valid Odia text found to romanize")
+
+        romanized = [
+            {"odia": phrase, "romanized": text}
+            for phrase, text in zip(valid_odia, self.transliterator.romanize_batch(valid_odia))
+        ]
+
+        unmapped = [entry["odia"] for entry in romanized if self.transliterator.has_unmapped(entry["romanized"])]
+        if unmapped and self.romanization_llm_fallback:
+            logger.info(f"Falling back to the model to romanize {len(unmapped)} phrases")
+            return romanized, unmapped
+        return romanized, []
+
+    @staticmethod
+    def _apply_fallback(romanized, fallback_entries):
+        fallback = {entry["odia"]: entry for entry in fallback_entries}
+        return [fallback.get(entry["odia"], entry) for entry in romanized]
+
     def generate_romanized(self, odia_phrases):
         """Generate romanized versions of Odia phrases"""
+        if self.romanization_engine != "local":
+            return self.generate_romanized_llm(odia_phrases)
+
+        romanized, unmapped = self._romanize_locally(odia_phrases)
+
+        # Hand anything the tables could not fully map to the model
+        if unmapped:
+            romanized = self._apply_fallback(romanized, self.generate_romanized_llm(unmapped))
+
+        return romanized
+
+    async def agenerate_romanized(self, odia_phrases):
+        if self.romanization_engine != "local":
+            return await self.agenerate_romanized_llm(odia_phrases)
+
+        romanized, unmapped = self._romanize_locally(odia_phrases)
+        if unmapped:
+            romanized = self._apply_fallback(romanized, await self.agenerate_romanized_llm(unmapped))
+
+        return romanized
+
+    def _romanize_request(self, odia_phrases):
         from prompts.prompts_class import RomanizedGeneration
         
         valid_odia = [phrase for phrase in odia_phrases if self.validate_odia_text(phrase)]
         if not valid_odia:
             raise ValueError("No valid Odia text found to romanize")
+
+        return dict(
+            messages=RomanizedGeneration.get_messages(valid_odia),
+            model=self.model,
+            **self.get_model_config()
+        )
+
+    @staticmethod
+    def _parse_romanized(completion):
+        romanized = parse_json_array(completion.choices[0].message.content).items
+        if not romanized:
+            raise ValueError("Expected a JSON array of romanized texts")
+        
+        valid_romanized = [entry for entry in romanized 
+                         if isinstance(entry, dict) and 'odia' in entry and 'romanized' in entry]
         
+        if not valid_romanized:
+            raise ValueError("No valid romanized entries found in response")
+        
+        return valid_romanized
+
+    def generate_romanized_llm(self, odia_phrases):
+        """Generate romanized versions of Odia phrases with the model"""
+        request = self._romanize_request(odia_phrases)
         try:
-            completion = self.client.chat.completions.create(
-                messages=RomanizedGeneration.get_messages(valid_odia),
-                model=self.model,
-                **self.get_model_config()
-            )
+            return self._parse_romanized(self.client.chat.completions.create(**request))
 
-            romanized = json.loads(completion.choices[0].message.content.strip())
-            if not isinstance(romanized, list):
-                raise ValueError("Expected a JSON array of romanized texts")
-            
-            valid_romanized = [entry for entry in romanized 
-                             if isinstance(entry, dict) and 'odia' in entry and 'romanized' in entry]
-            
-            if not valid_romanized:
-                raise ValueError("No valid romanized entries found in response")
-            
-            return valid_romanized
+        except Exception as e:
+            logger.error(f"Error generating romanized versions: {str(e)}")
+            raise
+
+    async def agenerate_romanized_llm(self, odia_phrases):
+        request = self._romanize_request(odia_phrases)
+        try:
+            return self._parse_romanized(await self.async_client.chat.completions.create(**request))
 
         except Exception as e:
             logger.error(f"Error generating romanized versions: {str(e)}")
             raise
 
-    def process_phrases(self, existing_phrases=None):
+    def _timed(self, timings, stage, func, *args):
+        """Run a pipeline stage and record how long it took"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            timings[stage] = time.perf_counter() - start
+
+    async def _atimed(self, timings, stage, coro):
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[stage] = time.perf_counter() - start
+
+    @staticmethod
+    def _index_by_odia(entries, field):
+        """Map each entry's normalized Odia text to the entry, keeping the first of any repeats"""
+        by_odia = {}
+        for entry in entries:
+            if isinstance(entry, dict) and isinstance(entry.get("odia"), str) and isinstance(entry.get(field), str):
+                by_odia.setdefault(DedupIndex.normalize(entry["odia"]), entry)
+        return by_odia
+
+    def combine_results(self, odia_phrases, translations, romanized):
+        """
+        Merge generated phrases with their translations and romanizations
+        Entries are matched on their odia field rather than by position, since the parser
+        may drop a malformed element; a phrase missing either half is left out
+        """
+        translations_by_odia = self._index_by_odia(translations, "english")
+        romanized_by_odia = self._index_by_odia(romanized, "romanized")
+
+        combined = []
+        for odia_phrase in odia_phrases:
+            key = DedupIndex.normalize(odia_phrase)
+            translation = translations_by_odia.get(key)
+            romanization = romanized_by_odia.get(key)
+            if translation is None or romanization is None:
+                logger.info(f"Dropping phrase without a matching translation or romanization: {odia_phrase}")
+                continue
+
+            entry = {
+                "english": translation["english"].strip(),
+                "odia": odia_phrase.strip(),
+                "romanized_odia": romanization["romanized"].strip()
+            }
+            if all(entry.values()):
+                combined.append(entry)
+
+        return combined
+
+    def process_phrases(self, existing_phrases=None, dedup=None):
+        """Generate phrases with translations using the configured mode"""
+        if self.mode == "structured":
+            return self.process_phrases_structured(existing_phrases, dedup)
+        return self.process_phrases_pipeline(existing_phrases, dedup)
+
+    async def aprocess_phrases(self, existing_phrases=None, dedup=None):
+        """Async variant of process_phrases using the AsyncOpenAI client"""
+        if self.mode == "structured":
+            return await self.aprocess_phrases_structured(existing_phrases, dedup)
+        return await self.aprocess_phrases_pipeline(existing_phrases, dedup)
+
+    def _structured_request(self, existing_phrases, dedup):
+        from prompts.prompts_class import StructuredPhraseGeneration
+
+        count = self.batch_size
+        if dedup is not None:
+            existing_phrases = dedup.hints()
+            count += self.overgenerate
+
+        return dict(
+            messages=StructuredPhraseGeneration.get_messages(existing_phrases, count),
+            model=self.structured_model,
+            response_format=StructuredPhraseGeneration.get_response_format(),
+            **self.model_configs.get(self.structured_model, {})
+        )
+
+    def _parse_structured(self, completion, dedup):
+        self._record_usage(completion)
+
+        # The schema wraps the cards in {"phrases": [...]}; the parser finds the array
+        cards = parse_json_array(completion.choices[0].message.content).items
+
+        combined = []
+        for card in cards:
+            if not isinstance(card, dict):
+                continue
+            entry = {
+                "english": str(card.get("english", "")).strip(),
+                "odia": str(card.get("odia", "")).strip(),
+                "romanized_odia": str(card.get("romanized_odia", "")).strip()
+            }
+            if all(entry.values()) and self.validate_odia_text(entry["odia"]):
+                combined.append(entry)
+
+        if dedup is not None:
+            combined = dedup.filter_new(combined, key=lambda entry: entry["odia"])
+        combined = combined[:self.batch_size]
+
+        if not combined:
+            raise ValueError("No complete valid entries were generated")
+
+        logger.info(f"Generated {len(combined)} complete phrases")
+        return combined
+
+    def process_phrases_structured(self, existing_phrases=None, dedup=None):
+        """Generate complete phrase cards with a single schema-constrained call"""
+        start = time.perf_counter()
+        try:
+            completion = self.client.chat.completions.create(**self._structured_request(existing_phrases, dedup))
+            return self._parse_structured(completion, dedup)
+
+        except Exception as e:
+            logger.error(f"Error in structured phrase generation: {str(e)}")
+            raise
+
+        finally:
+            logger.info(f"Phrase pipeline timings (structured): total={time.perf_counter() - start:.2f}s")
+
+    async def aprocess_phrases_structured(self, existing_phrases=None, dedup=None):
+        start = time.perf_counter()
+        try:
+            completion = await self.async_client.chat.completions.create(**self._structured_request(existing_phrases, dedup))
+            return self._parse_structured(completion, dedup)
+
+        except Exception as e:
+            logger.error(f"Error in structured phrase generation: {str(e)}")
+            raise
+
+        finally:
+            logger.info(f"Phrase pipeline timings (structured, async): total={time.perf_counter() - start:.2f}s")
+
+    def process_phrases_pipeline(self, existing_phrases=None, dedup=None):
         """Complete process to generate phrases with translations"""
+        timings = {}
+        start = time.perf_counter()
         try:
             # Step 1: Generate Odia phrases
-            odia_phrases = self.generate_odia_phrases(existing_phrases)
-            
-            # Step 2: Get English translations
-            translations = self.translate_to_english(odia_phrases)
-            
-            # Step 3: Get romanized versions
-            romanized = self.generate_romanized(odia_phrases)
+            odia_phrases = self._timed(timings, "generate", self.generate_odia_phrases, existing_phrases, dedup)
+
+            if self._executor is not None:
+                # Steps 2 and 3 only depend on the generated phrases, so run them side by side:
+                # romanization on the pool, translation here, so no request waits on a pool slot
+                # for both of its stages
+                romanized_future = self._executor.submit(
+                    self._timed, timings, "romanize", self.generate_romanized, odia_phrases)
+                translations = self._timed(timings, "translate", self.translate_to_english, odia_phrases)
+                romanized = romanized_future.result()
+            else:
+                # Step 2: Get English translations
+                translations = self._timed(timings, "translate", self.translate_to_english, odia_phrases)
+
+                # Step 3: Get romanized versions
+                romanized = self._timed(timings, "romanize", self.generate_romanized, odia_phrases)
 
             # Step 4: Combine all information
-            combined = []
-            for i, odia_phrase in enumerate(odia_phrases):
-                try:
-                    if (i < len(translations) and i < len(romanized) and
-                        isinstance(translations[i], dict) and isinstance(romanized[i], dict) and
-                        translations[i].get("english") and translations[i].get("odia") and
-                        romanized[i].get("odia") and romanized[i].get("romanized")):
-                        
-                        entry = {
-                            "english": translations[i].get("english", "").strip(),
-                            "odia": odia_phrase.strip(),
-                            "romanized_odia": romanized[i].get("romanized", "").strip()
-                        }
-                        
-                        if all(entry.values()):
-                            combined.append(entry)
-
-                except Exception as e:
-                    continue
+            combined = self.combine_results(odia_phrases, translations, romanized)
 
             if not combined:
                 raise ValueError("No complete valid entries were generated")
@@ -141,4 +409,39 @@ class OdiaPhraseService:
 
         except Exception as e:
             logger.error(f"Error in phrase processing: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+
+        finally:
+            timings["total"] = time.perf_counter() - start
+            mode = "concurrent" if self._executor is not None else "sequential"
+            breakdown = ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in timings.items())
+            logger.info(f"Phrase pipeline timings ({mode}): {breakdown}")
+
+    async def aprocess_phrases_pipeline(self, existing_phrases=None, dedup=None):
+        """Async pipeline; translation and romanization always run side by side"""
+        timings = {}
+        start = time.perf_counter()
+        try:
+            odia_phrases = await self._atimed(timings, "generate", self.agenerate_odia_phrases(existing_phrases, dedup))
+
+            translations, romanized = await asyncio.gather(
+                self._atimed(timings, "translate", self.atranslate_to_english(odia_phrases)),
+                self._atimed(timings, "romanize", self.agenerate_romanized(odia_phrases))
+            )
+
+            combined = self.combine_results(odia_phrases, translations, romanized)
+
+            if not combined:
+                raise ValueError("No complete valid entries were generated")
+
+            logger.info(f"Generated {len(combined)} complete phrases")
+            return combined
+
+        except Exception as e:
+            logger.error(f"Error in phrase processing: {str(e)}")
+            raise
+
+        finally:
+            timings["total"] = time.perf_counter() - start
+            breakdown = ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in timings.items())
+            logger.info(f"Phrase pipeline timings (async): {breakdown}")
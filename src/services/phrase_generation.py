@@ -1,7 +1,6 @@
 from openai import OpenAI
-import json
 import logging
-import re
+from services.json_stream import parse_json_array
 
 logger = logging.getLogger(__name__)
 
@@ -39,20 +38,9 @@ class PhraseGenerationService:
             response = completion.choices[0].message.content.strip()
             logger.info(f"Raw response: {response}")
 
-            try:
-                phrases = json.loads(response)
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-                # Try to fix common JSON issues
-                fixed_response = response.replace('\n', '').replace('\\', '')
-                if not fixed_response.startswith('['):
-                    fixed_response = '[' + fixed_response
-                if not fixed_response.endswith(']'):
-                    fixed_response = fixed_response + ']'
-                logger.info(f"Attempting to parse fixed response: {fixed_response}")
-                phrases = json.loads(fixed_response)
-
-            if not isinstance(phrases, list):
+            # Parse the array, salvaging items from malformed or truncated output
+            phrases = parse_json_array(response).items
+            if not phrases:
                 raise ValueError("Expected a JSON array of phrases")
 
             # Clean each phrase
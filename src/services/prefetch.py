@@ -0,0 +1,124 @@
+import threading
+import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from services.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+class PrefetchPool:
+    """
+    Keeps ready-made, fully translated batches per generation type.
+    Batches are built in the background with the same services /generate uses.
+    Popping one filters it against the session; a batch the session has mostly seen
+    already is dropped rather than served short. Only a pop that serves a batch
+    refills the pool, and the new builds are seeded with that session's hints, so
+    they are not mostly repeats for the learner who is generating.
+    """
+    def __init__(self, build_batch, gen_types=('words', 'phrases'), depth=2, refill_concurrency=2, max_age_seconds=1800,
+                 min_batch_items=1, max_discards=1):
+        self.build_batch = build_batch
+        self.depth = depth
+        self.max_age_seconds = max_age_seconds
+        self.min_batch_items = max(min_batch_items, 1)
+        self.max_discards = max_discards
+        self._pools = {gen_type: deque() for gen_type in gen_types}
+        self._in_flight = {gen_type: 0 for gen_type in gen_types}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refill_concurrency, thread_name_prefix="prefetch")
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+
+    def _drop_stale(self, gen_type):
+        pool = self._pools[gen_type]
+        cutoff = time.monotonic() - self.max_age_seconds
+        while pool and pool[0][0] < cutoff:
+            pool.popleft()
+            logger.info(f"Dropped stale prefetched {gen_type} batch")
+
+    def _schedule(self, gen_type, count, context):
+        """Start count background builds; the caller holds the lock"""
+        self._in_flight[gen_type] += count
+        for _ in range(count):
+            self._executor.submit(self._build, gen_type, context)
+
+    def refill(self, gen_type, context=None):
+        """
+        Schedule enough background builds to bring the pool back to its depth
+        context is passed on to build_batch, to seed the builds with a session's hints
+        """
+        with self._lock:
+            self._drop_stale(gen_type)
+            needed = self.depth - len(self._pools[gen_type]) - self._in_flight[gen_type]
+            self._schedule(gen_type, max(needed, 0), context)
+
+    def fill(self):
+        """Build every pool up to its depth, without session hints; called once at startup"""
+        for gen_type in self._pools:
+            self.refill(gen_type)
+
+    def _build(self, gen_type, context):
+        try:
+            batch = self.build_batch(gen_type, context)
+            if batch:
+                with self._lock:
+                    self._pools[gen_type].append((time.monotonic(), batch))
+                logger.info(f"Prefetched a {gen_type} batch of {len(batch)} items")
+        except Exception as e:
+            logger.error(f"Error prefetching {gen_type} batch: {e}")
+        finally:
+            with self._lock:
+                self._in_flight[gen_type] -= 1
+
+    def pop(self, gen_type, dedup=None, key='english', context=None):
+        """
+        Take a ready batch, filtered against the session's existing items
+        Returns None when no batch keeps at least min_batch_items new items, so the
+        caller generates a full batch instead. At most max_discards short batches
+        are dropped per pop. Serving a batch refills the pool with builds seeded
+        from context; a miss only starts a build when none is ready or in flight.
+        """
+        batch = None
+        with self._lock:
+            self._drop_stale(gen_type)
+            pool = self._pools[gen_type]
+            discarded = 0
+            while pool and batch is None:
+                created_at, candidate = pool.popleft()
+                filtered = candidate
+                if dedup is not None:
+                    filtered = dedup.filter_new(candidate, key=lambda item: item.get(key))
+                if len(filtered) >= self.min_batch_items:
+                    batch = filtered
+                elif discarded >= self.max_discards:
+                    # Leave it for the next pop (or another learner) rather than drop more here
+                    pool.appendleft((created_at, candidate))
+                    break
+                else:
+                    logger.info(f"Dropped prefetched {gen_type} batch with only {len(filtered)} new items")
+                    discarded += 1
+            self.discarded += discarded
+            if batch:
+                self.hits += 1
+            else:
+                self.misses += 1
+                if not pool and not self._in_flight[gen_type]:
+                    # Keep the pool alive after it ran dry, without spending more than one build per miss
+                    self._schedule(gen_type, 1, context)
+        record_cache("prefetch", hits=1 if batch else 0, misses=0 if batch else 1)
+
+        if batch:
+            self.refill(gen_type, context)
+        return batch or None
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "discarded": self.discarded,
+                "ready": {gen_type: len(pool) for gen_type, pool in self._pools.items()},
+                "in_flight": dict(self._in_flight)
+            }
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+class PronunciationService:
+    """
+    Resolves Odia text to playable audio URLs, using the audio index as a cache
+    and synthesizing misses on a bounded worker pool. Concurrent requests for the
+    same text share one synthesis and upload.
+    """
+    def __init__(self, speech_service, audio_index, max_workers=4):
+        self.speech_service = speech_service
+        self.audio_index = audio_index
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pronounce")
+        self.flight = SingleFlight("pronounce")
+
+    def _synthesize_once(self, text: str) -> str:
+        audio_url = self.speech_service.speak_odia(text)
+        self.audio_index.put(text, audio_url)
+        return audio_url
+
+    def _flight_key(self, text: str):
+        return self.speech_service.normalize_text(text)
+
+    def _synthesize(self, text: str) -> str:
+        return self.flight.do(self._flight_key(text), self._synthesize_once, text)
+
+    def _submit_synthesis(self, text: str):
+        """Future for the text's audio URL, joining a synthesis already in flight"""
+        return self.flight.submit(self._flight_key(text), self._executor, self._synthesize_once, text)
+
+    def pronounce(self, text: str):
+        """
+        Get the audio URL for a single text
+        Returns (audio_url, cached)
+        """
+        cached_url = self.audio_index.get(text)
+        if cached_url:
+            return cached_url, True
+        return self._synthesize(text), False
+
+    async def apronounce(self, text: str):
+        """
+        Async variant of pronounce
+        The speech and blob SDKs block, so synthesis runs on the bounded worker pool
+        while the event loop keeps serving other requests
+        """
+        cached_url = self.audio_index.get(text)
+        if cached_url:
+            return cached_url, True
+        return await asyncio.wrap_future(self._submit_synthesis(text)), False
+
+    def _split_cached(self, texts: list):
+        audio_urls = {}
+        misses = []
+        for text in dict.fromkeys(texts):
+            cached_url = self.audio_index.get(text)
+            if cached_url:
+                audio_urls[text] = cached_url
+            else:
+                misses.append(text)
+
+        logger.info(f"Pronunciation batch: {len(audio_urls)} cached, {len(misses)} to synthesize")
+        return audio_urls, misses
+
+    def pronounce_batch(self, texts: list):
+        """
+        Get audio URLs for many texts at once
+        Returns (audio_urls, errors), both keyed by text
+        """
+        audio_urls, misses = self._split_cached(texts)
+
+        errors = {}
+        futures = {text: self._submit_synthesis(text) for text in misses}
+        for text, future in futures.items():
+            try:
+                audio_urls[text] = future.result()
+            except Exception as e:
+                logger.error(f"Error synthesizing {text}: {e}")
+                errors[text] = str(e)
+
+        return audio_urls, errors
+
+    async def apronounce_batch(self, texts: list):
+        """Async variant of pronounce_batch"""
+        audio_urls, misses = self._split_cached(texts)
+
+        results = await asyncio.gather(
+            *(asyncio.wrap_future(self._submit_synthesis(text)) for text in misses),
+            return_exceptions=True
+        )
+
+        errors = {}
+        for text, result in zip(misses, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error synthesizing {text}: {result}")
+                errors[text] = str(result)
+            else:
+                audio_urls[text] = result
+
+        return audio_urls, errors
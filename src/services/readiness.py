@@ -0,0 +1,70 @@
+import time
+import threading
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+class ReadinessTracker:
+    """
+    Records how long each startup phase took and the state of each external dependency.
+    Dependencies are warmed up in the background and retried until they succeed, so a
+    briefly unreachable backend delays readiness instead of crashing the app.
+    """
+    def __init__(self, started_at=None, retry_seconds=10):
+        self.retry_seconds = retry_seconds
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.phases = {}
+        self._dependencies = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        self.phases[name] = round(seconds, 3)
+
+    @contextmanager
+    def phase(self, name):
+        """Time one startup phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round(time.perf_counter() - start, 3)
+
+    def startup_complete(self):
+        self.phases["total"] = round(time.perf_counter() - self.started_at, 3)
+        breakdown = ", ".join(f"{name}={seconds:.3f}s" for name, seconds in self.phases.items())
+        logger.info(f"Startup timings: {breakdown}")
+
+    def _set(self, name, **state):
+        with self._lock:
+            self._dependencies[name].update(state)
+
+    def warm_up(self, name, warm):
+        """Run a dependency's warmup callable on a background thread, retrying on failure"""
+        with self._lock:
+            self._dependencies[name] = {"status": "pending", "error": None, "attempts": 0, "seconds": None}
+
+        def run():
+            start = time.perf_counter()
+            while True:
+                with self._lock:
+                    self._dependencies[name]["attempts"] += 1
+                try:
+                    warm()
+                    self._set(name, status="ready", error=None, seconds=round(time.perf_counter() - start, 3))
+                    logger.info(f"{name} ready after {time.perf_counter() - start:.2f}s")
+                    return
+                except Exception as e:
+                    self._set(name, status="error", error=str(e))
+                    logger.warning(f"{name} warmup failed, retrying in {self.retry_seconds}s: {e}")
+                    time.sleep(self.retry_seconds)
+
+        threading.Thread(target=run, daemon=True, name=f"warmup-{name}").start()
+
+    def get_status(self):
+        with self._lock:
+            return {
+                "ready": all(dependency["status"] == "ready" for dependency in self._dependencies.values()),
+                "dependencies": {name: dict(state) for name, state in self._dependencies.items()},
+                "startup_seconds": dict(self.phases)
+            }
@@ -0,0 +1,86 @@
+import re
+import unicodedata
+
+# Independent vowels
+VOWELS = {
+    'ଅ': 'a', 'ଆ': 'aa', 'ଇ': 'i', 'ଈ': 'ii',
+    'ଉ': 'u', 'ଊ': 'uu', 'ଋ': 'ru', 'ୠ': 'ruu',
+    'ଌ': 'lu', 'ୡ': 'luu', 'ଏ': 'e', 'ଐ': 'ai',
+    'ଓ': 'o', 'ଔ': 'au',
+}
+
+# Consonants, without their inherent vowel
+CONSONANTS = {
+    'କ': 'k', 'ଖ': 'kh', 'ଗ': 'g', 'ଘ': 'gh', 'ଙ': 'ng',
+    'ଚ': 'ch', 'ଛ': 'chh', 'ଜ': 'j', 'ଝ': 'jh', 'ଞ': 'ny',
+    'ଟ': 't', 'ଠ': 'th', 'ଡ': 'd', 'ଢ': 'dh', 'ଣ': 'n',
+    'ତ': 't', 'ଥ': 'th', 'ଦ': 'd', 'ଧ': 'dh', 'ନ': 'n',
+    'ପ': 'p', 'ଫ': 'ph', 'ବ': 'b', 'ଭ': 'bh', 'ମ': 'm',
+    'ଯ': 'j', 'ର': 'r', 'ଲ': 'l', 'ଳ': 'l', 'ଵ': 'v',
+    'ଶ': 's', 'ଷ': 's', 'ସ': 's', 'ହ': 'h',
+    'ୟ': 'y', 'ୱ': 'w',
+    # Nukta forms; NFC keeps these decomposed, so they are matched as pairs
+    'ଡ଼': 'd', 'ଢ଼': 'dh',
+}
+
+# Dependent vowel signs (matras)
+MATRAS = {
+    'ା': 'aa', 'ି': 'i', 'ୀ': 'ii', 'ୁ': 'u', 'ୂ': 'uu',
+    'ୃ': 'ru', 'ୄ': 'ruu', 'ୢ': 'lu', 'ୣ': 'luu',
+    'େ': 'e', 'ୈ': 'ai', 'ୋ': 'o', 'ୌ': 'au',
+}
+
+VIRAMA = '୍'
+INHERENT_VOWEL = 'a'
+
+# Signs, digits and punctuation that stand on their own
+OTHER = {
+    'ଁ': 'n',   # chandrabindu
+    'ଂ': 'n',   # anusvara
+    'ଃ': 'h',   # visarga
+    '଼': '',    # stray nukta
+    'ୖ': '', 'ୗ': '',  # length marks left over from two-part vowels
+    '୰': '',    # isshar
+    '।': '.', '॥': '.',  # danda, double danda
+    '‌': '', '‍': '',    # zero-width (non-)joiners
+}
+OTHER.update({chr(0x0B66 + digit): str(digit) for digit in range(10)})
+OTHER.update(VOWELS)
+
+def _alternation(keys):
+    # Longest first so nukta pairs win over their base consonant
+    return '|'.join(re.escape(key) for key in sorted(keys, key=len, reverse=True))
+
+_TOKEN = re.compile(
+    f"({_alternation(CONSONANTS)})({_alternation(MATRAS)}|{re.escape(VIRAMA)})?|(.)",
+    re.DOTALL
+)
+
+def _token_to_roman(match):
+    consonant, sign, other = match.groups()
+    if consonant is None:
+        return OTHER.get(other, other)
+    if sign is None:
+        return CONSONANTS[consonant] + INHERENT_VOWEL
+    if sign == VIRAMA:
+        return CONSONANTS[consonant]
+    return CONSONANTS[consonant] + MATRAS[sign]
+
+class OdiaTransliterator:
+    """
+    Table-driven Odia to Latin romanization.
+    Consonants carry the inherent 'a' unless followed by a matra or virama,
+    so conjuncts come out as consonant clusters.
+    """
+    def romanize(self, text: str) -> str:
+        """Romanize one Odia string; non-Odia characters pass through unchanged"""
+        return _TOKEN.sub(_token_to_roman, unicodedata.normalize("NFC", text))
+
+    def romanize_batch(self, texts):
+        """Romanize many strings at once"""
+        return [self.romanize(text) for text in texts]
+
+    @staticmethod
+    def has_unmapped(romanized: str) -> bool:
+        """Whether any Odia characters survived romanization"""
+        return any('଀' <= char <= '୿' for char in romanized)
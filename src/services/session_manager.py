@@ -0,0 +1,158 @@
+import os
+import re
+import json
+import uuid
+import threading
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from services.data_storage import DataStorageService
+from services.snapshot_store import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{8,64}$')
+
+class SessionManager:
+    """
+    Maps learner session IDs to their own DataStorageService.
+    Each session has its own log, dedup indexes and lock under data/sessions/<id>;
+    recently used sessions stay in memory and idle ones are evicted (their log is on disk).
+    Saved snapshots live apart from the working log, under data/snapshots/<id>, so the
+    startup cleanup of working sessions leaves them alone. Saves from before sessions
+    existed (data/words/saved_*.json) are imported once into data/snapshots/legacy,
+    which every session lists after its own.
+    """
+    def __init__(self, blob_storage_service, audio_index, sync_worker=None, base_dir=os.path.join("data", "sessions"),
+                 max_hot_sessions=100, max_dedup_hints=30, snapshot_chunk_items=256,
+                 snapshots_dir=os.path.join("data", "snapshots")):
+        self.blob_storage = blob_storage_service
+        self.audio_index = audio_index
+        self.sync_worker = sync_worker
+        self.base_dir = base_dir
+        self.max_hot_sessions = max_hot_sessions
+        self.max_dedup_hints = max_dedup_hints
+        self.snapshot_chunk_items = snapshot_chunk_items
+        self.snapshots_dir = snapshots_dir
+        # Session ids are at least 8 characters, so this directory never collides with one
+        self.legacy_snapshots = SnapshotStore(os.path.join(snapshots_dir, "legacy"), chunk_items=snapshot_chunk_items)
+        self._sessions = OrderedDict()  # session id -> storage
+        self._in_use = {}  # session id -> number of requests holding it
+        self._lock = threading.Lock()
+        os.makedirs(base_dir, exist_ok=True)
+
+    @staticmethod
+    def new_session_id():
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def is_valid_session_id(session_id):
+        return bool(session_id) and bool(SESSION_ID_PATTERN.match(session_id))
+
+    def _load(self, session_id):
+        return DataStorageService(
+            self.blob_storage,
+            base_dir=os.path.join(self.base_dir, session_id),
+            audio_index=self.audio_index,
+            sync_worker=self.sync_worker,
+            max_dedup_hints=self.max_dedup_hints,
+            blob_prefix=f"sessions/{session_id}/words",
+            snapshot_chunk_items=self.snapshot_chunk_items,
+            snapshots_dir=os.path.join(self.snapshots_dir, session_id),
+            legacy_snapshots=self.legacy_snapshots
+        )
+
+    def import_legacy_saves(self, words_dir=os.path.join("data", "words")):
+        """
+        Import the saved_*.json files of the single-user app as legacy snapshots
+        Files already imported are skipped, so this is safe to run on every startup; returns the number imported
+        """
+        if not os.path.isdir(words_dir):
+            return 0
+        imported_sources = self.legacy_snapshots.sources()
+        imported = 0
+        for filename in sorted(os.listdir(words_dir)):
+            if not (filename.startswith('saved_') and filename.endswith('.json')) or filename in imported_sources:
+                continue
+            path = os.path.join(words_dir, filename)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    translations = json.load(f).get('translations', [])
+                self.legacy_snapshots.save(translations, timestamp=os.path.getmtime(path), source=filename)
+                imported += 1
+            except Exception as e:
+                logger.warning(f"Skipping legacy saved session {filename}: {e}")
+        if imported:
+            logger.info(f"Imported {imported} legacy saved sessions from {words_dir}")
+        return imported
+
+    def sweep_snapshots(self):
+        """Remove unreferenced chunks from every snapshot store; returns the number of files removed"""
+        if not os.path.isdir(self.snapshots_dir):
+            return 0
+        removed = 0
+        for name in os.listdir(self.snapshots_dir):
+            if os.path.isdir(os.path.join(self.snapshots_dir, name)):
+                removed += SnapshotStore(os.path.join(self.snapshots_dir, name)).sweep()
+        return removed
+
+    def _evict_idle(self):
+        """Drop least recently used sessions that no request is holding"""
+        for session_id in list(self._sessions):
+            if len(self._sessions) <= self.max_hot_sessions:
+                return
+            if not self._in_use.get(session_id):
+                storage = self._sessions.pop(session_id)
+                if self.sync_worker is not None:
+                    self.sync_worker.forget(storage)
+                logger.info(f"Evicted session {session_id} from memory")
+
+    def acquire(self, session_id):
+        """Get the storage for a session and mark it in use"""
+        if not self.is_valid_session_id(session_id):
+            raise ValueError("Invalid session id")
+
+        with self._lock:
+            storage = self._sessions.get(session_id)
+            if storage is not None:
+                self._sessions.move_to_end(session_id)
+                self._in_use[session_id] = self._in_use.get(session_id, 0) + 1
+                return storage
+
+        # Load outside the manager lock so other sessions are not blocked on disk reads
+        loaded = self._load(session_id)
+
+        with self._lock:
+            # Another request may have loaded the same session meanwhile; keep the first one
+            storage = self._sessions.setdefault(session_id, loaded)
+            self._sessions.move_to_end(session_id)
+            self._in_use[session_id] = self._in_use.get(session_id, 0) + 1
+            self._evict_idle()
+            return storage
+
+    def release(self, session_id):
+        with self._lock:
+            remaining = self._in_use.get(session_id, 0) - 1
+            if remaining > 0:
+                self._in_use[session_id] = remaining
+            else:
+                self._in_use.pop(session_id, None)
+            self._evict_idle()
+
+    @contextmanager
+    def session(self, session_id):
+        """Context manager holding a session's storage for the duration of a request"""
+        storage = self.acquire(session_id)
+        try:
+            yield storage
+        finally:
+            self.release(session_id)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "hot_sessions": len(self._sessions),
+                "in_use": len(self._in_use),
+                "max_hot_sessions": self.max_hot_sessions
+            }
@@ -0,0 +1,145 @@
+import atexit
+import threading
+import time
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+class SessionSyncWorker:
+    """
+    Background, coalescing uploader for session files.
+    Saves only mark a session dirty; the worker waits a short debounce window so several
+    saves collapse into one upload, retries failures off the request path and flushes on exit.
+    A session's status is kept while it is in memory and dropped once it is evicted and synced.
+    """
+    def __init__(self, blob_storage_service, debounce_seconds=2, retry_delay_seconds=5, max_retry_delay_seconds=60):
+        self.blob_storage = blob_storage_service
+        self.debounce_seconds = debounce_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+        self.max_retry_delay_seconds = max_retry_delay_seconds
+        self._condition = threading.Condition()
+        self._dirty = {}  # blob name -> (storage, time it became eligible for upload)
+        self._status = {}
+        self._evicted = set()  # blob names whose status is dropped once their last upload succeeds
+        self._stopping = False
+
+        self._thread = threading.Thread(target=self._run, name="session-sync", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def mark_dirty(self, storage):
+        """Schedule an upload of the storage's session; returns its current sync status"""
+        key = storage.session_blob_name
+        with self._condition:
+            status = self._status.setdefault(key, {
+                "state": "pending",
+                "pending_saves": 0,
+                "blob_url": None,
+                "last_synced_at": None,
+                "last_error": None,
+                "failures": 0
+            })
+            status["pending_saves"] += 1
+            # A reloaded session is tracked again
+            self._evicted.discard(key)
+            if status["state"] != "syncing":
+                status["state"] = "pending"
+            # Always keep the newest storage object; an evicted and reloaded session gets a new one
+            _, due_at = self._dirty.get(key, (None, time.monotonic() + self.debounce_seconds))
+            self._dirty[key] = (storage, due_at)
+            self._condition.notify()
+            return dict(status)
+
+    def forget(self, storage):
+        """Drop the status of a session evicted from memory, now or as soon as its pending upload succeeds"""
+        key = storage.session_blob_name
+        with self._condition:
+            status = self._status.get(key)
+            if status is None:
+                return
+            if status["state"] == "synced" and key not in self._dirty:
+                del self._status[key]
+            else:
+                self._evicted.add(key)
+
+    def get_status(self, storage):
+        """Current sync status for a storage's session, or None if it was never scheduled"""
+        with self._condition:
+            status = self._status.get(storage.session_blob_name)
+            return dict(status) if status else None
+
+    def _take_due(self):
+        """Wait until at least one session is due, then remove and return all due sessions"""
+        with self._condition:
+            while True:
+                if self._stopping:
+                    return []
+                now = time.monotonic()
+                due = [key for key, (_, due_at) in self._dirty.items() if due_at <= now]
+                if due:
+                    batch = []
+                    for key in due:
+                        storage, _ = self._dirty.pop(key)
+                        status = self._status[key]
+                        status["state"] = "syncing"
+                        batch.append((key, storage, status["pending_saves"]))
+                        status["pending_saves"] = 0
+                    return batch
+                timeout = min((due_at for _, due_at in self._dirty.values()), default=None)
+                self._condition.wait(None if timeout is None else max(timeout - now, 0))
+
+    def _upload(self, key, storage, saves):
+        try:
+            blob_url = self.blob_storage.upload_file(storage.export_session(), key)
+            with self._condition:
+                status = self._status[key]
+                status["blob_url"] = blob_url
+                status["last_synced_at"] = datetime.utcnow().isoformat()
+                status["last_error"] = None
+                status["failures"] = 0
+                status["state"] = "pending" if key in self._dirty else "synced"
+                if status["state"] == "synced" and key in self._evicted:
+                    self._evicted.discard(key)
+                    del self._status[key]
+            logger.info(f"Synced {key} to blob storage ({saves} saves coalesced)")
+        except Exception as e:
+            with self._condition:
+                status = self._status[key]
+                status["failures"] += 1
+                status["last_error"] = str(e)
+                status["state"] = "failed"
+                status["pending_saves"] += saves
+                delay = min(self.retry_delay_seconds * 2 ** (status["failures"] - 1), self.max_retry_delay_seconds)
+                if key not in self._dirty:
+                    self._dirty[key] = (storage, time.monotonic() + delay)
+                self._condition.notify()
+            logger.warning(f"Session sync for {key} failed, retrying in {delay}s: {e}")
+
+    def _run(self):
+        while True:
+            batch = self._take_due()
+            if not batch:
+                return
+            for key, storage, saves in batch:
+                self._upload(key, storage, saves)
+
+    def shutdown(self):
+        """Stop the worker and upload anything still pending"""
+        with self._condition:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._condition.notify_all()
+
+        # Let an in-flight upload finish before draining what is left
+        self._thread.join(timeout=30)
+        with self._condition:
+            pending = list(self._dirty.items())
+            self._dirty.clear()
+
+        for key, (storage, _) in pending:
+            with self._condition:
+                saves = self._status[key]["pending_saves"]
+                self._status[key]["pending_saves"] = 0
+            self._upload(key, storage, saves)
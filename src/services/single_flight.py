@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import logging
+from concurrent.futures import Future
+from services.metrics import SINGLE_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key: the first caller does the work and
+    every duplicate that arrives while it is in flight shares its result or error.
+    Keys are dropped as soon as the call settles, so nothing is cached here.
+    """
+    def __init__(self, name):
+        self.name = name
+        self._calls = {}  # key -> Future of the in-flight call
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    def _join(self, key):
+        """The in-flight future for key and whether the caller must start the call"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                # A running future cannot be cancelled by one waiter on behalf of the others
+                future.set_running_or_notify_cancel()
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+        SINGLE_FLIGHT.inc(flight=self.name, role="leader" if leader else "coalesced")
+        return future, leader
+
+    def _settle(self, key, future, result=None, error=None):
+        # Forget the key first, so callers arriving after this point start a fresh call
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _run(self, key, future, fn, args):
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            return
+        self._settle(key, future, result=result)
+
+    def do(self, key, fn, *args):
+        """Call fn(*args), or wait for the identical call already in flight"""
+        future, leader = self._join(key)
+        if leader:
+            self._run(key, future, fn, args)
+        return future.result()
+
+    def submit(self, key, executor, fn, *args):
+        """Like do(), but without blocking: returns a future, starting the call on executor if needed"""
+        future, leader = self._join(key)
+        if leader:
+            try:
+                executor.submit(self._run, key, future, fn, args)
+            except Exception as e:
+                self._settle(key, future, error=e)
+        return future
+
+    async def ado(self, key, coroutine_fn, *args):
+        """Async variant of do() for a coroutine function"""
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            result = await coroutine_fn(*args)
+        except BaseException as e:
+            self._settle(key, future, error=e)
+            raise
+        self._settle(key, future, result=result)
+        return result
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls)
+            }
@@ -0,0 +1,222 @@
+import os
+import json
+import time
+import uuid
+import hashlib
+import threading
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+class SnapshotStore:
+    """
+    Saved copies of a session, stored as content-addressed chunks of the session log.
+
+    The log only ever grows, so it is cut into fixed-size chunks at the same item
+    boundaries on every save: a re-save finds all of its full chunks already stored
+    and only writes the trailing partial chunk plus a small manifest listing the
+    chunk hashes. catalog.jsonl gets one line per snapshot (id, timestamp, item
+    count, size), held in memory so listing a page never touches the snapshots
+    themselves. A snapshot's items are only read back when it is materialized.
+    Chunks no manifest refers to (from a save that failed or was interrupted) are
+    removed by sweep().
+    """
+    def __init__(self, base_dir: str, blob_storage_service=None, blob_prefix=None, chunk_items=256):
+        self.base_dir = base_dir
+        self.chunks_dir = os.path.join(base_dir, "chunks")
+        self.manifests_dir = os.path.join(base_dir, "manifests")
+        self.catalog_file = os.path.join(base_dir, "catalog.jsonl")
+        self.blob_storage = blob_storage_service
+        self.blob_prefix = blob_prefix
+        self.chunk_items = chunk_items
+        self._lock = threading.Lock()
+        # Saves run one at a time, so a failed save can remove the chunks it wrote
+        self._save_lock = threading.Lock()
+        self._catalog = None  # loaded on first use
+
+    def _load_catalog(self):
+        if self._catalog is not None:
+            return
+        catalog = []
+        if os.path.exists(self.catalog_file):
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        catalog.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping unreadable snapshot catalog line {line_number}")
+        self._catalog = catalog
+
+    def _write_atomic(self, path, data: bytes):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _upload(self, path, relative_name):
+        if self.blob_storage is None:
+            return None
+        return self.blob_storage.upload_file(path, f"{self.blob_prefix}/snapshots/{relative_name}")
+
+    def _store_chunk(self, items):
+        """Write one chunk unless identical content is already stored; returns (hash, bytes written)"""
+        data = ''.join(json.dumps(item, ensure_ascii=False) + '\n' for item in items).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = os.path.join(self.chunks_dir, f"{digest}.jsonl")
+        if os.path.exists(path):
+            return digest, len(data), 0
+
+        self._write_atomic(path, data)
+        try:
+            self._upload(path, f"chunks/{digest}.jsonl")
+        except Exception as e:
+            logger.warning(f"Failed to upload snapshot chunk {digest}: {e}")
+        return digest, len(data), len(data)
+
+    def save(self, translations: list, timestamp=None, source=None):
+        """
+        Record a snapshot of the given session items; source names the file it was imported from, if any
+        Returns its catalog entry, with the manifest's local path and blob URL
+        """
+        with self._save_lock:
+            return self._save(translations, timestamp, source)
+
+    def _save(self, translations, timestamp, source):
+        timestamp = timestamp or time.time()
+        snapshot_id = f"{datetime.fromtimestamp(timestamp).strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        os.makedirs(self.chunks_dir, exist_ok=True)
+        os.makedirs(self.manifests_dir, exist_ok=True)
+
+        chunk_hashes, new_chunks, size_bytes, stored_bytes = [], [], 0, 0
+        manifest_path = os.path.join(self.manifests_dir, f"{snapshot_id}.json")
+        try:
+            for start in range(0, len(translations), self.chunk_items):
+                digest, chunk_size, written = self._store_chunk(translations[start:start + self.chunk_items])
+                chunk_hashes.append(digest)
+                if written:
+                    new_chunks.append(digest)
+                size_bytes += chunk_size
+                stored_bytes += written
+
+            manifest = {"id": snapshot_id, "timestamp": timestamp, "items": len(translations), "chunks": chunk_hashes}
+            self._write_atomic(manifest_path, json.dumps(manifest).encode('utf-8'))
+        except Exception:
+            # Chunks this save wrote are not referenced by any earlier manifest
+            for digest in new_chunks:
+                self._remove(os.path.join(self.chunks_dir, f"{digest}.jsonl"))
+            raise
+
+        blob_url = None
+        try:
+            blob_url = self._upload(manifest_path, f"manifests/{snapshot_id}.json")
+        except Exception as e:
+            logger.warning(f"Failed to upload snapshot manifest {snapshot_id}: {e}")
+
+        entry = {
+            "id": snapshot_id,
+            "timestamp": timestamp,
+            "items": len(translations),
+            "size_bytes": size_bytes,
+            "stored_bytes": stored_bytes
+        }
+        if source is not None:
+            entry["source"] = source
+        with self._lock:
+            self._load_catalog()
+            entry["seq"] = len(self._catalog)
+            with open(self.catalog_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._catalog.append(entry)
+
+        logger.info(f"Saved snapshot {snapshot_id}: {len(translations)} items, "
+                    f"{stored_bytes} of {size_bytes} bytes newly stored")
+        return dict(entry, local_path=manifest_path, blob_url=blob_url)
+
+    def list_page(self, limit=20, cursor=None):
+        """
+        Newest snapshots first; cursor is the next_cursor of the previous page
+        Returns (entries, next_cursor), with next_cursor None on the last page
+        """
+        with self._lock:
+            self._load_catalog()
+            end = len(self._catalog) if cursor is None else max(0, min(int(cursor), len(self._catalog)))
+            start = max(0, end - limit)
+            page = self._catalog[start:end]
+        return [dict(entry) for entry in reversed(page)], (start if start > 0 else None)
+
+    def count(self):
+        with self._lock:
+            self._load_catalog()
+            return len(self._catalog)
+
+    def sources(self):
+        """Source names of the imported snapshots"""
+        with self._lock:
+            self._load_catalog()
+            return {entry["source"] for entry in self._catalog if "source" in entry}
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to remove {path}: {e}")
+            return False
+
+    def sweep(self, min_age_seconds=3600):
+        """
+        Remove chunks no manifest refers to, and temp files left by interrupted writes
+        Files younger than min_age_seconds are kept, as they may belong to a save still in progress
+        Returns the number of files removed
+        """
+        if not os.path.isdir(self.chunks_dir):
+            return 0
+        referenced = set()
+        if os.path.isdir(self.manifests_dir):
+            for filename in os.listdir(self.manifests_dir):
+                if not filename.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(self.manifests_dir, filename), 'r', encoding='utf-8') as f:
+                        referenced.update(json.load(f)["chunks"])
+                except (OSError, ValueError, KeyError) as e:
+                    # Keep everything rather than risk removing chunks of a manifest we cannot read
+                    logger.warning(f"Not sweeping {self.base_dir}: unreadable manifest {filename}: {e}")
+                    return 0
+
+        cutoff = time.time() - min_age_seconds
+        removed = 0
+        for directory in (self.chunks_dir, self.manifests_dir):
+            if not os.path.isdir(directory):
+                continue
+            for filename in os.listdir(directory):
+                path = os.path.join(directory, filename)
+                orphan = filename.endswith(".tmp") or (
+                    directory == self.chunks_dir and filename[:-len(".jsonl")] not in referenced)
+                if orphan and os.path.getmtime(path) < cutoff and self._remove(path):
+                    removed += 1
+        if removed:
+            logger.info(f"Swept {removed} unreferenced snapshot files from {self.base_dir}")
+        return removed
+
+    def materialize(self, snapshot_id: str):
+        """
+        All items of a snapshot, read back from its chunks
+        Returns None if there is no such snapshot
+        """
+        manifest_path = os.path.join(self.manifests_dir, f"{os.path.basename(snapshot_id)}.json")
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        translations = []
+        for digest in manifest["chunks"]:
+            with open(os.path.join(self.chunks_dir, f"{digest}.jsonl"), 'r', encoding='utf-8') as f:
+                translations.extend(json.loads(line) for line in f if line.strip())
+        return {"id": manifest["id"], "timestamp": manifest["timestamp"], "translations": translations}
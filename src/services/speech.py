@@ -1,29 +1,114 @@
 import os
-import azure.cognitiveservices.speech as speechsdk
+import hashlib
 import tempfile
+import threading
 import time
 import logging
+import unicodedata
+from services.metrics import span, record_cache
 
 logger = logging.getLogger(__name__)
 
+# The Speech SDK is slow to load, so it is imported on first use
+speechsdk = None
+
+def _load_speech_sdk():
+    global speechsdk
+    if speechsdk is None:
+        import azure.cognitiveservices.speech as sdk
+        speechsdk = sdk
+    return speechsdk
+
 class SpeechService:
-    def __init__(self, blob_storage_service):
-        self.speech_config = speechsdk.SpeechConfig(
-            subscription=os.getenv("AZURE_SPEECH_KEY"),
-            region=os.getenv("AZURE_SPEECH_REGION")
-        )
-        self.speech_config.speech_synthesis_voice_name = "or-IN-SubhasiniNeural"
+    def __init__(self, blob_storage_service, voice="or-IN-SubhasiniNeural", in_memory=True, pool_config=None,
+                 tts_provider=None):
+        self.voice = voice
+        # A stand-in synthesizer (see providers/) replaces the Speech SDK entirely
+        self.tts_provider = tts_provider
+        self.in_memory = in_memory
+        self.pool_config = pool_config or {}
+        # Kept by name so cached audio can be found without loading the SDK
+        self.output_format_name = "Riff16Khz16BitMonoPcm"
+        self.output_format = None
+        self.speech_config = None
+        self.pool = None
+        self._init_lock = threading.Lock()
         self.blob_storage = blob_storage_service
         
         # Create temp directory for audio files if it doesn't exist
         self.audio_dir = os.path.join(tempfile.gettempdir(), 'odia_audio')
         os.makedirs(self.audio_dir, exist_ok=True)
 
+    def _ensure_initialized(self):
+        """Load the SDK and build the speech config (and synthesizer pool) once"""
+        if self.speech_config is not None:
+            return
+        with self._init_lock:
+            if self.speech_config is not None:
+                return
+            sdk = _load_speech_sdk()
+            self.output_format = getattr(sdk.SpeechSynthesisOutputFormat, self.output_format_name)
+            speech_config = sdk.SpeechConfig(
+                subscription=os.getenv("AZURE_SPEECH_KEY"),
+                region=os.getenv("AZURE_SPEECH_REGION")
+            )
+            speech_config.speech_synthesis_voice_name = self.voice
+            speech_config.set_speech_synthesis_output_format(self.output_format)
+
+            # Pre-connected synthesizers for in-memory synthesis
+            if self.in_memory and self.pool_config.get("pool_size", 0) > 0:
+                from services.synthesizer_pool import SynthesizerPool
+                self.pool = SynthesizerPool(
+                    speech_config,
+                    size=self.pool_config["pool_size"],
+                    idle_reconnect_seconds=self.pool_config.get("pool_idle_reconnect_seconds", 240),
+                    health_check_seconds=self.pool_config.get("pool_health_check_seconds", 60),
+                    acquire_timeout_seconds=self.pool_config.get("pool_acquire_timeout_seconds", 10)
+                )
+            self.speech_config = speech_config
+
+    def warm_up(self):
+        """Load the SDK and open the pooled connections ahead of the first request"""
+        if self.tts_provider is not None:
+            return
+        self._ensure_initialized()
+        if self.pool is not None:
+            self.pool.warm()
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize Odia text so equivalent inputs map to the same audio"""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    def audio_blob_name(self, text: str) -> str:
+        """Stable blob name derived from the normalized text, voice and output format"""
+        key = f"{self.voice}|{self.output_format_name}|{self.normalize_text(text)}"
+        return f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.wav"
+
     def speak_odia(self, text: str):
         try:
-            # Create a unique filename using hash of text and timestamp
-            filename = f"{hash(text)}_{int(time.time())}.wav"
-            audio_file = os.path.join(self.audio_dir, filename)
+            text = self.normalize_text(text)
+
+            # Content-addressed name, so audio is shared across restarts and workers
+            filename = self.audio_blob_name(text)
+            if self.blob_storage.blob_exists(filename):
+                record_cache("audio_blob", hits=1)
+                logger.info(f"Reusing existing audio blob: {filename}")
+                return self.blob_storage.generate_sas_url(filename)
+            record_cache("audio_blob", misses=1)
+
+            if self.tts_provider is not None:
+                with span("tts_synthesis"):
+                    audio_data = self.tts_provider.synthesize(text)
+                return self.blob_storage.upload_bytes(audio_data, filename, content_type="audio/wav")
+
+            self._ensure_initialized()
+
+            if self.in_memory:
+                return self._speak_to_memory(text, filename)
+
+            # Keep the local temp file unique per worker thread
+            audio_file = os.path.join(self.audio_dir, f"{os.getpid()}_{threading.get_ident()}_{filename}")
             
             # Create an audio output config with a file
             audio_config = speechsdk.audio.AudioOutputConfig(filename=audio_file)
@@ -34,7 +119,8 @@ class SpeechService:
                 audio_config=audio_config
             )
             
-            result = synthesizer.speak_text_async(text).get()
+            with span("tts_synthesis"):
+                result = synthesizer.speak_text_async(text).get()
             
             if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
                 try:
@@ -60,4 +146,29 @@ class SpeechService:
                 
         except Exception as e:
             logger.error(f"Error in Azure speech synthesis: {e}")
-            raise Exception(f"Error in Azure speech synthesis: {e}") 
\ No newline at end of file
+            raise Exception(f"Error in Azure speech synthesis: {e}")
+
+    def _speak_to_memory(self, text: str, blob_name: str):
+        """Synthesize into memory and upload the audio bytes without a temp file"""
+        if self.pool is not None:
+            with self.pool.synthesizer() as (synthesizer, report):
+                with span("tts_synthesis"):
+                    result = synthesizer.speak_text_async(text).get()
+                report(result)
+        else:
+            # No audio config keeps the synthesized audio on the result instead of a device or file
+            synthesizer = speechsdk.SpeechSynthesizer(
+                speech_config=self.speech_config,
+                audio_config=None
+            )
+            with span("tts_synthesis"):
+                result = synthesizer.speak_text_async(text).get()
+
+        if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
+            return self.blob_storage.upload_bytes(result.audio_data, blob_name, content_type="audio/wav")
+
+        if result.reason == speechsdk.ResultReason.Canceled:
+            cancellation_details = result.cancellation_details
+            raise Exception(f"Speech synthesis canceled: {cancellation_details.reason}")
+
+        raise Exception(f"Unexpected speech synthesis result: {result.reason}") 
\ No newline at end of file
@@ -0,0 +1,190 @@
+import time
+import atexit
+import threading
+import logging
+from contextlib import contextmanager
+import azure.cognitiveservices.speech as speechsdk
+
+logger = logging.getLogger(__name__)
+
+class _PooledSynthesizer:
+    """A synthesizer with its own pre-opened connection to the Speech service"""
+    def __init__(self, speech_config):
+        self.synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+        self.connection = speechsdk.Connection.from_speech_synthesizer(self.synthesizer)
+        self.connected = False
+        self.last_used = time.monotonic()
+        self.connection.connected.connect(lambda event: self._set_connected(True))
+        self.connection.disconnected.connect(lambda event: self._set_connected(False))
+
+    def _set_connected(self, connected):
+        self.connected = connected
+
+    def open(self):
+        # Pays the connection and TLS setup now instead of on the next request
+        self.connection.open(True)
+        self.last_used = time.monotonic()
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception as e:
+            logger.warning(f"Error closing speech connection: {e}")
+
+class SynthesizerPool:
+    """
+    Pool of pre-connected in-memory speech synthesizers reused across requests.
+    Idle connections are reopened before the service drops them, and a synthesizer
+    whose request fails with an error is thrown away and replaced.
+    """
+    def __init__(self, speech_config, size=4, idle_reconnect_seconds=240, health_check_seconds=60,
+                 acquire_timeout_seconds=10):
+        self.speech_config = speech_config
+        self.size = size
+        self.idle_reconnect_seconds = idle_reconnect_seconds
+        self.health_check_seconds = health_check_seconds
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self._idle = []
+        self._created = 0
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self.stats = {"acquired": 0, "warm_hits": 0, "reconnects": 0, "replaced": 0, "overflow": 0}
+
+        self._health_thread = threading.Thread(target=self._health_loop, daemon=True, name="speech-pool-health")
+        self._health_thread.start()
+        atexit.register(self.close)
+
+    def _new_entry(self):
+        entry = _PooledSynthesizer(self.speech_config)
+        entry.open()
+        return entry
+
+    def warm(self):
+        """Open connections up to the pool size ahead of the first request"""
+        while True:
+            with self._condition:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            try:
+                entry = self._new_entry()
+            except Exception as e:
+                with self._condition:
+                    self._created -= 1
+                logger.error(f"Error warming speech synthesizer: {e}")
+                raise
+            self._release(entry)
+
+    def _take(self):
+        """Get an idle entry, room to create one (None), or time out"""
+        deadline = time.monotonic() + self.acquire_timeout_seconds
+        with self._condition:
+            while True:
+                if self._idle:
+                    return self._idle.pop(), True
+                if self._created < self.size:
+                    self._created += 1
+                    return None, True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None, False
+                self._condition.wait(remaining)
+
+    def _release(self, entry):
+        entry.last_used = time.monotonic()
+        with self._condition:
+            self._idle.append(entry)
+            self._condition.notify()
+
+    def _discard(self, entry):
+        entry.close()
+        with self._condition:
+            self._created -= 1
+            self.stats["replaced"] += 1
+            self._condition.notify()
+
+    def _ensure_fresh(self, entry):
+        if not entry.connected or time.monotonic() - entry.last_used > self.idle_reconnect_seconds:
+            entry.open()
+            with self._condition:
+                self.stats["reconnects"] += 1
+
+    @contextmanager
+    def synthesizer(self):
+        """
+        Borrow a connected synthesizer for one request
+        When the pool is exhausted past the timeout, a one-off synthesizer is used instead
+        """
+        entry, pooled = self._take()
+        if not pooled:
+            with self._condition:
+                self.stats["overflow"] += 1
+            yield speechsdk.SpeechSynthesizer(speech_config=self.speech_config, audio_config=None), lambda result: None
+            return
+
+        try:
+            if entry is None:
+                entry = self._new_entry()
+            else:
+                with self._condition:
+                    self.stats["warm_hits"] += 1
+                self._ensure_fresh(entry)
+        except Exception:
+            if entry is not None:
+                entry.close()
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self.stats["acquired"] += 1
+
+        healthy = [True]
+        def report(result):
+            # A synthesis error usually means a broken connection; do not hand it out again
+            if result.reason == speechsdk.ResultReason.Canceled and \
+                    result.cancellation_details.reason == speechsdk.CancellationReason.Error:
+                healthy[0] = False
+
+        try:
+            yield entry.synthesizer, report
+        except Exception:
+            healthy[0] = False
+            raise
+        finally:
+            if healthy[0]:
+                self._release(entry)
+            else:
+                logger.warning("Replacing unhealthy speech synthesizer")
+                self._discard(entry)
+
+    def _health_loop(self):
+        """Reopen idle connections that dropped or are about to time out"""
+        while not self._stop.wait(self.health_check_seconds):
+            with self._condition:
+                stale = [entry for entry in self._idle
+                         if not entry.connected or time.monotonic() - entry.last_used > self.idle_reconnect_seconds]
+                for entry in stale:
+                    self._idle.remove(entry)
+
+            for entry in stale:
+                try:
+                    entry.open()
+                    with self._condition:
+                        self.stats["reconnects"] += 1
+                    self._release(entry)
+                except Exception as e:
+                    logger.warning(f"Speech connection health check failed: {e}")
+                    self._discard(entry)
+
+    def get_stats(self):
+        with self._condition:
+            return dict(self.stats, size=self.size, created=self._created, idle=len(self._idle))
+
+    def close(self):
+        self._stop.set()
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            entry.close()
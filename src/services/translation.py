@@ -1,5 +1,5 @@
 from openai import OpenAI
-import json
+from services.json_stream import parse_json_array
 
 class TranslationService:
     def __init__(self, client: OpenAI, config: dict, model_configs: dict):
@@ -20,8 +20,8 @@ class TranslationService:
             **self.get_model_config()
         )
 
-        translations = json.loads(completion.choices[0].message.content)
-        if not isinstance(translations, list):
+        translations = parse_json_array(completion.choices[0].message.content).items
+        if not translations:
             raise ValueError("Expected a JSON array of translation objects")
         
         return translations 
\ No newline at end of file
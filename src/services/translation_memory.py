@@ -0,0 +1,124 @@
+import os
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+from services.metrics import timed, record_cache
+
+logger = logging.getLogger(__name__)
+
+class TranslationMemory:
+    """
+    Persistent English -> Odia translation memory.
+    Entries live in an indexed SQLite table on disk with an in-process LRU in front of it.
+    """
+    def __init__(self, db_path="data/translation_memory.db", lru_size=2000):
+        self.db_path = db_path
+        self.lru_size = lru_size
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS translations (
+                key TEXT PRIMARY KEY,
+                english TEXT NOT NULL,
+                odia TEXT NOT NULL,
+                romanized_odia TEXT NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize an English word for lookup"""
+        return " ".join(text.strip().lower().split())
+
+    def _remember(self, key, entry):
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def get(self, text: str):
+        """Return the stored translation for an English word, or None"""
+        key = self.normalize(text)
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return dict(entry)
+
+            row = self._conn.execute(
+                "SELECT english, odia, romanized_odia FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            entry = {"english": row[0], "odia": row[1], "romanized_odia": row[2]}
+            self._remember(key, entry)
+            self.hits += 1
+            return dict(entry)
+
+    @timed("translation_memory_lookup")
+    def lookup(self, words: list):
+        """
+        Split words into cached translations and misses
+        Returns (found, misses) where found maps each word to its translation
+        """
+        found = {}
+        misses = []
+        for word in words:
+            entry = self.get(word)
+            if entry is None:
+                misses.append(word)
+            else:
+                found[word] = entry
+        record_cache("translation_memory", hits=len(found), misses=len(misses))
+        return found, misses
+
+    @timed("translation_memory_write")
+    def put_many(self, translations: list):
+        """Store translation objects returned by the model"""
+        rows = []
+        for t in translations:
+            if not isinstance(t, dict):
+                continue
+            english, odia, romanized = t.get("english"), t.get("odia"), t.get("romanized_odia")
+            if not (english and odia and romanized):
+                continue
+            rows.append((self.normalize(english), english, odia, romanized))
+
+        if not rows:
+            return
+
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO translations (key, english, odia, romanized_odia) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+                for key, english, odia, romanized in rows:
+                    self._remember(key, {"english": english, "odia": odia, "romanized_odia": romanized})
+        except Exception as e:
+            logger.error(f"Error writing to translation memory: {e}")
+
+    def get_stats(self):
+        """Hit/miss counters for the translation memory"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "lru_entries": len(self._lru)
+            }
@@ -1,6 +1,9 @@
 from openai import OpenAI
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from services.json_stream import parse_json_array
+from services.chunking import TranslationChunker, run_chunks
+from services.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +13,11 @@ class PhraseTranslationService:
         self.config = config
         self.model_configs = model_configs
         self.model = config["models"]["translation"]
+        chunking_config = config.get("translation", {})
+        self.chunker = TranslationChunker(self.get_model_config().get("max_tokens"), chunking_config)
+        self._executor = ThreadPoolExecutor(
+            max_workers=chunking_config.get("max_concurrent_chunks", 4), thread_name_prefix="translate-chunk")
+        self.flight = SingleFlight("phrase_translation")
 
     def get_model_config(self):
         return self.model_configs.get(self.model, {})
@@ -29,7 +37,21 @@ class PhraseTranslationService:
         return True
 
     def translate_phrases(self, phrases: list):
-        """Translate English phrases to Odia"""
+        """
+        Translate English phrases to Odia
+        Batches too large for one response are split and the chunks translated in parallel
+        """
+        valid_translations = run_chunks(self._executor, self._coalesced_chunk, self.chunker.split(phrases))
+        if not valid_translations:
+            raise ValueError("Failed to translate phrases: no phrases given")
+        return valid_translations
+
+    def _coalesced_chunk(self, phrases: list):
+        """Share the result of an identical chunk already being translated"""
+        return self.flight.do(tuple(phrases), self._translate_chunk, phrases)
+
+    def _translate_chunk(self, phrases: list):
+        """Translate one chunk of phrases, returning only the valid translations"""
         from prompts.prompts_class import PhraseTranslation
         
         try:
@@ -42,21 +64,9 @@ class PhraseTranslationService:
             response = completion.choices[0].message.content.strip()
             logger.info(f"Raw translation response: {response}")
             
-            try:
-                translations = json.loads(response)
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-                # Try to fix common JSON issues
-                fixed_response = response.replace('\n', '').replace('\\', '')
-                if not fixed_response.endswith(']'):
-                    # Find the last complete translation
-                    last_complete = fixed_response.rfind('}')
-                    if last_complete != -1:
-                        fixed_response = fixed_response[:last_complete+1] + ']'
-                logger.info(f"Attempting to parse fixed response: {fixed_response}")
-                translations = json.loads(fixed_response)
-
-            if not isinstance(translations, list):
+            # Parse the array, salvaging items from malformed or truncated output
+            translations = parse_json_array(response).items
+            if not translations:
                 raise ValueError("Expected a JSON array of translations")
 
             # Filter out invalid translations
@@ -1,28 +1,206 @@
-from openai import OpenAI
-import json
+from openai import OpenAI, AsyncOpenAI
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from services.json_stream import parse_json_array
+from services.chunking import TranslationChunker, run_chunks, arun_chunks
+from services.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
 
 class WordTranslationService:
-    def __init__(self, client: OpenAI, config: dict, model_configs: dict):
+    def __init__(self, client: OpenAI, config: dict, model_configs: dict, translation_memory=None,
+                 async_client: AsyncOpenAI = None):
         self.client = client
+        self.async_client = async_client
         self.config = config
         self.model_configs = model_configs
         self.model = config["models"]["translation"]
+        self.translation_memory = translation_memory
+        chunking_config = config.get("translation", {})
+        self.chunker = TranslationChunker(self.get_model_config().get("max_tokens"), chunking_config)
+        self.max_concurrent_chunks = chunking_config.get("max_concurrent_chunks", 4)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent_chunks, thread_name_prefix="translate-chunk")
+        # Identical word lists in flight at once (prefetch and a request, two tabs) share one model call
+        self.flight = SingleFlight("word_translation")
 
     def get_model_config(self):
         return self.model_configs.get(self.model, {})
 
-    def translate_words(self, words: list):
-        """Translate English words to Odia"""
+    def _build_request(self, words: list, stream=False):
         from prompts.prompts_class import OdiaTranslation
-        
-        completion = self.client.chat.completions.create(
+
+        request = dict(
             messages=OdiaTranslation.get_messages(words),
             model=self.model,
             **self.get_model_config()
         )
+        if stream:
+            request["stream"] = True
+        return request
 
-        translations = json.loads(completion.choices[0].message.content)
-        if not isinstance(translations, list):
+    @staticmethod
+    def _parse_translations(completion):
+        translations = parse_json_array(completion.choices[0].message.content).items
+        if not translations:
             raise ValueError("Expected a JSON array of translation objects")
-        
-        return translations 
\ No newline at end of file
+        return translations
+
+    def _request_chunk(self, words: list):
+        return self.flight.do(tuple(words), self._send_chunk, words)
+
+    async def _arequest_chunk(self, words: list):
+        return await self.flight.ado(tuple(words), self._asend_chunk, words)
+
+    def _send_chunk(self, words: list):
+        completion = self.client.chat.completions.create(**self._build_request(words))
+        return self._parse_translations(completion)
+
+    async def _asend_chunk(self, words: list):
+        completion = await self.async_client.chat.completions.create(**self._build_request(words))
+        return self._parse_translations(completion)
+
+    def _request_translations(self, words: list):
+        """
+        Send words to the model and return the parsed translations
+        Batches too large for one response are split and the chunks translated in parallel
+        """
+        return run_chunks(self._executor, self._request_chunk, self.chunker.split(words))
+
+    async def _arequest_translations(self, words: list):
+        return await arun_chunks(self._arequest_chunk, self.chunker.split(words), self.max_concurrent_chunks)
+
+    def _lookup_memory(self, words: list):
+        found, misses = self.translation_memory.lookup(words)
+        logger.info(f"Translation memory: {len(found)} hits, {len(misses)} misses")
+        return found, misses
+
+    def translate_words(self, words: list):
+        """Translate English words to Odia"""
+        if self.translation_memory is None:
+            return self._request_translations(words)
+
+        found, misses = self._lookup_memory(words)
+
+        new_translations = []
+        if misses:
+            new_translations = self._request_translations(misses)
+            self.translation_memory.put_many(new_translations)
+
+        return self._merge_in_order(words, found, new_translations)
+
+    async def atranslate_words(self, words: list):
+        """
+        Async variant of translate_words using the AsyncOpenAI client
+        Translation memory reads and writes hit SQLite, so they run off the event loop
+        """
+        if self.translation_memory is None:
+            return await self._arequest_translations(words)
+
+        found, misses = await asyncio.to_thread(self._lookup_memory, words)
+
+        new_translations = []
+        if misses:
+            new_translations = await self._arequest_translations(misses)
+            await asyncio.to_thread(self.translation_memory.put_many, new_translations)
+
+        return self._merge_in_order(words, found, new_translations)
+
+    def _merge_in_order(self, words, found, new_translations):
+        """Combine memory hits and model output in the order the words were requested"""
+        by_key = {}
+        for t in new_translations:
+            if isinstance(t, dict) and t.get("english"):
+                by_key.setdefault(self.translation_memory.normalize(t["english"]), t)
+
+        translations = []
+        for word in words:
+            entry = found.get(word) or by_key.pop(self.translation_memory.normalize(word), None)
+            if entry is not None:
+                translations.append(entry)
+        translations.extend(by_key.values())
+
+        return translations
+
+    def translate_words_stream(self, words: list):
+        """
+        Translate English words to Odia, yielding each translation as soon as it is available
+        Cached translations come first, then model output is parsed while it streams in;
+        streamed translations are written to the translation memory once the stream ends
+        """
+        from services.json_stream import JsonArrayStreamParser
+
+        misses = words
+        if self.translation_memory is not None:
+            found, misses = self.translation_memory.lookup(words)
+            for word in words:
+                if word in found:
+                    yield found[word]
+
+        if not misses:
+            return
+
+        stream = self.client.chat.completions.create(**self._build_request(misses, stream=True))
+
+        parser = JsonArrayStreamParser()
+        accepted = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            yield from self._accept_streamed(parser.feed(delta), accepted)
+
+        # A truncated response can still leave one complete final element behind
+        yield from self._accept_streamed(parser.close(), accepted)
+        self._log_stream_repairs(parser)
+        if self.translation_memory is not None and accepted:
+            self.translation_memory.put_many(accepted)
+
+    async def atranslate_words_stream(self, words: list):
+        """Async variant of translate_words_stream using the AsyncOpenAI client"""
+        from services.json_stream import JsonArrayStreamParser
+
+        misses = words
+        if self.translation_memory is not None:
+            found, misses = await asyncio.to_thread(self.translation_memory.lookup, words)
+            for word in words:
+                if word in found:
+                    yield found[word]
+
+        if not misses:
+            return
+
+        stream = await self.async_client.chat.completions.create(**self._build_request(misses, stream=True))
+
+        parser = JsonArrayStreamParser()
+        accepted = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            for translation in self._accept_streamed(parser.feed(delta), accepted):
+                yield translation
+
+        for translation in self._accept_streamed(parser.close(), accepted):
+            yield translation
+        self._log_stream_repairs(parser)
+        if self.translation_memory is not None and accepted:
+            await asyncio.to_thread(self.translation_memory.put_many, accepted)
+
+    @staticmethod
+    def _log_stream_repairs(parser):
+        if parser.repaired or parser.dropped:
+            logger.info(f"Streamed translation: {parser.repaired} items repaired, {parser.dropped} dropped")
+
+    @staticmethod
+    def _accept_streamed(translations, accepted):
+        """Yield the well-formed translations, collecting them in accepted for the translation memory"""
+        for translation in translations:
+            if not isinstance(translation, dict):
+                continue
+            accepted.append(translation)
+            yield translation
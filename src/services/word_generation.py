@@ -1,20 +1,43 @@
-from openai import OpenAI
-import json
+from openai import OpenAI, AsyncOpenAI
 import logging
 import re
+import threading
+from services.json_stream import parse_json_array
 
 logger = logging.getLogger(__name__)
 
 class WordGenerationService:
-    def __init__(self, client: OpenAI, config: dict, model_configs: dict):
+    def __init__(self, client: OpenAI, config: dict, model_configs: dict, async_client: AsyncOpenAI = None):
         self.client = client
+        self.async_client = async_client
         self.config = config
         self.model_configs = model_configs
         self.model = config["models"]["word_generation"]
+        generation_config = config.get("generation", {})
+        self.batch_size = generation_config.get("batch_size", 10)
+        self.overgenerate = generation_config.get("overgenerate", 0)
+        self._usage_lock = threading.Lock()
+        self.generate_calls = 0
+        self.prompt_tokens = 0
 
     def get_model_config(self):
         return self.model_configs.get(self.model, {})
 
+    def _record_usage(self, completion):
+        """Track prompt tokens spent per generate call"""
+        usage = getattr(completion, "usage", None)
+        with self._usage_lock:
+            self.generate_calls += 1
+            self.prompt_tokens += getattr(usage, "prompt_tokens", 0) or 0
+
+    def get_prompt_token_stats(self):
+        with self._usage_lock:
+            return {
+                "generate_calls": self.generate_calls,
+                "prompt_tokens": self.prompt_tokens,
+                "prompt_tokens_per_generate": round(self.prompt_tokens / self.generate_calls, 1) if self.generate_calls else 0
+            }
+
     def sanitize_text(self, text):
         """Clean text to make it JSON-safe"""
         # Remove any non-ASCII characters
@@ -25,57 +48,66 @@ class WordGenerationService:
         text = text.replace('?', '').replace('!', '').replace('.', '')
         return text.strip()
 
-    def generate_words(self, existing_words=None, gen_type='words'):
-        """Generate new words or phrases, taking into account existing ones"""
+    def _build_request(self, existing_words, gen_type, dedup):
+        """Chat completion arguments for one generate call"""
         from prompts.prompts_class import WordGeneration
-        
+
+        count = self.batch_size
+        if dedup is not None:
+            existing_words = dedup.hints()
+            count += self.overgenerate
+
+        return dict(
+            messages=WordGeneration.get_messages(existing_words, gen_type, count),
+            model=self.model,
+            **self.get_model_config()
+        )
+
+    def _parse_words(self, completion, dedup):
+        """Turn a generate completion into cleaned, optionally deduplicated words"""
+        self._record_usage(completion)
+
+        # Get the raw response
+        raw_response = completion.choices[0].message.content
+        logger.info(f"Raw response received: {raw_response}")
+
+        # Parse the array, salvaging items from malformed or truncated output
+        words = parse_json_array(raw_response).items
+        if not words:
+            raise ValueError("Response is not a valid JSON array")
+
+        # Final cleaning of each word
+        cleaned_words = [self.sanitize_text(word) for word in words if isinstance(word, str)]
+        logger.info(f"Final cleaned words: {cleaned_words}")
+
+        if dedup is not None:
+            cleaned_words = dedup.filter_new([word for word in cleaned_words if word])[:self.batch_size]
+            logger.info(f"{len(cleaned_words)} new words after dedup")
+
+        return cleaned_words
+
+    def _generation_failed(self, error, completion):
+        logger.error(f"Error in generate_words: {str(error)}")
+        logger.error(f"Raw response was: {completion.choices[0].message.content if completion is not None else 'No response'}")
+        return ValueError(f"Failed to generate content: {str(error)}")
+
+    def generate_words(self, existing_words=None, gen_type='words', dedup=None):
+        """
+        Generate new words or phrases, taking into account existing ones
+        With a dedup index, only a bounded hint list is sent and repeats are filtered locally
+        """
+        completion = None
         try:
-            completion = self.client.chat.completions.create(
-                messages=WordGeneration.get_messages(existing_words, gen_type),
-                model=self.model,
-                **self.get_model_config()
-            )
-
-            # Get the raw response
-            raw_response = completion.choices[0].message.content
-            logger.info(f"Raw response received: {raw_response}")
-
-            # Clean the response
-            response_text = raw_response.strip()
-            logger.info(f"Stripped response: {response_text}")
-
-            # Ensure it starts and ends with brackets
-            if not (response_text.startswith('[') and response_text.endswith(']')):
-                logger.error("Response is not a valid JSON array")
-                raise ValueError("Response is not a valid JSON array")
-
-            try:
-                # First try to parse as is
-                words = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Initial JSON parsing failed: {e}")
-                # Try to clean each item individually
-                cleaned_response = '['
-                items = response_text[1:-1].split('","')
-                cleaned_items = []
-                for item in items:
-                    cleaned_item = self.sanitize_text(item)
-                    if cleaned_item:
-                        cleaned_items.append(f'"{cleaned_item}"')
-                cleaned_response += ','.join(cleaned_items) + ']'
-                logger.info(f"Cleaned response: {cleaned_response}")
-                words = json.loads(cleaned_response)
-
-            if not isinstance(words, list):
-                raise ValueError("Expected a JSON array of words")
-
-            # Final cleaning of each word
-            cleaned_words = [self.sanitize_text(word) for word in words]
-            logger.info(f"Final cleaned words: {cleaned_words}")
-
-            return cleaned_words
+            completion = self.client.chat.completions.create(**self._build_request(existing_words, gen_type, dedup))
+            return self._parse_words(completion, dedup)
+        except Exception as e:
+            raise self._generation_failed(e, completion)
 
+    async def agenerate_words(self, existing_words=None, gen_type='words', dedup=None):
+        """Async variant of generate_words using the AsyncOpenAI client"""
+        completion = None
+        try:
+            completion = await self.async_client.chat.completions.create(**self._build_request(existing_words, gen_type, dedup))
+            return self._parse_words(completion, dedup)
         except Exception as e:
-            logger.error(f"Error in generate_words: {str(e)}")
-            logger.error(f"Raw response was: {completion.choices[0].message.content if 'completion' in locals() else 'No response'}")
-            raise ValueError(f"Failed to generate content: {str(e)}") 
\ No newline at end of file
+            raise self._generation_failed(e, completion)
\ No newline at end of file
@@ -11,4 +11,5 @@ export FLASK_DEBUG=1
 export PORT=5001
 
 # Start the Flask application
+# (or serve through the async ASGI path: python src/asgi.py)
 python src/app.py 
\ No newline at end of file
@@ -0,0 +1,45 @@
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from services.odia_phrase_service import OdiaPhraseService
+
+PHRASES = ["ମୁଁ ଭଲ ଅଛି", "ତୁମେ କେମିତି ଅଛ", "ମୁଁ ଘରକୁ ଯାଉଛି"]
+
+def completion(content):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+def make_service():
+    config = {"models": {"word_generation": "test-model"}, "romanization": {"engine": "local", "llm_fallback": False}}
+    return OdiaPhraseService(client=None, config=config, model_configs={})
+
+def test_combine_results_skips_a_dropped_middle_translation():
+    service = make_service()
+    # The second element has an unquoted odia value, so the parser drops it and keeps the rest
+    content = (
+        '[{"odia": "ମୁଁ ଭଲ ଅଛି", "english": "I am fine"}, '
+        '{"odia": ତୁମେ କେମିତି ଅଛ, "english": "How are you"}, '
+        '{"odia": "ମୁଁ ଘରକୁ ଯାଉଛି", "english": "I am going home"}]'
+    )
+    translations = service._parse_translations(completion(content))
+    assert len(translations) == 2
+
+    romanized = [{"odia": phrase, "romanized": f"r{i}"} for i, phrase in enumerate(PHRASES)]
+    combined = service.combine_results(PHRASES, translations, romanized)
+
+    assert combined == [
+        {"english": "I am fine", "odia": PHRASES[0], "romanized_odia": "r0"},
+        {"english": "I am going home", "odia": PHRASES[2], "romanized_odia": "r2"},
+    ]
+
+def test_combine_results_matches_romanizations_by_odia_text():
+    service = make_service()
+    translations = [{"odia": phrase, "english": f"e{i}"} for i, phrase in enumerate(PHRASES)]
+    # Out of order and missing the first phrase
+    romanized = [{"odia": PHRASES[2], "romanized": "r2"}, {"odia": PHRASES[1] + "।", "romanized": "r1"}]
+
+    combined = service.combine_results(PHRASES, translations, romanized)
+
+    assert [(entry["english"], entry["romanized_odia"]) for entry in combined] == [("e1", "r1"), ("e2", "r2")]